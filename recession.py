@@ -10,9 +10,9 @@ from data_collectors.feature_utils import apply_savgol_filter
 print("Starting recession feature creation process...")
 
 # --- Configuration ---
-INPUT_DATA_PATH = "data/final_features_data.csv"
+INPUT_DATA_PATH = "data/final_features_data.parquet"
 INPUT_METADATA_PATH = "data/features_symbols_metadata.csv"
-OUTPUT_DATA_PATH = "data/recession_features_data.csv"
+OUTPUT_DATA_PATH = "data/recession_features_data.parquet"
 OUTPUT_METADATA_PATH = "data/recession_features_metadata.csv"
 
 # --- Helper for Savitzky-Golay ---
@@ -21,6 +21,19 @@ OUTPUT_METADATA_PATH = "data/recession_features_metadata.csv"
 # Its signature is: apply_savgol_filter(s: pl.Series, window_length: int, polyorder: int, deriv: int = 0)
 # The previous local helper was compatible.
 
+# --- Data I/O ---
+# Feature data is Parquet (typed dates, no text parsing); .csv paths are still accepted
+def scan_data(path: str) -> pl.LazyFrame:
+    if path.endswith(".csv"):
+        return pl.scan_csv(path, try_parse_dates=True)
+    return pl.scan_parquet(path)
+
+def write_data(df: pl.DataFrame, path: str) -> None:
+    if path.endswith(".csv"):
+        df.write_csv(path)
+    else:
+        df.lazy().sink_parquet(path, compression="zstd", statistics=True)
+
 def add_recession_features(
     input_data_path: str,
     input_metadata_path: str,
@@ -32,31 +45,34 @@ def add_recession_features(
     """
     try:
         # --- Load Data ---
+        # Scanned lazily so the date cast, sort and diff run as one query; the frame is
+        # collected once because the recession dates must be known to build RecInit
         print(f"Loading data from: {input_data_path}")
-        df_data = pl.read_csv(input_data_path)
-        if "date" in df_data.columns and df_data["date"].dtype == pl.Utf8:
-            df_data = df_data.with_columns(pl.col("date").str.to_datetime().cast(pl.Date))
-        elif "date" in df_data.columns and df_data["date"].dtype == pl.Datetime:
-            df_data = df_data.with_columns(pl.col("date").cast(pl.Date))
-        elif "date" not in df_data.columns:
+        lf_data = scan_data(input_data_path)
+        data_schema = lf_data.collect_schema()
+        if "date" not in data_schema:
             print("Error: 'date' column not found in input data.")
             return False
         
-        if "USREC" not in df_data.columns:
+        if "USREC" not in data_schema:
             print("Error: 'USREC' column not found. This script requires NBER recession data.")
             return False
 
-        df_data = df_data.sort("date")
+        # Parquet keeps the date type; Datetime columns are truncated to Date
+        if data_schema["date"] != pl.Date:
+            lf_data = lf_data.with_columns(pl.col("date").cast(pl.Date))
+        
+        lf_data = lf_data.sort("date")
         # Ensure USREC is integer type for diff calculation
-        if df_data["USREC"].dtype != pl.Int8 and df_data["USREC"].dtype != pl.Int16 and df_data["USREC"].dtype != pl.Int32 and df_data["USREC"].dtype != pl.Int64 :
-            df_data = df_data.with_columns(pl.col("USREC").cast(pl.Int8, strict=False))
+        if data_schema["USREC"] not in (pl.Int8, pl.Int16, pl.Int32, pl.Int64):
+            lf_data = lf_data.with_columns(pl.col("USREC").cast(pl.Int8, strict=False))
 
 
         print(f"Loading metadata from: {input_metadata_path}")
         df_symbols = pl.read_csv(input_metadata_path)
 
         # --- Identify Recession Start/End Dates ---
-        df_data = df_data.with_columns(pl.col("USREC").diff().alias("USREC_diff"))
+        df_data = lf_data.with_columns(pl.col("USREC").diff().alias("USREC_diff")).collect()
         
         dt_start_dates = df_data.filter(pl.col("USREC_diff") == 1).select("date").to_series()
         dt_end_dates = df_data.filter(pl.col("USREC_diff") == -1).select("date").to_series()
@@ -64,7 +80,7 @@ def add_recession_features(
         if dt_start_dates.is_empty():
             print("No recession start dates found (USREC_diff == 1). No recession features will be generated.")
             df_data = df_data.drop("USREC_diff" if "USREC_diff" in df_data.columns else []) # drop if exists
-            df_data.write_csv(output_data_path)
+            write_data(df_data, output_data_path)
             df_symbols.write_csv(output_metadata_path)
             print("Original data and metadata saved.")
             return True 
@@ -104,59 +120,75 @@ def add_recession_features(
             if min_overall_date is not None and not df_recession.is_empty():
                 df_recession = df_recession.filter(pl.col("start") >= min_overall_date)
 
+        # --- Build the RecInit features as one lazy query ---
+        lf_features = df_data.lazy()
+        
         # --- Initialize and Populate RecInit ---
-        df_data = df_data.with_columns(pl.lit(0).cast(pl.Int8).alias("RecInit"))
+        # One pass over the date column: OR together the (initStart, initEnd) window tests
+        init_windows = []
         if not df_recession.is_empty():
-            for row in df_recession.iter_rows(named=True):
-                init_s, init_e = row["initStart"], row["initEnd"]
-                if init_s is not None and init_e is not None: 
-                    df_data = df_data.with_columns(
-                        pl.when((pl.col("date") > init_s) & (pl.col("date") < init_e))
-                        .then(pl.lit(1).cast(pl.Int8))
-                        .otherwise(pl.col("RecInit"))
-                        .alias("RecInit")
-                    )
+            init_windows = [
+                (init_s, init_e)
+                for init_s, init_e in zip(df_recession["initStart"].to_list(), df_recession["initEnd"].to_list())
+                if init_s is not None and init_e is not None
+            ]
+        if init_windows:
+            in_init_window = pl.any_horizontal(
+                [(pl.col("date") > init_s) & (pl.col("date") < init_e) for init_s, init_e in init_windows]
+            )
+            lf_features = lf_features.with_columns(
+                pl.when(in_init_window).then(1).otherwise(0).cast(pl.Int8).alias("RecInit")
+            )
+        else:
+            lf_features = lf_features.with_columns(pl.lit(0).cast(pl.Int8).alias("RecInit"))
         
         # --- Populate RecInit_Smooth (Day counter within each RecInit window) ---
-        block_starts = (pl.col("RecInit") == 1) & (pl.col("RecInit").shift(1).fill_null(0) == 0)
-        window_id_col = block_starts.cum_sum().alias("window_id")
-        df_data = df_data.with_columns(window_id_col)
-        
-        df_data = df_data.with_columns(
+        # Rows since the last RecInit == 0 row: one forward fill, no window ids or group-by
+        row_nr = pl.int_range(pl.len(), dtype=pl.Int64)
+        last_zero_row = pl.when(pl.col("RecInit") == 0).then(row_nr).forward_fill().fill_null(-1)
+        lf_features = lf_features.with_columns(
             pl.when(pl.col("RecInit") == 1)
-            .then(pl.col("RecInit").cum_sum().over("window_id")) 
+            .then(row_nr - last_zero_row)
             .otherwise(0)
             .cast(pl.Float64) 
             .alias("RecInit_Smooth")
         )
         
-        # Clean up helper columns (ensure they exist before dropping)
-        cols_to_drop = [col for col in ["window_id", "USREC_diff"] if col in df_data.columns]
-        if cols_to_drop:
-            df_data = df_data.drop(cols_to_drop)
+        # Clean up helper columns
+        lf_features = lf_features.drop("USREC_diff")
 
 
         # --- Final Smoothing and Processing of RecInit_Smooth ---
-        rec_init_smooth_series = df_data.get_column("RecInit_Smooth") # Use get_column
-        filtered_smooth_series = apply_savgol_filter(rec_init_smooth_series, window_length=201, polyorder=3, deriv=0)
-        df_data = df_data.with_columns(filtered_smooth_series.alias("RecInit_Smooth"))
+        # The filter needs the whole column, so it runs as a (non-elementwise) batch UDF
+        lf_features = lf_features.with_columns(
+            pl.col("RecInit_Smooth").map_batches(
+                lambda s: apply_savgol_filter(s, window_length=201, polyorder=3, deriv=0),
+                return_dtype=pl.Float64
+            )
+        )
 
-        df_data = df_data.with_columns(
+        lf_features = lf_features.with_columns(
             pl.when(pl.col("RecInit_Smooth") < 0).then(0.0).otherwise(pl.col("RecInit_Smooth")).alias("RecInit_Smooth")
         )
         
-        max_smooth_val = df_data.select(pl.col("RecInit_Smooth").max()).item()
-        if max_smooth_val is not None and max_smooth_val > 0:
-            df_data = df_data.with_columns((pl.col("RecInit_Smooth") / max_smooth_val).alias("RecInit_Smooth"))
-        else: 
-            df_data = df_data.with_columns(pl.lit(0.0).cast(pl.Float64).alias("RecInit_Smooth"))
+        # Scale to 0-1 by the column max (all zeros if there is no positive value)
+        max_smooth_val = pl.col("RecInit_Smooth").max()
+        lf_features = lf_features.with_columns(
+            pl.when(max_smooth_val > 0)
+            .then(pl.col("RecInit_Smooth") / max_smooth_val)
+            .otherwise(pl.lit(0.0))
+            .cast(pl.Float64)
+            .alias("RecInit_Smooth")
+        )
 
 
         jitter_amount = 0.01
         # Generate noise Series with the same length as the DataFrame
         noise_array = (np.random.rand(len(df_data)) * 2 - 1) * jitter_amount
         noise_series = pl.Series("noise", noise_array)
-        df_data = df_data.with_columns((pl.col("RecInit_Smooth") + noise_series).alias("RecInit_Smooth"))
+        lf_features = lf_features.with_columns((pl.col("RecInit_Smooth") + pl.lit(noise_series)).alias("RecInit_Smooth"))
+
+        df_data = lf_features.collect()
 
         
         # --- Update Metadata ---
@@ -220,7 +252,7 @@ def add_recession_features(
         
         # --- Save Outputs ---
         print(f"Saving data with recession features to: {output_data_path}")
-        df_data.write_csv(output_data_path)
+        write_data(df_data, output_data_path)
         print(f"Saving updated metadata to: {output_metadata_path}")
         df_symbols.write_csv(output_metadata_path)
 
@@ -4,7 +4,7 @@ Bristol Gate Core Infrastructure
 Core classes and utilities for data fetching, database operations, and pipeline management.
 """
 
-from .base_fetcher import BaseDataFetcher
+from .base_fetcher import BaseDataFetcher, AIMDConcurrencyLimiter
 from .utils import SymbolManager, DataPipelineManager, DataValidator, SOURCE_SCHEMAS
 from .duckdb_functions import DuckDBManager, DuckDBInitializer
 from .date_utils import DateUtils
@@ -14,6 +14,7 @@ from .logging_setup import get_logger
 
 __all__ = [
     'BaseDataFetcher',
+    'AIMDConcurrencyLimiter',
     'SymbolManager',
     'DataPipelineManager', 
     'DataValidator',
@@ -9,15 +9,63 @@ Part of the src_pipeline refactoring to eliminate code duplication.
 """
 
 import pandas as pd
+import numpy as np
+import pyarrow as pa
 import os
 import logging
 import time
+import random
+import threading
+import concurrent.futures
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Dict, Any, Tuple, Callable
 from abc import ABC, abstractmethod
 from dotenv import load_dotenv
 
 
+class AIMDConcurrencyLimiter:
+    """
+    Thread-safe concurrency limiter with additive-increase/multiplicative-decrease.
+    
+    The number of requests allowed in flight grows by `increase` after every
+    successful request (optionally only when it finished within `target_latency`)
+    and is multiplied by `decrease` whenever the provider signals rate limiting.
+    """
+    
+    def __init__(self, initial_limit: float = 4, min_limit: float = 1, max_limit: float = 16,
+                 increase: float = 0.5, decrease: float = 0.5,
+                 target_latency: Optional[float] = None):
+        self.limit = float(initial_limit)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.increase = increase
+        self.decrease = decrease
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self.condition = threading.Condition()
+    
+    def acquire(self):
+        """Block until a request slot is available under the current limit."""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+    
+    def release(self, latency: Optional[float] = None):
+        """Release a slot and additively increase the limit after a successful request."""
+        with self.condition:
+            self.in_flight -= 1
+            if latency is not None and (self.target_latency is None or latency <= self.target_latency):
+                self.limit = min(self.max_limit, self.limit + self.increase)
+            self.condition.notify_all()
+    
+    def record_rate_limited(self):
+        """Multiplicatively decrease the limit after a rate-limit response."""
+        with self.condition:
+            self.limit = max(self.min_limit, self.limit * self.decrease)
+
+
 class BaseDataFetcher(ABC):
     """
     Base class for all data fetchers providing common functionality.
@@ -42,6 +90,10 @@ class BaseDataFetcher(ABC):
         self.logger = self.setup_logging(logger_name)
         self.max_retries = 3
         self.base_wait_time = 30  # seconds
+        self.max_wait_time = 300  # seconds (cap for a single backoff sleep)
+        
+        # Set by fetch_many while requests run concurrently (AIMD feedback on rate limits)
+        self.concurrency_limiter: Optional[AIMDConcurrencyLimiter] = None
         
         # Load environment variables once
         load_dotenv()
@@ -112,6 +164,58 @@ class BaseDataFetcher(ABC):
             
         return value
     
+    def get_retry_wait_time(self, exception: Exception, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying a failed request.
+        
+        Honors the server's Retry-After header when the exception carries an HTTP
+        response; otherwise uses full-jitter exponential backoff, which spreads
+        retries out instead of having every worker retry at the same instant.
+        
+        Args:
+            exception: The exception that occurred
+            attempt: Current attempt number (0-based)
+            
+        Returns:
+            Wait time in seconds
+        """
+        retry_after = self._parse_retry_after(exception)
+        if retry_after is not None:
+            return min(self.max_wait_time, retry_after)
+        
+        return random.uniform(0, min(self.max_wait_time, self.base_wait_time * (2 ** attempt)))
+    
+    @staticmethod
+    def _parse_retry_after(exception: Exception) -> Optional[float]:
+        """
+        Extract the Retry-After delay (seconds or HTTP date) from an HTTP error, if any.
+        
+        Args:
+            exception: The exception that occurred
+            
+        Returns:
+            Delay in seconds or None if not available
+        """
+        response = getattr(exception, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+        
+        value = headers.get('Retry-After')
+        if not value:
+            return None
+        
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+        
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
     def handle_api_error(self, exception: Exception, identifier: str, 
                         attempt: int, max_retries: int) -> bool:
         """
@@ -131,11 +235,13 @@ class BaseDataFetcher(ABC):
         # Check for rate limiting
         if any(indicator in error_msg.lower() for indicator in 
                ["too many requests", "429", "rate limit"]):
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.record_rate_limited()
             if attempt < max_retries - 1:
-                wait_time = self.base_wait_time * (2 ** attempt)  # Exponential backoff
+                wait_time = self.get_retry_wait_time(exception, attempt)
                 self.logger.warning(
                     f"Rate limit hit for {identifier}. "
-                    f"Waiting {wait_time} seconds... (Attempt {attempt + 1}/{max_retries})"
+                    f"Waiting {wait_time:.1f} seconds... (Attempt {attempt + 1}/{max_retries})"
                 )
                 time.sleep(wait_time)
                 return True
@@ -151,10 +257,10 @@ class BaseDataFetcher(ABC):
         
         # Server errors or other issues (retry with backoff)
         if attempt < max_retries - 1:
-            wait_time = self.base_wait_time * (2 ** attempt)
+            wait_time = self.get_retry_wait_time(exception, attempt)
             self.logger.warning(
                 f"Error fetching {identifier}: {error_msg}. "
-                f"Retrying in {wait_time} seconds... (Attempt {attempt + 1}/{max_retries})"
+                f"Retrying in {wait_time:.1f} seconds... (Attempt {attempt + 1}/{max_retries})"
             )
             time.sleep(wait_time)
             return True
@@ -162,6 +268,32 @@ class BaseDataFetcher(ABC):
             self.logger.error(f"Failed to fetch {identifier} after {max_retries} attempts: {error_msg}")
             return False
     
+    def retry_with_backoff(self, fn: Callable[[], Any], identifier: str,
+                           max_retries: Optional[int] = None,
+                           default_factory: Callable[[], Any] = pd.DataFrame) -> Any:
+        """
+        Call fn, retrying failures according to handle_api_error.
+        
+        Args:
+            fn: Zero-argument callable performing the request
+            identifier: Series ID or symbol being processed (for logging)
+            max_retries: Maximum number of attempts (defaults to self.max_retries)
+            default_factory: Builds the result returned when every attempt failed
+            
+        Returns:
+            Result of fn, or default_factory() (an empty DataFrame) if every attempt failed
+        """
+        max_retries = max_retries or self.max_retries
+        
+        for attempt in range(max_retries):
+            try:
+                return fn()
+            except Exception as e:
+                if not self.handle_api_error(e, identifier, attempt, max_retries):
+                    break
+        
+        return default_factory()
+    
     def standardize_dataframe(self, df: pd.DataFrame, expected_columns: List[str], 
                             identifier_column: str, identifier_value: str) -> pd.DataFrame:
         """
@@ -187,8 +319,8 @@ class BaseDataFetcher(ABC):
             if 'index' in df.columns:
                 df = df.rename(columns={'index': 'date'})
         
-        # Add identifier column
-        df[identifier_column] = identifier_value
+        # Add identifier column (single-category Categorical: int8 codes instead of N string refs)
+        df[identifier_column] = self.constant_categorical(identifier_value, len(df))
         
         # Ensure expected columns exist
         for col in expected_columns:
@@ -208,9 +340,252 @@ class BaseDataFetcher(ABC):
             if dropped_rows > 0:
                 self.logger.debug(f"Dropped {dropped_rows} rows with NaN values for {identifier_value}")
         
+        # Halve the memory of the value columns at the fetcher boundary
+        df = self.downcast_numeric_columns(df, float_columns=value_columns)
+        
         self.logger.info(f"Standardized {identifier_value}: {len(df)} rows")
         return df
     
+    @staticmethod
+    def downcast_numeric_columns(df: pd.DataFrame,
+                                 float_columns: Optional[List[str]] = None,
+                                 integer_columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Downcast numeric columns to the smallest dtype that holds their values.
+        
+        Float columns become float32 (when the value range allows it) and integer
+        columns the smallest fitting integer type.
+        
+        Args:
+            df: DataFrame to downcast
+            float_columns: Columns to downcast with downcast='float' (default: ['value'])
+            integer_columns: Columns to downcast with downcast='integer'
+            
+        Returns:
+            DataFrame with downcast columns
+        """
+        if df.empty:
+            return df
+        
+        if float_columns is None:
+            float_columns = ['value']
+        
+        for columns, downcast in ((float_columns, 'float'), (integer_columns or [], 'integer')):
+            for col in columns:
+                if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+                    df[col] = pd.to_numeric(df[col], downcast=downcast)
+        
+        return df
+    
+    @staticmethod
+    def constant_categorical(value: str, length: int) -> pd.Categorical:
+        """
+        Build a Categorical holding the same value on every row.
+        
+        Args:
+            value: Value to repeat (e.g. series ID or metric name)
+            length: Number of rows
+            
+        Returns:
+            Categorical backed by int8 codes and a single category
+        """
+        return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[value])
+    
+    @staticmethod
+    def concat_with_shared_categories(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate DataFrames, keeping Categorical columns Categorical.
+        
+        pd.concat falls back to object dtype when the categories differ between
+        frames (e.g. one single-category symbol column per series), so every column
+        that is Categorical in all frames is first set to the union of the categories.
+        
+        Args:
+            frames: DataFrames to combine
+            
+        Returns:
+            Combined DataFrame with a fresh RangeIndex
+        """
+        shared_columns = [
+            col for col in frames[0].columns
+            if all(col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype) for df in frames)
+        ]
+        if shared_columns and len(frames) > 1:
+            frames = [df.copy(deep=False) for df in frames]
+            for col in shared_columns:
+                categories = pd.Index(
+                    np.concatenate([df[col].cat.categories.to_numpy(dtype=object) for df in frames])
+                ).unique()
+                for df in frames:
+                    df[col] = df[col].cat.set_categories(categories)
+        
+        return pd.concat(frames, ignore_index=True)
+    
+    def fetch_many(self, series_requests: List[Tuple[str, datetime, datetime]],
+                   max_workers: int = 8, initial_concurrency: int = 4,
+                   progress_every: int = 50,
+                   fetch_fn: Optional[Callable[[str, datetime, datetime], Any]] = None) -> List[Any]:
+        """
+        Fetch many series concurrently with get_single_series (or fetch_fn).
+        
+        Requests run on a thread pool; an AIMDConcurrencyLimiter caps how many are
+        in flight, halving on rate-limit errors and growing after successes.
+        
+        Args:
+            series_requests: List of (identifier, start_date, end_date) tuples
+            max_workers: Maximum number of worker threads (upper bound on concurrency)
+            initial_concurrency: Number of requests allowed in flight at start
+            progress_every: Log progress every N completed requests
+            fetch_fn: Per-series fetch function (defaults to get_single_series)
+            
+        Returns:
+            List of non-empty results (DataFrames or RecordBatches), in request order
+        """
+        fetch_fn = fetch_fn or self.get_single_series
+        total = len(series_requests)
+        if total == 0:
+            return []
+        
+        self.concurrency_limiter = AIMDConcurrencyLimiter(
+            initial_limit=min(initial_concurrency, max_workers),
+            max_limit=max_workers
+        )
+        
+        def fetch_one(identifier: str, start_date: datetime, end_date: datetime) -> Any:
+            self.concurrency_limiter.acquire()
+            started = time.monotonic()
+            latency = None
+            try:
+                data = fetch_fn(identifier, start_date, end_date)
+                latency = time.monotonic() - started
+                return data
+            finally:
+                self.concurrency_limiter.release(latency)
+        
+        results: List[Optional[pd.DataFrame]] = [None] * total
+        failed = 0
+        
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_idx = {
+                    executor.submit(fetch_one, identifier, start_date, end_date): idx
+                    for idx, (identifier, start_date, end_date) in enumerate(series_requests)
+                }
+                
+                for completed, future in enumerate(concurrent.futures.as_completed(future_to_idx), 1):
+                    idx = future_to_idx[future]
+                    try:
+                        data = future.result()
+                        if data is not None and len(data) > 0:
+                            results[idx] = data
+                        else:
+                            failed += 1
+                    except Exception as e:
+                        self.logger.error(f"Error processing {self.source_name} series {series_requests[idx][0]}: {str(e)}")
+                        failed += 1
+                    
+                    if completed % progress_every == 0 or completed == total:
+                        self.logger.info(
+                            f"Progress: {completed}/{total} ({completed/total*100:.1f}%) - "
+                            f"Successful: {completed - failed}, Failed: {failed} - "
+                            f"Concurrency limit: {int(self.concurrency_limiter.limit)}"
+                        )
+        finally:
+            self.concurrency_limiter = None
+        
+        return [data for data in results if data is not None]
+    
+    @staticmethod
+    def build_series_record_batch(dates: Any, values: Any, identifier_column: str,
+                                  identifier_value: str) -> pa.RecordBatch:
+        """
+        Build an Arrow RecordBatch [date, identifier, value] for a single series.
+        
+        Rows with missing values are dropped; the identifier is dictionary-encoded
+        (int8 indices) and values are stored as float32.
+        
+        Args:
+            dates: Array-like of dates (datetime64 or date objects)
+            values: Array-like of numeric values
+            identifier_column: Name of identifier column (e.g., 'series_id')
+            identifier_value: Value for identifier column
+            
+        Returns:
+            RecordBatch with schema date: date32, identifier: dictionary<int8, string>, value: float32
+        """
+        values = np.asarray(pd.to_numeric(values, errors='coerce'), dtype=np.float64)
+        keep = ~np.isnan(values)
+        dates = np.asarray(pd.to_datetime(dates)).astype('datetime64[D]')[keep]
+        n_rows = int(keep.sum())
+        
+        identifier = pa.DictionaryArray.from_arrays(
+            pa.array(np.zeros(n_rows, dtype=np.int8)),
+            pa.array([identifier_value], type=pa.string())
+        )
+        
+        return pa.RecordBatch.from_arrays(
+            [pa.array(dates, type=pa.date32()), identifier, pa.array(values[keep], type=pa.float32())],
+            names=['date', identifier_column, 'value']
+        )
+    
+    def get_single_series_arrow(self, identifier: str, start_date: datetime,
+                                end_date: datetime) -> pa.RecordBatch:
+        """
+        Fetch a single series as an Arrow RecordBatch.
+        
+        The default implementation converts the get_single_series DataFrame;
+        fetchers can override it to build the batch without a DataFrame.
+        
+        Args:
+            identifier: Series identifier (symbol, series_id, etc.)
+            start_date: Start date for data
+            end_date: End date for data
+            
+        Returns:
+            RecordBatch [date, series_id, value] (empty if no data)
+        """
+        df = self.get_single_series(identifier, start_date, end_date)
+        if df is None or df.empty:
+            return self.build_series_record_batch([], [], 'series_id', identifier)
+        return self.build_series_record_batch(df['date'], df['value'], 'series_id', identifier)
+    
+    def fetch_batch_arrow(self, symbols_df: pd.DataFrame, max_workers: int = 8) -> pa.Table:
+        """
+        Fetch all symbols of this source as one Arrow Table.
+        
+        Each series is fetched concurrently as a RecordBatch and the batches are
+        stitched together with pa.Table.from_batches, which references the batch
+        buffers instead of copying them like a final pd.concat.
+        
+        Args:
+            symbols_df: DataFrame with symbol information (string.symbol, string.source,
+                        date.series.start)
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            Arrow Table [date, series_id, value]
+        """
+        source_symbols = symbols_df[symbols_df['string.source'].str.lower() == self.source_name.lower()]
+        
+        end_date = datetime.now()
+        series_requests = []
+        for series_id, start_date_str in zip(source_symbols['string.symbol'], source_symbols['date.series.start']):
+            try:
+                series_requests.append((series_id, datetime.strptime(start_date_str, '%Y-%m-%d'), end_date))
+            except Exception as e:
+                self.logger.error(f"Error processing {self.source_name} series {series_id}: {str(e)}")
+        
+        batches = self.fetch_many(series_requests, max_workers=max_workers,
+                                  fetch_fn=self.get_single_series_arrow)
+        
+        if not batches:
+            self.logger.warning(f"No {self.source_name} data collected")
+            return self.build_series_record_batch([], [], 'series_id', '').schema.empty_table()
+        
+        table = pa.Table.from_batches(batches)
+        self.logger.info(f"{self.source_name} Arrow collection: {len(batches)} series, {table.num_rows} rows")
+        return table
+    
     def log_collection_summary(self, all_data: List[pd.DataFrame], 
                              total_symbols: int) -> pd.DataFrame:
         """
@@ -231,7 +606,9 @@ class BaseDataFetcher(ABC):
         self.logger.info(f"  ❌ Failed: {failed_fetches}")
         
         if all_data:
-            combined_data = pd.concat(all_data, ignore_index=True)
+            # Per-series Categoricals are merged onto shared categories so the combined
+            # symbol/metric columns stay Categorical instead of falling back to object
+            combined_data = self.concat_with_shared_categories(all_data)
             total_rows = len(combined_data)
             date_range = ""
             
@@ -177,6 +177,22 @@ class DateUtils:
         else:
             return date(year, month + 1, 1) - timedelta(days=1)
     
+    @staticmethod
+    def to_month_end_dates(period_column: pd.Series, format: Optional[str] = None) -> pd.Series:
+        """
+        Convert a Series of month labels (e.g. '2024-03') to month-end date objects.
+        
+        Uses a vectorized MonthEnd offset instead of per-row date arithmetic.
+        
+        Args:
+            period_column: Series with month labels or dates within the month
+            format: Optional strptime format of the labels (e.g. '%Y-%m')
+            
+        Returns:
+            Series of date objects on the last day of each month
+        """
+        return (pd.to_datetime(period_column, format=format) + pd.offsets.MonthEnd(0)).dt.date
+    
     @staticmethod
     def add_business_days(start_date: date, days: int) -> date:
         """
@@ -116,7 +116,22 @@ class DuckDBInitializer:
             
             logger.info(f"Found {len(statements)} SQL statements to execute")
             
-            # Execute each statement
+            # Statements without results (DDL) are sent to DuckDB as one script; the
+            # SHOW/DESCRIBE/SELECT checks still run one by one so their results are logged
+            result_prefixes = ('SHOW', 'DESCRIBE', 'SELECT')
+            script_statements = [stmt for stmt in statements if not stmt.upper().startswith(result_prefixes)]
+            statements = [stmt for stmt in statements if stmt.upper().startswith(result_prefixes)]
+            
+            if script_statements:
+                try:
+                    self.con.execute(';\n'.join(script_statements))
+                    logger.info(f"  ✅ Executed {len(script_statements)} statements in one batch")
+                except Exception as e:
+                    # Re-run individually to report exactly which statement failed
+                    logger.warning(f"⚠️  Batched execution failed ({e}); retrying statement by statement")
+                    statements = script_statements + statements
+            
+            # Execute each remaining statement
             for i, statement in enumerate(statements, 1):
                 try:
                     logger.info(f"Executing statement {i}/{len(statements)}")
@@ -321,7 +336,10 @@ class DuckDBManager:
         self.con: Optional[duckdb.DuckDBPyConnection] = None
         
     def connect(self) -> bool:
-        """Connect to DuckDB database"""
+        """Connect to DuckDB database (reuses the open connection if there is one)"""
+        if self.con is not None:
+            return True
+        
         try:
             self.con = duckdb.connect(database=str(self.db_path), read_only=False)
             return True
@@ -404,6 +422,7 @@ class DuckDBManager:
         """Close DuckDB connection"""
         if self.con:
             self.con.close()
+            self.con = None
 
 
 def main():
@@ -2,9 +2,11 @@
 Utility functions for the data collection pipeline.
 """
 
+import os
 import pandas as pd
 import logging
 from datetime import datetime, date
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 from .duckdb_functions import DuckDBManager
@@ -107,8 +109,10 @@ class SymbolManager:
 class IncrementalDataManager:
     """Manages incremental data loading logic at the symbol level"""
     
-    def __init__(self, db_path: str = 'bristol_gate.duckdb'):
-        self.db_manager = DuckDBManager(db_path)
+    def __init__(self, db_path: str = 'bristol_gate.duckdb', db_manager: Optional[DuckDBManager] = None):
+        # A caller-provided manager is left open so its connection can be reused afterwards
+        self.owns_connection = db_manager is None
+        self.db_manager = db_manager or DuckDBManager(db_path)
     
     def get_latest_dates_by_symbol(self, table_name: str, source_name: str) -> pd.DataFrame:
         """
@@ -169,7 +173,8 @@ class IncrementalDataManager:
             logger.error(f"Error getting latest dates for {source_name}: {e}")
             return pd.DataFrame()
         finally:
-            self.db_manager.close()
+            if self.owns_connection:
+                self.db_manager.close()
     
     def filter_incremental_data(self, df: pd.DataFrame, source_name: str, latest_dates_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -367,7 +372,8 @@ class DataPipelineManager:
     def __init__(self, db_path: str = 'bristol_gate.duckdb'):
         self.db_manager = DuckDBManager(db_path)
         self.symbol_manager = SymbolManager(db_path)
-        self.incremental_manager = IncrementalDataManager(db_path)
+        # Shares db_manager so the latest-date lookup and the upload use one connection
+        self.incremental_manager = IncrementalDataManager(db_path, db_manager=self.db_manager)
         self.validator = DataValidator()
         self.bronze_manager = BronzeLayerManager()
         
@@ -425,6 +431,24 @@ class DataPipelineManager:
             self.db_manager.close()
 
 # Legacy functions for backward compatibility
+@lru_cache(maxsize=4)
+def _read_symbols_csv(file_path: str, mtime: float) -> pd.DataFrame:
+    """
+    Parse the symbols CSV with the multithreaded pyarrow reader (Arrow-backed dtypes).
+    
+    Cached per (path, modification time) so repeated loads of an unchanged file skip parsing.
+    Date columns (date.*) are kept as strings, as fetchers parse them with strptime.
+    """
+    header = pd.read_csv(file_path, nrows=0).columns
+    string_dtypes = {col: 'string[pyarrow]' for col in header if col.startswith('date.')}
+    
+    try:
+        return pd.read_csv(file_path, engine='pyarrow', dtype_backend='pyarrow', dtype=string_dtypes)
+    except (ImportError, TypeError, ValueError) as e:
+        logger.debug(f"pyarrow CSV engine unavailable ({e}), falling back to the C engine")
+        return pd.read_csv(file_path)
+
+
 def load_symbols_csv(file_path: str) -> pd.DataFrame:
     """
     Legacy function - Loads the symbols CSV file into a pandas DataFrame.
@@ -433,9 +457,10 @@ def load_symbols_csv(file_path: str) -> pd.DataFrame:
     logger.warning("Using legacy CSV loading. Consider switching to database-based symbol loading.")
     logger.info(f"Loading symbols from {file_path}")
     try:
-        df = pd.read_csv(file_path)
+        # Copy so callers cannot mutate the cached frame
+        df = _read_symbols_csv(str(file_path), os.path.getmtime(file_path)).copy()
         logger.info(f"Successfully loaded {len(df)} symbols")
         return df
     except Exception as e:
         logger.error(f"Error loading symbols CSV: {str(e)}")
-        raise 
\ No newline at end of file
+        raise 
@@ -8,7 +8,9 @@ from .feature_utils import (
     apply_savgol_filter,
     load_and_prepare_data,
     load_metadata,
+    build_symbol_metadata_index,
     get_symbol_metadata_details,
+    downcast_feature_columns,
     combine_and_save_metadata,
     save_featured_data
 )
@@ -18,7 +20,9 @@ __all__ = [
     'apply_savgol_filter',
     'load_and_prepare_data',
     'load_metadata',
+    'build_symbol_metadata_index',
     'get_symbol_metadata_details',
+    'downcast_feature_columns',
     'combine_and_save_metadata',
     'save_featured_data',
     'DuckDBInterpolator'
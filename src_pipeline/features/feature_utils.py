@@ -1,10 +1,57 @@
 import polars as pl
 import numpy as np
-from scipy.signal import savgol_filter
+from functools import lru_cache
+from numpy.polynomial import legendre
+from scipy.signal import savgol_coeffs, oaconvolve
 import sys
-from typing import Tuple, Any, List, Dict
+from typing import Tuple, Any, List, Dict, Union
 
 # --- Helper function for Savitzky-Golay filter ---
+# Kernels at least this long are applied with FFT overlap-add convolution instead of the
+# direct O(N*K) sum (direct stays faster for the short 21/201-tap windows)
+SAVGOL_OACONVOLVE_MIN_WINDOW = 301
+
+@lru_cache(maxsize=None)
+def _savgol_kernels(window_length: int, polyorder: int, deriv: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Savitzky-Golay weights for a (window_length, polyorder, deriv) triple, computed once.
+    The filter is a fixed FIR kernel for interior points; the edges (mode='interp') are
+    the polynomial fitted to the first/last window evaluated at each edge position,
+    which is also a fixed set of weights per position.
+    Returns (convolution kernel, left edge weights, right edge weights).
+    """
+    half = window_length // 2
+    kernel = savgol_coeffs(window_length, polyorder, deriv)
+    if half == 0:
+        empty = np.empty((0, window_length))
+        return kernel, empty, empty
+    # Fit on a Legendre basis over positions scaled to [-1, 1]: off-centre savgol_coeffs
+    # fits raw offsets (up to +/-500 for the 501 window), which loses ~8 digits at the edges
+    t = (np.arange(window_length) - half) / half
+    basis = np.eye(polyorder + 1)
+    deriv_basis = np.stack([legendre.legval(t, legendre.legder(basis[k], m=deriv))
+                            for k in range(polyorder + 1)], axis=1) / half ** deriv
+    weights = deriv_basis @ np.linalg.pinv(legendre.legvander(t, polyorder))
+    return kernel, weights[:half], weights[window_length - half:]
+
+def _savgol_apply(x: np.ndarray, window_length: int, polyorder: int, deriv: int) -> np.ndarray:
+    """Equivalent of scipy.signal.savgol_filter(x, ..., mode='interp') using cached weights."""
+    kernel, left, right = _savgol_kernels(window_length, polyorder, deriv)
+    n, half = len(x), window_length // 2
+    # Like the edge polyfit in savgol_filter, refuse NaN/inf in the edge windows
+    if half and not (np.isfinite(x[:window_length]).all() and np.isfinite(x[n - window_length:]).all()):
+        raise ValueError("array must not contain infs or NaNs")
+    out = np.empty(n, dtype=np.float64)
+    # FFT convolution would smear an interior NaN over a whole block, so it needs finite data
+    if window_length >= SAVGOL_OACONVOLVE_MIN_WINDOW and n >= 8 * window_length and np.isfinite(x).all():
+        out[half:n - half] = oaconvolve(x, kernel, mode='valid')
+    else:
+        out[half:n - half] = np.convolve(x, kernel, mode='valid')
+    if half:
+        out[:half] = left @ x[:window_length]
+        out[n - half:] = right @ x[n - window_length:]
+    return out
+
 # (Based on the version in features.py/features_parallel.py, renamed for generic use)
 def apply_savgol_filter(
     s: pl.Series, 
@@ -23,14 +70,14 @@ def apply_savgol_filter(
     original_dtype = s.dtype
 
     if s.is_empty() or s.is_null().all(): # If empty or all nulls, return as is
-        return s.cast(original_dtype, strict=False) if s.is_empty() else pl.Series(series_name, [None] * len(s), dtype=original_dtype, strict=False)
+        return s.cast(original_dtype, strict=False) if s.is_empty() else s.clear(n=len(s))
 
     # Interpolate, then fill ends.
     s_processed = s.interpolate().fill_null(strategy="backward").fill_null(strategy="forward")
     
     # If still all nulls (e.g., was all nulls and interpolation didn't change that)
     if s_processed.is_null().all():
-        return pl.Series(series_name, [None] * len(s), dtype=original_dtype, strict=False)
+        return s.clear(n=len(s))
 
     # Convert to NumPy array. Cast to float64 for savgol_filter if not already float.
     if not s_processed.dtype.is_float():
@@ -50,7 +97,7 @@ def apply_savgol_filter(
     # Ensure window_length is not greater than the number of non-NaN data points
     num_valid_points = np.count_nonzero(~np.isnan(s_np))
     if num_valid_points == 0 : # All NaN after processing (should not happen if initial check passed and fill_null worked)
-         return pl.Series(series_name, [None] * len(s), dtype=original_dtype, strict=False)
+         return s.clear(n=len(s))
 
     if effective_window_length > num_valid_points:
         print(f"  Warning: SavGol window_length ({effective_window_length}) for series '{series_name}' > number of valid data points ({num_valid_points}). Adjusting window_length.")
@@ -61,15 +108,14 @@ def apply_savgol_filter(
          return s_processed.cast(original_dtype, strict=False) # Return the prepped series
 
     try:
-        # savgol_filter requires non-NaN data for calculation where it operates
-        # The mode='interp' handles boundaries, but internal NaNs can be problematic.
+        # The filter requires non-NaN data for calculation where it operates
+        # The mode='interp' edge handling is built into the cached weights.
         # We've filled NaNs in s_np, so it should be clean.
-        filtered_array = savgol_filter(
+        filtered_array = _savgol_apply(
             s_np, # s_np should be free of NaNs at this point
             window_length=effective_window_length,
             polyorder=polyorder,
-            deriv=deriv,
-            mode='interp' 
+            deriv=deriv
         )
         # Cast back to original dtype if possible, otherwise keep as float
         try:
@@ -146,17 +192,33 @@ def load_metadata(metadata_path: str) -> pl.DataFrame:
         print(f"Error loading metadata from {metadata_path}: {e}. Exiting.")
         sys.exit(1)
 
-# --- Metadata Helper Function ---
+# --- Metadata Helper Functions ---
+def build_symbol_metadata_index(df_symbols_meta: pl.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """
+    Builds a symbol -> metadata row mapping in a single pass over the metadata.
+    The first row for a symbol wins, matching a filter(...).row(0) lookup.
+    """
+    meta_index: Dict[str, Dict[str, Any]] = {}
+    if "symbol" not in df_symbols_meta.columns:
+        return meta_index
+    for row in df_symbols_meta.iter_rows(named=True):
+        meta_index.setdefault(row["symbol"], row)
+    return meta_index
+
 def get_symbol_metadata_details(
     symbol_original: str, 
-    df_symbols_meta: pl.DataFrame, 
+    df_symbols_meta: Union[pl.DataFrame, Dict[str, Dict[str, Any]]], 
     default_start_date: Any, 
     default_end_date: Any   
 ) -> Tuple[str, str, str, str, str]:
     """
     Retrieves metadata details for a given symbol.
+    df_symbols_meta may be the metadata DataFrame or a prebuilt index from
+    build_symbol_metadata_index (preferred when looking up many symbols).
     Returns: (description, label_y, series_start_date_str, series_end_date_str, symbol_root_for_meta)
     """
+    meta_index = df_symbols_meta if isinstance(df_symbols_meta, dict) else build_symbol_metadata_index(df_symbols_meta)
+
     description_r = ""
     label_y_r = "Value" 
     series_start_date_r = default_start_date
@@ -170,29 +232,25 @@ def get_symbol_metadata_details(
     
     yahoo_suffixes = ["open", "high", "low", "close", "adj_close", "volume"] 
 
-    meta_row_root = None
-    direct_match_meta = df_symbols_meta.filter(pl.col("symbol") == symbol_original)
+    meta_row_root = meta_index.get(symbol_original)
 
-    if not direct_match_meta.is_empty():
-        meta_row_root = direct_match_meta
-    elif potential_suffix in yahoo_suffixes:
-        root_match_meta = df_symbols_meta.filter(pl.col("symbol") == potential_root)
-        if not root_match_meta.is_empty():
-            meta_row_root = root_match_meta
+    if meta_row_root is None and potential_suffix in yahoo_suffixes:
+        meta_row_root = meta_index.get(potential_root)
+        if meta_row_root is not None:
             symbol_root_for_meta = potential_root
             suffix_for_desc = f" ({parts[1]})" 
     
-    if meta_row_root is not None and not meta_row_root.is_empty():
+    if meta_row_root is not None:
         try:
-            desc_val = meta_row_root.select("description").row(0)[0]
+            desc_val = meta_row_root.get("description")
             description_r = (desc_val if desc_val is not None else "") + suffix_for_desc
             
             # Fix: Use 'unit' column instead of 'label_y' to match DuckDB schema
             unit_columns = ["unit", "label_y"]  # Try both for compatibility
             label_val = None
             for col in unit_columns:
-                if col in meta_row_root.columns:
-                    label_val = meta_row_root.select(col).row(0)[0]
+                if col in meta_row_root:
+                    label_val = meta_row_root[col]
                     break
             label_y_r = label_val if label_val is not None else "Value"
 
@@ -201,13 +259,13 @@ def get_symbol_metadata_details(
             end_date_columns = ["series_end", "end_date"]
             
             for col in start_date_columns:
-                if col in meta_row_root.columns and meta_row_root.select(col).row(0)[0] is not None:
-                    series_start_date_r = meta_row_root.select(col).row(0)[0]
+                if meta_row_root.get(col) is not None:
+                    series_start_date_r = meta_row_root[col]
                     break
                     
             for col in end_date_columns:
-                if col in meta_row_root.columns and meta_row_root.select(col).row(0)[0] is not None:
-                    series_end_date_r = meta_row_root.select(col).row(0)[0]
+                if meta_row_root.get(col) is not None:
+                    series_end_date_r = meta_row_root[col]
                     break
                     
         except Exception as e:
@@ -222,6 +280,20 @@ def get_symbol_metadata_details(
     
     return description_r, label_y_r, start_date_str, end_date_str, symbol_root_for_meta
 
+# --- Dtype Helpers ---
+def downcast_feature_columns(df: pl.DataFrame, feature_names: List[str]) -> pl.DataFrame:
+    """
+    Casts the given float feature columns to Float32.
+    Non-float features (e.g. Int8 signals) and all other columns are left untouched.
+    """
+    float_features = [
+        name for name in feature_names
+        if name in df.columns and df.schema[name].is_float() and df.schema[name] != pl.Float32
+    ]
+    if not float_features:
+        return df
+    return df.with_columns(pl.col(float_features).cast(pl.Float32))
+
 # --- Saving Functions ---
 def combine_and_save_metadata(
     df_original_meta: pl.DataFrame, 
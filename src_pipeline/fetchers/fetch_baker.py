@@ -11,7 +11,6 @@ import pandas as pd
 import os
 from datetime import datetime
 import time
-from selenium.webdriver.common.by import By
 from typing import Optional
 
 from ..core.base_fetcher import BaseDataFetcher
@@ -19,6 +18,7 @@ from ..utils.web_scraping_utils import WebScrapingUtils
 from ..utils.file_download_utils import FileDownloadUtils
 from ..utils.excel_processing_utils import ExcelProcessingUtils
 from ..utils.transform_utils import DataTransformUtils
+from ..utils.cache_utils import ParquetCacheUtils
 
 
 class BakerHughesFetcher(BaseDataFetcher):
@@ -29,12 +29,13 @@ class BakerHughesFetcher(BaseDataFetcher):
     utilities to fetch and standardize Baker Hughes rig count data.
     """
     
-    def __init__(self, download_dir: str = "data/baker_hughes"):
+    def __init__(self, download_dir: str = "data/baker_hughes", driver=None):
         """
         Initialize Baker Hughes fetcher.
         
         Args:
             download_dir: Directory for downloaded files
+            driver: Optional Selenium WebDriver to reuse (defaults to the shared driver)
         """
         super().__init__("baker_hughes")
         
@@ -43,8 +44,10 @@ class BakerHughesFetcher(BaseDataFetcher):
         self.file_downloader = FileDownloadUtils(download_dir)
         self.excel_processor = ExcelProcessingUtils()
         self.data_transformer = DataTransformUtils()
+        self.cache = ParquetCacheUtils()
         
         self.download_dir = download_dir
+        self.driver = driver
         
         # Baker Hughes specific configuration
         self.default_url = "https://bakerhughesrigcount.gcs-web.com/na-rig-count"
@@ -80,9 +83,21 @@ class BakerHughesFetcher(BaseDataFetcher):
         """
         Fetch Baker Hughes rig count data.
         
+        The standardized result is cached as Parquet for the current day, so
+        repeated runs skip the download and Excel parse.
+        
         Args:
             symbols_df: Not used for Baker Hughes (optional for compatibility)
             
+        Returns:
+            DataFrame with standardized Baker Hughes data
+        """
+        return self.cache.get_or_build(self.default_url, self._download_and_process)
+    
+    def _download_and_process(self) -> pd.DataFrame:
+        """
+        Download, parse and standardize the Baker Hughes file (uncached).
+        
         Returns:
             DataFrame with standardized Baker Hughes data
         """
@@ -133,52 +148,47 @@ class BakerHughesFetcher(BaseDataFetcher):
         Returns:
             Path to downloaded file or None if failed
         """
-        driver = None
         try:
-            # Setup web driver using utility class
-            driver = self.web_scraper.setup_chrome_driver(
+            # Reuse the caller's driver or lease the shared one (Chrome starts once per run)
+            with self.web_scraper.lease_driver(
                 download_dir=self.download_dir,
+                driver=self.driver,
                 headless=True
-            )
-            
-            # Navigate to Baker Hughes page
-            self.logger.info(f"Navigating to Baker Hughes page: {self.default_url}")
-            driver.get(self.default_url)
-            
-            # Use utility method to wait and check access
-            if not self.web_scraper.wait_for_page_load(driver, timeout=10):
-                self.logger.error("Page failed to load properly")
-                return None
-            
-            # Check for access denied
-            if "Access Denied" in driver.page_source or "Forbidden" in driver.page_source:
-                self.logger.error("Access denied to Baker Hughes website")
-                return None
-            
-            # Find and click download link
-            target_link = self._find_download_link(driver)
-            if not target_link:
-                self.logger.error("Could not find download link")
-                return None
-            
-            self.logger.info("Clicking download link...")
-            target_link.click()
-            
-            # Wait for download completion using utility method
-            downloaded_file = self.file_downloader.wait_for_download_completion(
-                timeout=30,
-                file_extension='.xlsb'
-            )
-            
-            return downloaded_file
+            ) as driver:
+                # Navigate to Baker Hughes page
+                self.logger.info(f"Navigating to Baker Hughes page: {self.default_url}")
+                driver.get(self.default_url)
+                
+                # Use utility method to wait and check access
+                if not self.web_scraper.wait_for_page_load(driver, timeout=10):
+                    self.logger.error("Page failed to load properly")
+                    return None
+                
+                # Check for access denied
+                if "Access Denied" in driver.page_source or "Forbidden" in driver.page_source:
+                    self.logger.error("Access denied to Baker Hughes website")
+                    return None
+                
+                # Find and click download link
+                target_link = self._find_download_link(driver)
+                if not target_link:
+                    self.logger.error("Could not find download link")
+                    return None
+                
+                self.logger.info("Clicking download link...")
+                target_link.click()
+                
+                # Wait for download completion using utility method
+                downloaded_file = self.file_downloader.wait_for_download_completion(
+                    timeout=30,
+                    file_extension='.xlsb'
+                )
+                
+                return downloaded_file
             
         except Exception as e:
             self.logger.error(f"Error downloading Baker Hughes file: {str(e)}")
             return None
-            
-        finally:
-            if driver:
-                driver.quit()
     
     def _find_download_link(self, driver):
         """
@@ -192,19 +202,14 @@ class BakerHughesFetcher(BaseDataFetcher):
         """
         try:
             self.logger.info("Searching for rig count spreadsheet link...")
-            all_links = driver.find_elements(By.TAG_NAME, "a")
+            link = self.web_scraper.find_link_element_by_text(driver, self.file_name_pattern)
             
-            for link in all_links:
-                try:
-                    link_text = link.text.strip()
-                    if self.file_name_pattern in link_text:
-                        self.logger.info(f"Found target link: {link_text}")
-                        return link
-                except:
-                    continue
+            if link is None:
+                self.logger.error(f"No link found containing '{self.file_name_pattern}'")
+                return None
             
-            self.logger.error(f"No link found containing '{self.file_name_pattern}'")
-            return None
+            self.logger.info(f"Found target link: {link.text.strip()}")
+            return link
             
         except Exception as e:
             self.logger.error(f"Error finding download link: {str(e)}")
@@ -263,26 +268,24 @@ class BakerHughesFetcher(BaseDataFetcher):
             if 'date' in df.columns:
                 df = self.excel_processor.convert_excel_dates(df, date_columns=['date'])
             
-            # Add BKR_ prefix to all columns except date
-            df.columns = ['date' if col == 'date' else f'BKR_{col}' for col in df.columns]
-            
-            # Remove percentage columns using utility method
-            df = self.data_transformer.remove_percentage_columns(df)
+            # Value columns: everything except date and percentage columns (single pass)
+            value_columns = [col for col in df.columns if col != 'date' and '%' not in str(col)]
             
             # Transform wide to long format using utility method
-            value_columns = [col for col in df.columns if col.startswith('BKR_')]
-            
-            result_df = self.data_transformer.melt_to_long_format(
+            # Values are coerced to numeric (any stray Excel-date conversions become NaN) and
+            # NaN rows are dropped while stacking
+            result_df = self.data_transformer.wide_to_long_fast(
                 df=df,
-                id_vars=['date'],
+                id_col='date',
                 value_vars=value_columns,
                 var_name='metric',
                 value_name='value'
             )
             
-            # Add symbol column (using metric name)
-            result_df['symbol'] = result_df['metric']
-            result_df['metric'] = 'rig_count'
+            # Add symbol column with BKR_ prefix by renaming the categories (one string per
+            # column instead of renaming the wide frame); both columns stay categorical
+            result_df['symbol'] = result_df['metric'].cat.rename_categories(lambda col: f'BKR_{col}')
+            result_df['metric'] = self.constant_categorical('rig_count', len(result_df))
             
             # Standardize column order using utility method
             result_df = self.data_transformer.standardize_column_order(
@@ -290,17 +293,16 @@ class BakerHughesFetcher(BaseDataFetcher):
                 expected_order=['date', 'symbol', 'metric', 'value']
             )
             
-            # Ensure value column is numeric (convert any remaining date objects back to numbers)
-            if 'value' in result_df.columns:
-                # Convert back to numeric in case any Excel dates were mistakenly applied
-                result_df['value'] = pd.to_numeric(result_df['value'], errors='coerce')
-            
-            # Clean data using utility method
+            # Validate columns (NaN values were already masked out while stacking)
             result_df = self.data_transformer.clean_and_validate_data(
                 result_df,
-                required_columns=['date', 'symbol', 'value']
+                required_columns=['date', 'symbol', 'value'],
+                drop_na_columns=[]
             )
             
+            # Downcast values to float32
+            result_df = self.downcast_numeric_columns(result_df)
+            
             self.logger.info(f"Data transformation completed. Final rows: {len(result_df)}")
             return result_df
             
@@ -314,13 +316,14 @@ def get_baker_data(baker_url: str = "https://bakerhughesrigcount.gcs-web.com/na-
                    file_name: str = "North America Rotary Rig Count (",
                    sheet_name: str = "US Oil & Gas Split",
                    skip_rows: int = 6,
-                   download_dir: str = "data/baker_hughes") -> pd.DataFrame:
+                   download_dir: str = "data/baker_hughes",
+                   driver=None) -> pd.DataFrame:
     """
     Legacy wrapper for backward compatibility.
     
     DEPRECATED: Use BakerHughesFetcher.fetch_batch() instead.
     """
-    fetcher = BakerHughesFetcher(download_dir)
+    fetcher = BakerHughesFetcher(download_dir, driver=driver)
     return fetcher.fetch_batch()
 
 
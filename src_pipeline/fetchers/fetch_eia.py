@@ -7,6 +7,7 @@ using the new BaseDataFetcher infrastructure to eliminate code duplication.
 
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 from myeia import API
 
@@ -17,6 +18,12 @@ from ..core.logging_setup import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _eia_client() -> API:
+    """Return the process-wide EIA API client (reads EIA_TOKEN once)."""
+    return API()
+
+
 class EIAFetcher(BaseDataFetcher):
     """
     EIA data fetcher using the BaseDataFetcher infrastructure.
@@ -32,8 +39,8 @@ class EIAFetcher(BaseDataFetcher):
         # Load and validate EIA API token
         self.api_token = self.load_environment_variable("EIA_TOKEN", required=True)
         
-        # Initialize EIA API instance
-        self.api = API()
+        # Reuse the shared EIA API instance
+        self.api = _eia_client()
     
     def get_single_series(self, series_id: str, start_date: datetime, 
                          end_date: datetime) -> pd.DataFrame:
@@ -51,44 +58,33 @@ class EIAFetcher(BaseDataFetcher):
         # Use base class date formatting
         start_str, end_str = self.format_date_range(start_date, end_date)
         
-        # Retry logic handled by base class
-        for attempt in range(self.max_retries):
-            try:
-                # Make API call
-                df = self.api.get_series(
-                    series_id=series_id,
-                    start_date=start_str,
-                    end_date=end_str
-                )
-                
-                if df is None or df.empty:
-                    self.logger.warning(f"No data returned for EIA series {series_id}")
-                    return pd.DataFrame()
-                
-                # EIA-specific column processing (BEFORE standardize_dataframe)
-                df = self._process_eia_columns(df, series_id)
-                
-                # Use base class DataFrame standardization
-                df = self.standardize_dataframe(
-                    df=df,
-                    expected_columns=['date', 'series_id', 'value'],
-                    identifier_column='series_id',
-                    identifier_value=series_id
-                )
-                
-                return df
-                
-            except Exception as e:
-                # Use base class error handling
-                should_retry = self.handle_api_error(e, series_id, attempt, self.max_retries)
-                if not should_retry:
-                    return pd.DataFrame()
-        
-        # All retries failed
-        self.logger.error(f"Failed to fetch EIA data for {series_id} after {self.max_retries} attempts")
-        return pd.DataFrame()
+        def fetch() -> pd.DataFrame:
+            # Make API call
+            df = self.api.get_series(
+                series_id=series_id,
+                start_date=start_str,
+                end_date=end_str
+            )
+            
+            if df is None or df.empty:
+                self.logger.warning(f"No data returned for EIA series {series_id}")
+                return pd.DataFrame()
+            
+            # EIA-specific column processing (BEFORE standardize_dataframe)
+            df = self._process_eia_columns(df, series_id)
+            
+            # Use base class DataFrame standardization
+            return self.standardize_dataframe(
+                df=df,
+                expected_columns=['date', 'series_id', 'value'],
+                identifier_column='series_id',
+                identifier_value=series_id
+            )
+        
+        # Retry logic handled by base class (Retry-After aware, full-jitter backoff)
+        return self.retry_with_backoff(fetch, series_id)
     
-    def fetch_batch(self, symbols_df: pd.DataFrame) -> pd.DataFrame:
+    def fetch_batch(self, symbols_df: pd.DataFrame, max_workers: int = 4) -> pd.DataFrame:
         """
         Fetch EIA data for multiple symbols.
         
@@ -97,6 +93,7 @@ class EIAFetcher(BaseDataFetcher):
                        - string.symbol: EIA series ID
                        - string.source: Data source name  
                        - date.series.start: Start date for data
+            max_workers: Maximum number of concurrent requests
             
         Returns:
             Combined DataFrame with all EIA data
@@ -110,24 +107,18 @@ class EIAFetcher(BaseDataFetcher):
             self.logger.warning("No EIA symbols found")
             return pd.DataFrame()
         
-        # Process each symbol
-        all_data = []
         end_date = datetime.now()
+        series_requests = []
         
-        for idx, row in eia_symbols.iterrows():
-            series_id = row['string.symbol']
-            start_date_str = row['date.series.start']
-            
+        for series_id, start_date_str in zip(eia_symbols['string.symbol'], eia_symbols['date.series.start']):
             try:
                 start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-                data = self.get_single_series(series_id, start_date, end_date)
-                
-                if not data.empty:
-                    all_data.append(data)
-                    
+                series_requests.append((series_id, start_date, end_date))
             except Exception as e:
                 self.logger.error(f"Error processing EIA series {series_id}: {str(e)}")
-                continue
+        
+        # Fetch concurrently (I/O bound); concurrency backs off on rate limits
+        all_data = self.fetch_many(series_requests, max_workers=max_workers)
         
         # Use base class collection summary
         return self.log_collection_summary(all_data, len(eia_symbols))
@@ -9,18 +9,20 @@ Refactored to use BaseDataFetcher and utility classes to eliminate code duplicat
 
 import pandas as pd
 import os
+import json
+import time
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
 from typing import Optional
-import requests
-from urllib.parse import urlparse
-from selenium.webdriver.common.by import By
+import lxml.html
+from urllib.parse import urlparse, urljoin
 
 from ..core.base_fetcher import BaseDataFetcher
+from ..core.date_utils import DateUtils
 from ..utils.web_scraping_utils import WebScrapingUtils
 from ..utils.file_download_utils import FileDownloadUtils
 from ..utils.excel_processing_utils import ExcelProcessingUtils
 from ..utils.transform_utils import DataTransformUtils
+from ..utils.cache_utils import ParquetCacheUtils
 
 
 class FINRAFetcher(BaseDataFetcher):
@@ -31,12 +33,15 @@ class FINRAFetcher(BaseDataFetcher):
     utilities to fetch and standardize FINRA margin statistics data.
     """
     
-    def __init__(self, download_dir: str = "data/finra"):
+    def __init__(self, download_dir: str = "data/finra", driver=None, persist_downloads: bool = True):
         """
         Initialize FINRA fetcher.
         
         Args:
             download_dir: Directory for downloaded files
+            driver: Optional Selenium WebDriver to reuse (defaults to the shared driver)
+            persist_downloads: Save the workbook to download_dir (enables conditional
+                re-downloads); if False it is parsed from memory
         """
         super().__init__("finra")
         
@@ -45,12 +50,18 @@ class FINRAFetcher(BaseDataFetcher):
         self.file_downloader = FileDownloadUtils(download_dir)
         self.excel_processor = ExcelProcessingUtils()
         self.data_transformer = DataTransformUtils()
+        self.cache = ParquetCacheUtils()
         
         self.download_dir = download_dir
+        self.driver = driver
+        self.persist_downloads = persist_downloads
         
         # FINRA specific configuration
         self.default_url = "https://www.finra.org/rules-guidance/key-topics/margin-accounts/margin-statistics"
         self.download_link_text = "DOWNLOAD THE DATA"
+        self.url_cache_path = os.path.join(download_dir, ".url_cache.json")
+        self.url_cache_max_age = 24 * 60 * 60  # seconds
+        self.value_columns = ["FINRA_Margin_Debt", "FINRA_Free_Credit_Cash", "FINRA_Free_Credit_Margin"]
         
         self.logger.info("FINRA fetcher initialized")
     
@@ -80,9 +91,21 @@ class FINRAFetcher(BaseDataFetcher):
         """
         Fetch FINRA margin statistics data.
         
+        The standardized result is cached as Parquet for the current day, so
+        repeated runs skip the download and Excel parse.
+        
         Args:
             symbols_df: Not used for FINRA (optional for compatibility)
             
+        Returns:
+            DataFrame with standardized FINRA data
+        """
+        return self.cache.get_or_build(self.default_url, self._download_and_process)
+    
+    def _download_and_process(self) -> pd.DataFrame:
+        """
+        Download, parse and standardize the FINRA file (uncached).
+        
         Returns:
             DataFrame with standardized FINRA data
         """
@@ -105,6 +128,8 @@ class FINRAFetcher(BaseDataFetcher):
                 downloaded_file = self._download_finra_file(download_url)
                 
                 if not downloaded_file:
+                    # The cached href may be stale; rediscover it on the next attempt
+                    self._clear_cached_download_url()
                     if attempt < self.max_retries - 1:
                         self.logger.warning(f"Download failed, retrying... (Attempt {attempt + 1}/{self.max_retries})")
                         continue
@@ -138,118 +163,173 @@ class FINRAFetcher(BaseDataFetcher):
     
     def _find_download_url(self) -> Optional[str]:
         """
-        Find the FINRA download URL using web scraping.
+        Find the FINRA download URL.
+        
+        Reuses the href cached on disk when it is less than a day old; otherwise the
+        margin statistics page is fetched with a plain HTTP request and parsed with lxml.
+        Selenium is only used as a fallback when that request is blocked.
+        
+        Returns:
+            Download URL or None if not found
+        """
+        download_url = self._load_cached_download_url()
+        if download_url:
+            self.logger.info(f"Using cached FINRA download URL: {download_url}")
+            return download_url
+        
+        download_url = self._find_download_url_http()
+        if not download_url:
+            self.logger.info("Falling back to browser to find FINRA download URL")
+            download_url = self._find_download_url_selenium()
+        
+        if download_url:
+            self._save_cached_download_url(download_url)
+        
+        return download_url
+    
+    def _find_download_url_http(self) -> Optional[str]:
+        """
+        Find the FINRA download URL by parsing the page HTML without a browser.
         
         Returns:
             Download URL or None if not found
         """
-        driver = None
         try:
-            # Setup web driver using utility class
-            driver = self.web_scraper.setup_chrome_driver(
-                download_dir=self.download_dir,
-                headless=True
+            self.logger.info(f"Fetching FINRA page: {self.default_url}")
+            response = self.file_downloader.get_session().get(self.default_url, timeout=30)
+            response.raise_for_status()
+            
+            tree = lxml.html.fromstring(response.content)
+            hrefs = tree.xpath(
+                "//a[contains(translate(normalize-space(.), 'abcdefghijklmnopqrstuvwxyz', "
+                f"'ABCDEFGHIJKLMNOPQRSTUVWXYZ'), '{self.download_link_text}')]/@href"
             )
             
-            # Navigate to FINRA page
-            self.logger.info(f"Navigating to FINRA page: {self.default_url}")
-            driver.get(self.default_url)
+            if not hrefs:
+                self.logger.warning(f"No link found containing '{self.download_link_text}' in page HTML")
+                return None
+            
+            download_url = urljoin(self.default_url, hrefs[0])
+            self.logger.info(f"Found download link: {download_url}")
+            return download_url
             
-            # Use utility method to wait and check access
-            if not self.web_scraper.wait_for_page_load(driver, timeout=10):
-                self.logger.error("Page failed to load properly")
+        except Exception as e:
+            self.logger.warning(f"Could not find FINRA download URL via HTTP: {str(e)}")
+            return None
+    
+    def _load_cached_download_url(self) -> Optional[str]:
+        """
+        Load the cached download URL if it is fresh enough.
+        
+        Returns:
+            Cached download URL or None if missing or stale
+        """
+        try:
+            if not os.path.exists(self.url_cache_path):
                 return None
             
-            # Check for access denied
-            if "Access Denied" in driver.page_source or "Forbidden" in driver.page_source:
-                self.logger.error("Access denied to FINRA website")
+            with open(self.url_cache_path, 'r') as f:
+                cache = json.load(f)
+            
+            if time.time() - cache.get('timestamp', 0) > self.url_cache_max_age:
                 return None
             
-            # Find download link
-            download_url = self._extract_download_link(driver)
-            return download_url
+            return cache.get('url')
             
         except Exception as e:
-            self.logger.error(f"Error finding FINRA download URL: {str(e)}")
+            self.logger.debug(f"Could not read FINRA URL cache: {e}")
             return None
-            
-        finally:
-            if driver:
-                driver.quit()
     
-    def _extract_download_link(self, driver) -> Optional[str]:
+    def _save_cached_download_url(self, download_url: str) -> None:
         """
-        Extract the download link from the FINRA page.
+        Persist the discovered download URL for later runs.
         
         Args:
-            driver: Selenium WebDriver instance
-            
+            download_url: URL to cache
+        """
+        try:
+            os.makedirs(self.download_dir, exist_ok=True)
+            with open(self.url_cache_path, 'w') as f:
+                json.dump({'url': download_url, 'timestamp': time.time()}, f)
+        except Exception as e:
+            self.logger.debug(f"Could not write FINRA URL cache: {e}")
+    
+    def _clear_cached_download_url(self) -> None:
+        """Remove the cached download URL."""
+        try:
+            if os.path.exists(self.url_cache_path):
+                os.remove(self.url_cache_path)
+        except Exception as e:
+            self.logger.debug(f"Could not remove FINRA URL cache: {e}")
+    
+    def _find_download_url_selenium(self) -> Optional[str]:
+        """
+        Find the FINRA download URL using web scraping.
+        
         Returns:
             Download URL or None if not found
         """
         try:
-            self.logger.info("Searching for download link...")
-            all_links = driver.find_elements(By.TAG_NAME, "a")
-            
-            for link in all_links:
-                try:
-                    link_text = link.text.strip()
-                    if self.download_link_text in link_text.upper():
-                        href = link.get_attribute("href")
-                        self.logger.info(f"Found download link: {href}")
-                        return href
-                except:
-                    continue
-            
-            self.logger.error(f"No link found containing '{self.download_link_text}'")
-            return None
+            # Reuse the caller's driver or lease the shared one (Chrome starts once per run)
+            with self.web_scraper.lease_driver(
+                download_dir=self.download_dir,
+                driver=self.driver,
+                headless=True
+            ) as driver:
+                # Navigate to FINRA page
+                self.logger.info(f"Navigating to FINRA page: {self.default_url}")
+                driver.get(self.default_url)
+                
+                # Wait for the download anchor itself rather than the full page load
+                link = self.web_scraper.wait_for_link_by_text(
+                    driver, self.download_link_text, timeout=15, case_sensitive=False
+                )
+                
+                if link is None:
+                    # Check for access denied
+                    if "Access Denied" in driver.page_source or "Forbidden" in driver.page_source:
+                        self.logger.error("Access denied to FINRA website")
+                    else:
+                        self.logger.error(f"No link found containing '{self.download_link_text}'")
+                    return None
+                
+                download_url = link.get_attribute("href")
+                self.logger.info(f"Found download link: {download_url}")
+                return download_url
             
         except Exception as e:
-            self.logger.error(f"Error extracting download link: {str(e)}")
+            self.logger.error(f"Error finding FINRA download URL: {str(e)}")
             return None
     
     def _download_finra_file(self, download_url: str) -> Optional[str]:
         """
-        Download FINRA Excel file directly using requests.
+        Download FINRA Excel file directly over HTTP (no browser).
         
         Args:
             download_url: URL to download from
             
         Returns:
-            Path to downloaded file or None if failed
+            Path to downloaded file (in-memory buffer if persist_downloads is False),
+            or None if failed
         """
-        try:
-            self.logger.info(f"Downloading Excel file from: {download_url}")
-            
-            # Use utility method for HTTP download
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36"
-            }
-            
-            response = requests.get(download_url, headers=headers, timeout=60)
-            response.raise_for_status()
-            
-            # Get filename from URL
-            parsed_url = urlparse(download_url)
-            filename = os.path.basename(parsed_url.path)
-            if not filename.endswith(('.xlsx', '.xls')):
-                filename = "finra_margin_statistics.xlsx"
-            
-            # Save file
-            file_path = os.path.join(self.download_dir, filename)
-            
-            # Ensure download directory exists
-            os.makedirs(self.download_dir, exist_ok=True)
-            
-            with open(file_path, 'wb') as file:
-                file.write(response.content)
-            
-            self.logger.info(f"File downloaded successfully to: {file_path}")
-            return file_path
-            
-        except Exception as e:
-            self.logger.error(f"Error downloading FINRA file: {str(e)}")
-            return None
+        if not self.persist_downloads:
+            # Parse straight from memory; no file is written or re-read
+            return self.file_downloader.download_to_buffer(download_url, timeout=60)
+        
+        # Get filename from URL
+        parsed_url = urlparse(download_url)
+        filename = os.path.basename(parsed_url.path)
+        if not filename.endswith(('.xlsx', '.xls')):
+            filename = "finra_margin_statistics.xlsx"
+        
+        # Streamed download over the shared keep-alive session; unchanged files are reused
+        return self.file_downloader.download_file_from_url(
+            url=download_url,
+            download_dir=self.download_dir,
+            filename=filename,
+            timeout=60,
+            conditional=True
+        )
     
     def _process_finra_excel(self, file_path: str) -> pd.DataFrame:
         """
@@ -268,7 +348,9 @@ class FINRAFetcher(BaseDataFetcher):
             df = self.excel_processor.read_excel_file(
                 file_path=file_path,
                 sheet_name=0,  # First sheet
-                skip_rows=0
+                skip_rows=0,
+                usecols=[0, 1, 2, 3],  # Year-Month plus the three balance columns
+                column_names=['Year-Month'] + self.value_columns
             )
             
             if df.empty:
@@ -293,35 +375,26 @@ class FINRAFetcher(BaseDataFetcher):
             Standardized DataFrame with columns: date, symbol, metric, value
         """
         try:
-            # Create the date column from Year-Month
-            df['date'] = pd.to_datetime(df['Year-Month'], format='%Y-%m')
-            df['date'] = df['date'].apply(lambda x: (x + relativedelta(months=1, days=-1))).dt.date
-            
-            # Delete the Year-Month column
-            df = df.drop(columns=['Year-Month'])
+            # Keep only rows with at least one value, so blank/footnote rows are neither
+            # date-parsed nor stacked
+            has_values = df.drop(columns=['Year-Month']).notna().any(axis=1)
+            df = df.loc[has_values.to_numpy()]
             
-            # Rename the columns with FINRA_ prefix
-            df.columns = [
-                "FINRA_Margin_Debt",
-                "FINRA_Free_Credit_Cash", 
-                "FINRA_Free_Credit_Margin",
-                "date"
-            ]
+            # Create the date column from Year-Month (last day of the month)
+            df['date'] = DateUtils.to_month_end_dates(df['Year-Month'], format='%Y-%m')
             
-            # Transform wide to long format using utility method
-            value_columns = [col for col in df.columns if col.startswith('FINRA_')]
-            
-            result_df = self.data_transformer.melt_to_long_format(
+            # Transform wide to long format using utility method (columns were named at read time)
+            result_df = self.data_transformer.wide_to_long_fast(
                 df=df,
-                id_vars=['date'],
-                value_vars=value_columns,
+                id_col='date',
+                value_vars=self.value_columns,
                 var_name='metric',
                 value_name='value'
             )
             
-            # Add symbol column (using metric name)
+            # Add symbol column (using metric name); both columns stay categorical
             result_df['symbol'] = result_df['metric']
-            result_df['metric'] = 'value'
+            result_df['metric'] = self.constant_categorical('value', len(result_df))
             
             # Standardize column order using utility method
             result_df = self.data_transformer.standardize_column_order(
@@ -329,12 +402,16 @@ class FINRAFetcher(BaseDataFetcher):
                 expected_order=['date', 'symbol', 'metric', 'value']
             )
             
-            # Clean data using utility method
+            # Validate columns (NaN values were already masked out while stacking)
             result_df = self.data_transformer.clean_and_validate_data(
                 result_df,
-                required_columns=['date', 'symbol', 'value']
+                required_columns=['date', 'symbol', 'value'],
+                drop_na_columns=[]
             )
             
+            # Downcast values to float32
+            result_df = self.downcast_numeric_columns(result_df)
+            
             self.logger.info(f"Data transformation completed. Final rows: {len(result_df)}")
             return result_df
             
@@ -347,14 +424,15 @@ class FINRAFetcher(BaseDataFetcher):
 def get_finra_data(
     url: str = "https://www.finra.org/rules-guidance/key-topics/margin-accounts/margin-statistics",
     download_dir: str = "data/finra",
-    headless: bool = True
+    headless: bool = True,
+    driver=None
 ) -> pd.DataFrame:
     """
     Legacy wrapper for backward compatibility.
     
     DEPRECATED: Use FINRAFetcher.fetch_batch() instead.
     """
-    fetcher = FINRAFetcher(download_dir)
+    fetcher = FINRAFetcher(download_dir, driver=driver)
     return fetcher.fetch_batch()
 
 
@@ -8,14 +8,22 @@ Refactored to use BaseDataFetcher for common functionality.
 """
 
 import pandas as pd
+import pyarrow as pa
 from fredapi import Fred
 from datetime import datetime
 import time
 import threading
+from functools import lru_cache
 from typing import List
 from ..core.base_fetcher import BaseDataFetcher
 
 
+@lru_cache(maxsize=1)
+def _fred_client(api_key: str) -> Fred:
+    """Return the process-wide FRED API client for an API key."""
+    return Fred(api_key=api_key)
+
+
 class FREDRateLimiter:
     """
     Rate limiter for FRED API to respect the 120 requests per minute limit.
@@ -71,7 +79,7 @@ class FREDFetcher(BaseDataFetcher):
     def _initialize_api(self):
         """Initialize FRED API client."""
         api_key = self.load_environment_variable('FRED_API_KEY', required=True)
-        self.fred_api = Fred(api_key=api_key)
+        self.fred_api = _fred_client(api_key)
         self.logger.info("FRED API client initialized")
     
     def get_single_series(self, series_id: str, start_date: datetime, 
@@ -89,47 +97,76 @@ class FREDFetcher(BaseDataFetcher):
         """
         start_str, end_str = self.format_date_range(start_date, end_date)
         
-        for attempt in range(self.max_retries):
-            try:
-                # Apply rate limiting before making the request
-                self.rate_limiter.wait_if_needed()
-                
-                # Make the API request
-                data = self.fred_api.get_series(series_id, start_date, end_date)
-                
-                if data is None or data.empty:
-                    self.logger.warning(f"No data returned for FRED series {series_id}")
-                    return pd.DataFrame()
-                
-                # Convert to DataFrame
-                df = pd.DataFrame(data, columns=['value'])
-                
-                # Standardize using base class method
-                standardized_df = self.standardize_dataframe(
-                    df=df,
-                    expected_columns=['date', 'series_id', 'value'],
-                    identifier_column='series_id',
-                    identifier_value=series_id
-                )
-                
-                self.logger.info(f"Successfully fetched {len(standardized_df)} rows for FRED series {series_id}")
-                return standardized_df
-                
-            except Exception as e:
-                if not self.handle_api_error(e, series_id, attempt, self.max_retries):
-                    # Don't retry for certain errors
-                    return pd.DataFrame()
+        def fetch() -> pd.DataFrame:
+            # Apply rate limiting before making the request
+            self.rate_limiter.wait_if_needed()
+            
+            # Make the API request
+            data = self.fred_api.get_series(series_id, start_date, end_date)
+            
+            if data is None or data.empty:
+                self.logger.warning(f"No data returned for FRED series {series_id}")
+                return pd.DataFrame()
+            
+            # Convert to DataFrame
+            df = pd.DataFrame(data, columns=['value'])
+            
+            # Standardize using base class method
+            standardized_df = self.standardize_dataframe(
+                df=df,
+                expected_columns=['date', 'series_id', 'value'],
+                identifier_column='series_id',
+                identifier_value=series_id
+            )
+            
+            self.logger.info(f"Successfully fetched {len(standardized_df)} rows for FRED series {series_id}")
+            return standardized_df
+        
+        # Retries honor Retry-After and use full-jitter backoff (base class)
+        return self.retry_with_backoff(fetch, series_id)
+    
+    def get_single_series_arrow(self, series_id: str, start_date: datetime,
+                                end_date: datetime) -> pa.RecordBatch:
+        """
+        Fetch a single FRED time series directly as an Arrow RecordBatch.
+        
+        Args:
+            series_id: FRED series ID
+            start_date: Start date for data
+            end_date: End date for data
+            
+        Returns:
+            RecordBatch with columns: date (date32), series_id (dictionary), value (float32)
+        """
+        def empty_batch() -> pa.RecordBatch:
+            return self.build_series_record_batch([], [], 'series_id', series_id)
         
-        # If we get here, all retries failed
-        raise Exception(f"Failed to fetch FRED data for {series_id} after {self.max_retries} attempts")
+        def fetch() -> pa.RecordBatch:
+            # Apply rate limiting before making the request
+            self.rate_limiter.wait_if_needed()
+            
+            data = self.fred_api.get_series(series_id, start_date, end_date)
+            
+            if data is None or data.empty:
+                self.logger.warning(f"No data returned for FRED series {series_id}")
+                return empty_batch()
+            
+            # Build the batch straight from the Series' index and values (no DataFrame)
+            batch = self.build_series_record_batch(data.index, data.to_numpy(), 'series_id', series_id)
+            self.logger.info(f"Successfully fetched {batch.num_rows} rows for FRED series {series_id}")
+            return batch
+        
+        return self.retry_with_backoff(fetch, series_id, default_factory=empty_batch)
     
-    def fetch_batch(self, symbols_df: pd.DataFrame, batch_size: int = 50) -> pd.DataFrame:
+    def fetch_batch(self, symbols_df: pd.DataFrame, batch_size: int = 50,
+                    max_workers: int = 8) -> pd.DataFrame:
         """
         Fetch FRED data for all symbols in the provided DataFrame.
         
         Args:
             symbols_df: DataFrame with symbol information
             batch_size: Batch size for progress reporting
+            max_workers: Maximum number of concurrent requests
             
         Returns:
             Combined DataFrame with all FRED data
@@ -146,49 +183,22 @@ class FREDFetcher(BaseDataFetcher):
         total_symbols = len(fred_symbols)
         self.logger.info(f"Found {total_symbols} FRED symbols to process")
         
-        # Estimate time based on rate limit
-        estimated_time_minutes = (total_symbols / 120) + 1
+        # Estimate time based on rate limit (requests run concurrently up to the limit)
+        estimated_time_minutes = (total_symbols / self.rate_limiter.max_requests) + 1
         self.logger.info(f"Estimated completion time: {estimated_time_minutes:.1f} minutes")
         
-        all_data = []
         end_date = datetime.now()
-        successful_fetches = 0
-        failed_fetches = 0
-        
-        start_time = datetime.now()
+        series_requests = []
         
-        for idx, (_, row) in enumerate(fred_symbols.iterrows(), 1):
-            series_id = row['string.symbol']
-            start_date_str = row['date.series.start']
-            
+        for series_id, start_date_str in zip(fred_symbols['string.symbol'], fred_symbols['date.series.start']):
             try:
                 start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-                
-                # Progress logging
-                if idx % batch_size == 0 or idx == total_symbols:
-                    elapsed_time = datetime.now() - start_time
-                    avg_time_per_request = elapsed_time.total_seconds() / idx
-                    remaining_requests = total_symbols - idx
-                    estimated_remaining_time = remaining_requests * avg_time_per_request / 60
-                    
-                    self.logger.info(
-                        f"Progress: {idx}/{total_symbols} ({idx/total_symbols*100:.1f}%) - "
-                        f"Successful: {successful_fetches}, Failed: {failed_fetches} - "
-                        f"Est. remaining: {estimated_remaining_time:.1f} minutes"
-                    )
-                
-                data = self.get_single_series(series_id, start_date, end_date)
-                
-                if not data.empty:
-                    all_data.append(data)
-                    successful_fetches += 1
-                else:
-                    failed_fetches += 1
-                    
+                series_requests.append((series_id, start_date, end_date))
             except Exception as e:
                 self.logger.error(f"Error processing FRED series {series_id}: {str(e)}")
-                failed_fetches += 1
-                continue
+        
+        # Fetch concurrently; the shared rate limiter keeps us under 120 requests/minute
+        all_data = self.fetch_many(series_requests, max_workers=max_workers, progress_every=batch_size)
         
         # Use base class summary logging
         return self.log_collection_summary(all_data, total_symbols)
@@ -216,6 +226,21 @@ def fetch_fred(symbols_df: pd.DataFrame, batch_size: int = 50) -> pd.DataFrame:
     return fetcher.fetch_batch(symbols_df, batch_size)
 
 
+def fetch_fred_arrow(symbols_df: pd.DataFrame, max_workers: int = 8) -> pa.Table:
+    """
+    Fetch FRED data for all symbols as an Arrow Table (one RecordBatch per series).
+    
+    Args:
+        symbols_df: DataFrame with symbol information
+        max_workers: Maximum number of concurrent requests
+        
+    Returns:
+        Arrow Table with columns: date, series_id, value
+    """
+    fetcher = FREDFetcher()
+    return fetcher.fetch_batch_arrow(symbols_df, max_workers=max_workers)
+
+
 def fetch_fred_batch(series_list: List[str], start_date: datetime = datetime(1990, 1, 1), 
                     end_date: datetime = datetime.now()) -> pd.DataFrame:
     """
@@ -11,17 +11,24 @@ Uses BaseDataFetcher and utility classes following the established pipeline patt
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import os
+import json
 import time
 import calendar
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from io import StringIO
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
@@ -31,6 +38,10 @@ from ..utils.web_scraping_utils import WebScrapingUtils
 from ..utils.transform_utils import DataTransformUtils
 
 
+# Consent banner buttons, checked in priority order in one script call
+COOKIE_ACCEPT_TEXTS = ('accept all', 'allow all', 'accept', 'got it')
+
+
 class OCCDailyDataFetcher(BaseDataFetcher):
     """
     OCC daily volume data fetcher using BaseDataFetcher infrastructure.
@@ -54,14 +65,30 @@ class OCCDailyDataFetcher(BaseDataFetcher):
         
         # Initialize utility classes
         self.data_transformer = DataTransformUtils()
+        self.web_scraper = WebScrapingUtils()
         
         self.download_dir = download_dir
         os.makedirs(self.download_dir, exist_ok=True)
         
+        # Screenshots of failed months are written here (created once, not per failure).
+        # Recovered timeouts are only captured when BRISTOL_OCC_SCREENSHOTS=1
+        self.debug_screenshots = os.getenv('BRISTOL_OCC_SCREENSHOTS') == '1'
+        self.debug_dir = Path(self.download_dir) / 'occ_debug'
+        self.debug_dir.mkdir(parents=True, exist_ok=True)
+        
         # OCC specific configuration
         self.base_url = "https://www.theocc.com/market-data/market-data-reports/volume-and-open-interest/historical-volume-statistics"
-        self.sleep_time = 0.3  # Ultra-fast timing
-        self.data_load_wait = 1.0  # Critical data loading wait
+        self.wait_timeout = 10  # Max seconds to wait for each page state change
+        self.optional_click_timeout = 1.5  # Max seconds to wait for controls that may be absent
+        self.page_load_timeout = 20  # Max seconds for driver.get (returns on DOMContentLoaded)
+        self.navigation_backoff = [0.05, 0.1, 0.2, 0.4, 0.8]  # Retry delays for failed navigations
+        
+        # Cookies from a successful run are replayed into every new browser so later
+        # sessions skip the site's first-visit consent/session handshake; the file is
+        # rewritten once a saved cookie has expired
+        self.session_state_path = os.path.join(self.download_dir, 'occ_state.json')
+        self._session_state_lock = threading.Lock()
+        self._session_state_current = False
         
         # Chrome options for headless scraping
         self.chrome_options = Options()
@@ -70,13 +97,41 @@ class OCCDailyDataFetcher(BaseDataFetcher):
         self.chrome_options.add_argument('--disable-gpu')
         self.chrome_options.add_argument('--disable-web-security')
         self.chrome_options.add_argument('--allow-running-insecure-content')
-        self.chrome_options.add_argument('--headless=new')
+        # Headless unless CHROME_HEADLESS=False is set for debugging (see env.example)
+        if os.getenv('CHROME_HEADLESS', 'True').strip().lower() not in ('false', '0', 'no'):
+            self.chrome_options.add_argument('--headless=new')
+        self.chrome_options.add_argument('--disable-extensions')
         self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         self.chrome_options.add_experimental_option('useAutomationExtension', False)
         self.chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        self.chrome_options.add_argument('--window-size=1280,900')
+        
+        # Return from driver.get on DOMContentLoaded instead of waiting for third-party beacons
+        self.chrome_options.page_load_strategy = 'eager'
+        
+        # Only the report tables are needed: skip images, stylesheets and fonts
+        self.chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        self.chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        
+        # Requests aborted in the browser (analytics beacons, fonts, media); scripts and
+        # XHR stay enabled because the date picker and report tables are rendered by JS
+        self.blocked_url_patterns = [
+            "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+            "*hotjar.com*", "*segment.io*", "*segment.com*",
+            "*.woff", "*.woff2", "*.ttf", "*.otf",
+            "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.mp4", "*.webm",
+        ]
         
         self.driver = None
+        
+        # Months already in DuckDB, loaded once per run by _get_existing_months
+        self._existing_months: Optional[set] = None
+        self._existing_months_loaded = False
     
     def fetch_data(self, start_year: int, end_year: Optional[int] = None) -> pd.DataFrame:
         """
@@ -95,193 +150,354 @@ class OCCDailyDataFetcher(BaseDataFetcher):
             
         self.logger.info(f"Fetching OCC data from {start_year} to {end_year}")
         
-        all_data = []
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"stg_occ_{timestamp}.parquet"
+        filepath = os.path.join(self.download_dir, filename)
         
-        for year in range(start_year, end_year + 1):
-            year_data = self.extract_year_with_session_management(year)
-            if year_data:
-                # Convert to long format and append
+        # One driver pool serves the whole range (browsers are not restarted at year
+        # boundaries); each year is appended to the Parquet file as soon as its last
+        # month arrives, so the per-year frames are never held in memory together
+        months = [(year, month) for year in range(start_year, end_year + 1) for month in range(1, 13)]
+        writer = None
+        total_records = 0
+        year_data = []
+        try:
+            for month_data, (year, month) in zip(self.iter_extract_months(months), months):
+                if month_data:
+                    year_data.append(month_data)
+                if month != 12 or not year_data:
+                    continue
+                
+                self.logger.info(f"Year {year} extraction complete: {len(year_data)} months extracted")
                 long_format_data = self.convert_to_long_format(year_data)
-                all_data.append(long_format_data)
+                year_data = []
+                if long_format_data.empty:
+                    continue
                 
-        if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
-            self.logger.info(f"Successfully fetched {len(combined_df)} records")
-            
-            # Save to parquet
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"stg_occ_{timestamp}.parquet"
-            filepath = os.path.join(self.download_dir, filename)
-            combined_df.to_parquet(filepath, index=False)
+                table = pa.Table.from_pandas(long_format_data, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(filepath, table.schema, compression='zstd')
+                writer.write_table(table.cast(writer.schema))
+                total_records += len(long_format_data)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        if writer is not None:
+            self.logger.info(f"Successfully fetched {total_records} records")
             self.logger.info(f"Saved data to {filepath}")
-            
-            return combined_df
+            return pd.read_parquet(filepath)
         else:
             self.logger.warning("No data extracted")
             return pd.DataFrame()
     
-    def extract_year_with_session_management(self, year: int, batch_size: int = 1) -> List[Dict]:
-        """Extract data for all months in a year using session management"""
-        all_extracted_data = []
-        successful_months = []
-        failed_months = []
-        
+    def extract_year_with_session_management(self, year: int, max_workers: int = 4) -> List[Dict]:
+        """Extract data for all months in a year using a pool of reused browser sessions"""
         self.logger.info(f"Extracting full year {year} with session management")
         
-        total_batches = (12 + batch_size - 1) // batch_size
+        months = [(year, month) for month in range(1, 13)]
+        all_extracted_data = self.extract_months(months, max_workers=max_workers)
         
-        try:
-            for batch_num in range(total_batches):
-                batch_start = batch_num * batch_size + 1
-                batch_end = min(batch_start + batch_size - 1, 12)
-                
-                self.logger.info(f"Processing batch {batch_num + 1}/{total_batches}: Months {batch_start}-{batch_end}")
-                
-                # Start fresh browser session
-                self.start_driver()
-                
-                try:
-                    for month in range(batch_start, batch_end + 1):
-                        month_name = calendar.month_name[month]
-                        self.logger.info(f"Processing {month_name} {year}")
-                        
-                        extracted_data = self.extract_month_data(year, month)
-                        
-                        if extracted_data:
-                            successful_months.append(f"{year}-{month:02d}")
-                            all_extracted_data.append(extracted_data)
-                        else:
-                            failed_months.append(f"{year}-{month:02d}")
-                        
-                        # Small delay between months
-                        if month < batch_end:
-                            time.sleep(1.0)
-                
-                finally:
-                    self.close_driver()
-                
-                # Pause between batches
-                if batch_num < total_batches - 1:
-                    time.sleep(3.0)
+        self.logger.info(f"Year {year} extraction complete: {len(all_extracted_data)} successful, "
+                         f"{len(months) - len(all_extracted_data)} failed")
+        return all_extracted_data
+    
+    def extract_months(self, months: List[Tuple[int, int]], max_workers: int = 4) -> List[Dict]:
+        """
+        Extract several months concurrently.
+        
+        Each worker thread starts one Chrome session on its first month and reuses it
+        for every later month, instead of launching a browser per month. All sessions
+        are quit when the batch finishes.
+        
+        Args:
+            months: (year, month) pairs to extract
+            max_workers: Maximum number of concurrent browser sessions
             
-            self.logger.info(f"Year {year} extraction complete: {len(successful_months)} successful, {len(failed_months)} failed")
+        Returns:
+            Extracted month data for the months that succeeded, in request order
+        """
+        return [result for result in self.iter_extract_months(months, max_workers) if result]
+    
+    def iter_extract_months(self, months: List[Tuple[int, int]],
+                            max_workers: int = 4) -> Iterator[Optional[Dict]]:
+        """
+        Extract several months concurrently, yielding results in request order as they complete.
+        
+        Same driver pool as extract_months, but the caller can consume (e.g. write out)
+        earlier months while later ones are still loading. Failed months yield None.
+        
+        Args:
+            months: (year, month) pairs to extract
+            max_workers: Maximum number of concurrent browser sessions
             
-        except Exception as e:
-            self.logger.error(f"Session management extraction failed: {str(e)}")
+        Yields:
+            Extracted month data (or None) for each requested month
+        """
+        if not months:
+            return
+        
+        local = threading.local()
+        drivers = []
+        drivers_lock = threading.Lock()
+        
+        def extract(year_month: Tuple[int, int]) -> Optional[Dict]:
+            year, month = year_month
             try:
-                self.close_driver()
-            except:
-                pass
+                driver = getattr(local, 'driver', None)
+                if driver is None:
+                    driver = local.driver = self.create_driver()
+                    with drivers_lock:
+                        drivers.append(driver)
                 
-        return all_extracted_data
+                self.logger.info(f"Processing {calendar.month_name[month]} {year}")
+                return self.extract_month_data(year, month, driver=driver)
+            except Exception as e:
+                self.logger.error(f"Error extracting {year}-{month}: {str(e)}")
+                return None
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(months))) as executor:
+                yield from executor.map(extract, months)
+        finally:
+            for driver in drivers:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+    
+    def create_driver(self) -> webdriver.Chrome:
+        """Create a new Chrome driver with the OCC scraping options"""
+        service = Service(ChromeDriverManager().install())
+        driver = webdriver.Chrome(service=service, options=self.chrome_options)
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        driver.set_page_load_timeout(self.page_load_timeout)
+        
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_url_patterns})
+        except Exception as e:
+            self.logger.debug(f"Could not set blocked URLs: {e}")
+        
+        self._load_session_state(driver)
+        return driver
+    
+    def _load_session_state(self, driver) -> None:
+        """Seed a new browser with the cookies saved by a previous run (if any)"""
+        if not os.path.exists(self.session_state_path):
+            return
+        
+        try:
+            with open(self.session_state_path, 'r') as f:
+                cookies = json.load(f)
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            self.logger.debug(f"Loaded {len(cookies)} cookies from {self.session_state_path}")
+        except Exception as e:
+            self.logger.debug(f"Could not load session state: {e}")
+    
+    def _session_state_is_fresh(self) -> bool:
+        """True if the saved state exists and none of its cookies has expired"""
+        try:
+            with open(self.session_state_path, 'r') as f:
+                cookies = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        now = time.time()
+        return all(cookie.get('expires', now + 1) > now for cookie in cookies)
+    
+    def _save_session_state(self, driver) -> None:
+        """Persist the browser cookies after the first successful extraction of a run,
+        unless the saved state is still fresh (no saved cookie has expired)"""
+        if self._session_state_current:
+            return
+        
+        with self._session_state_lock:
+            if self._session_state_current:
+                return
+            if self._session_state_is_fresh():
+                self._session_state_current = True
+                return
+            try:
+                cookie_fields = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+                cookies = [
+                    {field: cookie[field] for field in cookie_fields if field in cookie}
+                    for cookie in driver.execute_cdp_cmd("Network.getAllCookies", {}).get('cookies', [])
+                    if not cookie.get('session')
+                ]
+                tmp_path = f"{self.session_state_path}.part"
+                with open(tmp_path, 'w') as f:
+                    json.dump(cookies, f)
+                os.replace(tmp_path, self.session_state_path)
+                self._session_state_current = True
+                self.logger.debug(f"Saved {len(cookies)} cookies to {self.session_state_path}")
+            except Exception as e:
+                self.logger.debug(f"Could not save session state: {e}")
     
     def start_driver(self):
         """Start the Chrome driver"""
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.driver.maximize_window()
+        self.driver = self.create_driver()
         
     def close_driver(self):
         """Close the Chrome driver"""
         if self.driver:
             self.driver.quit()
             
-    def extract_month_data(self, year: int, month: int) -> Optional[Dict]:
-        """Extract daily data for a specific month"""
+    def extract_month_data(self, year: int, month: int, driver=None) -> Optional[Dict]:
+        """Extract daily data for a specific month (on the given driver, or driver)"""
+        driver = driver or self.driver
         try:
-            # Navigate to the page
-            self.driver.get(self.base_url)
-            time.sleep(self.sleep_time)
-            
-            # Find and click Daily Statistics radio button
-            wait = WebDriverWait(self.driver, 10)
-            radio_buttons = self.driver.find_elements(By.XPATH, "//input[@type='radio']")
-            
-            daily_radio = None
-            for radio in radio_buttons:
-                if radio.get_attribute('value') == 'D':
-                    daily_radio = radio
-                    break
-            
-            if not daily_radio:
+            # Navigate to the page and wait for the Daily Statistics radio button
+            # (one locator instead of reading the value of every radio button)
+            wait = WebDriverWait(driver, self.wait_timeout)
+            self._open_report_page(driver)
+            self._dismiss_cookie_banner(driver)
+            try:
+                daily_radio = wait.until(
+                    EC.presence_of_element_located((By.XPATH, "//input[@type='radio' and @value='D']"))
+                )
+            except TimeoutException:
+                self.logger.warning("Daily Statistics radio button not found")
                 return None
-                
-            self.driver.execute_script("arguments[0].click();", daily_radio)
-            time.sleep(self.sleep_time)
             
-            # Click date picker
+            driver.execute_script("arguments[0].click();", daily_radio)
+            wait.until(EC.element_to_be_selected(daily_radio))
+            
+            # Click date picker (the picker buttons below are waited for individually)
             date_input = wait.until(EC.element_to_be_clickable((By.XPATH, "//input[@name='report_date']")))
-            self.driver.execute_script("arguments[0].click();", date_input)
-            time.sleep(self.sleep_time)
+            driver.execute_script("arguments[0].click();", date_input)
             
-            # Navigate to correct month/year
-            try:
-                year_month_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[contains(@class, 'month__year_btn')]")))
-                year_month_btn.click()
-                time.sleep(self.sleep_time)
-            except:
-                pass
+            # Navigate to correct month/year (the toggle is not always rendered, so
+            # it only gets a short wait instead of the full page timeout)
+            self._try_click(driver, "//span[contains(@class, 'month__year_btn')]", self.optional_click_timeout)
             
             # Select year
-            try:
-                year_element = wait.until(EC.element_to_be_clickable((By.XPATH, f"//span[contains(@class, 'year') and text()='{year}']")))
-                year_element.click()
-                time.sleep(self.sleep_time)
-            except:
-                pass
+            self._try_click(driver, f"//span[contains(@class, 'year') and text()='{year}']", self.wait_timeout)
             
             # Select month
             month_names = ["January", "February", "March", "April", "May", "June",
                           "July", "August", "September", "October", "November", "December"]
             month_name = month_names[month - 1]
             
+            self._try_click(driver, f"//span[contains(@class, 'month') and text()='{month_name}']", self.wait_timeout)
+            
+            # Poll the post-condition (picker committed the chosen period into the input)
+            # instead of assuming the click has been applied before View is pressed
             try:
-                month_element = wait.until(EC.element_to_be_clickable((By.XPATH, f"//span[contains(@class, 'month') and text()='{month_name}']")))
-                month_element.click()
-                time.sleep(self.sleep_time)
-            except:
-                pass
+                WebDriverWait(driver, self.optional_click_timeout).until(
+                    lambda d: str(year) in (date_input.get_attribute('value') or '')
+                )
+            except TimeoutException:
+                self.logger.debug(f"Date input did not show {year} before View for {year}-{month:02d}")
             
             # Click View button
             view_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(@class, 'marketData-inputBtn') and text()='View']")))
-            self.driver.execute_script("arguments[0].click();", view_button)
-            time.sleep(self.data_load_wait)
+            # Tag the tables currently on the page so the re-rendered report can be told apart
+            driver.execute_script(
+                "for (const t of document.getElementsByTagName('table')) t.setAttribute('data-bg-stale', '1');"
+            )
+            driver.execute_script("arguments[0].click();", view_button)
+            
+            # Wait for the new report tables and fetch their HTML in the same polled script,
+            # so the final poll returns the data (no separate staleness/count/extract calls).
+            # Tables only need to be attached with a first body row, not laid out or visible
+            try:
+                tables_html = wait.until(lambda driver: driver.execute_script(
+                    "const tables = Array.from(document.getElementsByTagName('table'))"
+                    ".filter(t => !t.hasAttribute('data-bg-stale') && t.querySelector('tbody tr:nth-child(1)'));"
+                    "return tables.length >= 2 ? tables.slice(0, 2).map(t => t.outerHTML) : null;"
+                ))
+            except TimeoutException:
+                self.logger.warning(f"Report tables did not load for {year}-{month:02d}")
+                # Fall back to whatever tables are on the page (e.g. updated in place)
+                tables_html = driver.execute_script(
+                    "return Array.from(document.getElementsByTagName('table')).slice(0, 2).map(t => t.outerHTML);"
+                )
+                if self.debug_screenshots or len(tables_html) < 2:
+                    self._save_debug_artifacts(driver, 'no_table', year, month)
             
-            # Extract data tables
-            tables = self.driver.find_elements(By.TAG_NAME, "table")
-            if len(tables) >= 2:
+            if len(tables_html) >= 2:
                 extracted_data = {
                     'year': year,
                     'month': month,
                     'month_name': month_name
                 }
                 
-                # Extract table data
-                for i, table in enumerate(tables[:2]):
+                # Parse tables straight into DataFrames (no records round-trip)
+                table_keys = ['occ_contract_volume', 'futures_contract_volume']
+                for i, (key, table_html) in enumerate(zip(table_keys, tables_html)):
                     try:
-                        table_html = table.get_attribute('outerHTML')
-                        df = pd.read_html(StringIO(table_html))[0]
-                        
-                        if i == 0:
-                            extracted_data['occ_contract_volume'] = df.to_dict('records')
-                        elif i == 1:
-                            extracted_data['futures_contract_volume'] = df.to_dict('records')
-                            
+                        extracted_data[key] = pd.read_html(StringIO(table_html))[0]
                     except Exception as e:
                         self.logger.warning(f"Error extracting table {i}: {str(e)}")
                 
+                self._save_session_state(driver)
                 return extracted_data
             else:
                 return None
                 
         except Exception as e:
             self.logger.error(f"Error extracting data for {year}-{month}: {str(e)}")
+            self._save_debug_artifacts(driver, 'error', year, month)
             return None
     
+    def _open_report_page(self, driver) -> None:
+        """Navigate to the OCC report page, retrying quickly with backoff on load failures"""
+        for attempt, delay in enumerate(self.navigation_backoff + [None]):
+            try:
+                driver.get(self.base_url)
+                return
+            except WebDriverException as e:
+                if delay is None:
+                    raise
+                self.logger.debug(f"Navigation attempt {attempt + 1} failed ({e.__class__.__name__}), retrying in {delay}s")
+                time.sleep(delay)
+    
+    def _try_click(self, driver, xpath: str, timeout: float) -> bool:
+        """
+        Click an element once it is clickable, without a separate visibility probe.
+        
+        Returns:
+            True if the element was clicked, False if it never became clickable
+        """
+        try:
+            WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((By.XPATH, xpath))).click()
+            return True
+        except (TimeoutException, WebDriverException) as e:
+            self.logger.debug(f"Could not click {xpath}: {e.__class__.__name__}")
+            return False
+    
+    def _debug_path(self, tag: str, year: int, month: int, suffix: str = '.png') -> Path:
+        """Path of a debug artifact for a failed month"""
+        return self.debug_dir / f"debug_{tag}_{year}_{month:02d}{suffix}"
+    
+    def _save_debug_artifacts(self, driver, tag: str, year: int, month: int) -> None:
+        """
+        Save a viewport screenshot and a DOM snapshot of the current page for a failed month.
+        
+        Only called on failure paths, so successful months never pay for PNG encoding
+        or page serialization.
+        """
+        try:
+            path = self._debug_path(tag, year, month)
+            driver.save_screenshot(str(path))
+            self._debug_path(tag, year, month, '.html').write_text(driver.page_source, encoding='utf-8')
+            self.logger.info(f"Saved debug screenshot and page snapshot to {path.with_suffix('')}.*")
+        except Exception as e:
+            self.logger.debug(f"Could not save debug artifacts: {e}")
+    
+    def _dismiss_cookie_banner(self, driver) -> None:
+        """Accept the cookie banner if one is showing (single script call, no per-selector waits)"""
+        try:
+            matched = self.web_scraper.click_first_button_by_text(driver, COOKIE_ACCEPT_TEXTS)
+            if matched:
+                self.logger.debug(f"Dismissed cookie banner ('{matched}')")
+        except WebDriverException as e:
+            self.logger.debug(f"Could not check for cookie banner: {e}")
+    
     def convert_to_long_format(self, year_data: List[Dict]) -> pd.DataFrame:
         """Convert extracted data to standard long format with date, symbol, metric, value schema"""
-        long_data = []
+        long_frames = []
         
         for month_data in year_data:
             year = month_data['year']
@@ -289,12 +505,11 @@ class OCCDailyDataFetcher(BaseDataFetcher):
             
             # Process OCC options data
             if 'occ_contract_volume' in month_data:
-                occ_df = pd.DataFrame(month_data['occ_contract_volume'])
+                occ_df = month_data['occ_contract_volume'].copy()
                 
                 # Keep only first 3 columns for futures (avoid total column duplication)
                 if 'futures_contract_volume' in month_data:
-                    futures_df = pd.DataFrame(month_data['futures_contract_volume'])
-                    futures_df = futures_df.iloc[:, :3].copy()
+                    futures_df = month_data['futures_contract_volume'].iloc[:, :3].copy()
                     
                     # Set column names
                     occ_df.columns = ["date", "OCC_Options_Equity_Volume", "OCC_Options_Index_Volume", 
@@ -309,25 +524,27 @@ class OCCDailyDataFetcher(BaseDataFetcher):
                 # Filter daily data only and fix dates
                 daily_mask = merged_df['date'].astype(str).str.match(r'^\d{1,2}/\d{1,2}$')
                 daily_df = merged_df[daily_mask].copy()
+                if daily_df.empty:
+                    continue
                 
-                # Convert dates to proper format
-                daily_df['date'] = daily_df['date'].apply(
-                    lambda x: f"{year}-{x.split('/')[0].zfill(2)}-{x.split('/')[1].zfill(2)}"
+                # Convert "M/D" labels to datetime64 dates (vectorized, no per-row strings kept)
+                month_day = daily_df['date'].astype(str).str.extract(r'^(\d{1,2})/(\d{1,2})$').astype('int64')
+                daily_df['date'] = pd.to_datetime(
+                    pd.DataFrame({'year': year, 'month': month_day[0], 'day': month_day[1]})
                 )
                 
-                # Convert to standard long format (date, symbol, metric, value)
-                for _, row in daily_df.iterrows():
-                    date_val = row['date']
-                    for col in daily_df.columns:
-                        if col != 'date':
-                            long_data.append({
-                                'date': date_val,
-                                'symbol': 'OCC',  # Consistent symbol
-                                'metric': col,     # Metric name in metric column
-                                'value': float(row[col]) if pd.notna(row[col]) else None
-                            })
-        
-        return pd.DataFrame(long_data)
+                # Convert to standard long format by stacking the value columns as arrays
+                long_frames.append(
+                    self.data_transformer.wide_to_long_fast(daily_df, id_col='date', dropna=False)
+                )
+        
+        if not long_frames:
+            return pd.DataFrame()
+        
+        long_df = pd.concat(long_frames, ignore_index=True)
+        long_df['metric'] = long_df['metric'].astype(str)
+        long_df['symbol'] = 'OCC'  # Consistent symbol
+        return long_df[['date', 'symbol', 'metric', 'value']]
 
     def fetch_batch_without_saving(self, start_year: int, end_year: Optional[int] = None, 
                                   max_months: Optional[int] = 2) -> pd.DataFrame:
@@ -354,7 +571,7 @@ class OCCDailyDataFetcher(BaseDataFetcher):
         max_months_str = "unlimited" if max_months is None else str(max_months)
         self.logger.info(f"Fetching OCC data from {start_year} to {end_year} (pipeline mode, max {max_months_str} months)")
         
-        all_data = []
+        months_to_fetch = []
         months_fetched = 0
         
         for year in range(start_year, end_year + 1):
@@ -390,22 +607,14 @@ class OCCDailyDataFetcher(BaseDataFetcher):
                 if max_months is not None and months_fetched >= max_months:
                     break
                     
-                month_name = calendar.month_name[month]
-                progress_str = f"({months_fetched + 1}/{max_months})" if max_months else f"({months_fetched + 1})"
-                self.logger.info(f"Fetching {month_name} {year} {progress_str}")
-                
-                month_data = self.extract_month_data_single(year, month)
-                if month_data:
-                    long_format_data = self.convert_to_long_format([month_data])
-                    all_data.append(long_format_data)
-                    
+                months_to_fetch.append((year, month))
                 months_fetched += 1
-                
-                # Small delay between months
-                time.sleep(1.0)
-                
-        if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
+        
+        # Extract all selected months concurrently on reused browser sessions
+        month_data = self.extract_months(months_to_fetch)
+        
+        if month_data:
+            combined_df = self.convert_to_long_format(month_data)
             mode_str = "HISTORICAL" if max_months is None else "INCREMENTAL"
             self.logger.info(f"✅ {mode_str} fetch complete: {len(combined_df)} records from {months_fetched} months")
             return combined_df
@@ -484,98 +693,91 @@ class OCCDailyDataFetcher(BaseDataFetcher):
         Returns:
             True if full historical fetch is needed, False for incremental
         """
+        existing_months = self._get_existing_months()
+        if existing_months is None:
+            self.logger.info("💡 DuckDB stg_occ table not accessible - will do full historical fetch")
+            return True
+        
+        if not existing_months:
+            self.logger.info("💡 No existing OCC data in DuckDB - will do full historical fetch")
+            return True
+        
         try:
-            import duckdb
-            import pandas as pd
-            from datetime import datetime
-            from dateutil.relativedelta import relativedelta
+            # Generate expected year-month combinations from 2008-01 to current month
+            start_date = datetime(2008, 1, 1)  # OCC data starts around 2008
+            current_date = datetime.now()
             
-            # Connect to DuckDB and check existing data
-            try:
-                con = duckdb.connect('bristol_gate.duckdb', read_only=True)
-                
-                # Check if stg_occ table exists and has data
-                try:
-                    result = con.execute("SELECT COUNT(*) FROM stg_occ").fetchone()
-                    record_count = result[0] if result else 0
-                    
-                    if record_count == 0:
-                        self.logger.info("💡 No existing OCC data in DuckDB - will do full historical fetch")
-                        con.close()
-                        return True
-                    
-                    # Get existing data coverage
-                    existing_data = con.execute(
-                        "SELECT date FROM stg_occ WHERE symbol = 'OCC'"
-                    ).fetchdf()
-                    
-                    con.close()
-                    
-                    if len(existing_data) == 0:
-                        self.logger.info("💡 No OCC records found in DuckDB - will do full historical fetch")
-                        return True
-                    
-                    # Analyze date coverage
-                    existing_data['date'] = pd.to_datetime(existing_data['date'])
-                    existing_months = set(existing_data['date'].dt.to_period('M').astype(str))
-                    
-                    # Generate expected year-month combinations from 2008-01 to current month
-                    start_date = datetime(2008, 1, 1)  # OCC data starts around 2008
-                    current_date = datetime.now()
-                    
-                    expected_months = set()
-                    current_period = start_date
-                    while current_period <= current_date:
-                        expected_months.add(current_period.strftime('%Y-%m'))
-                        current_period += relativedelta(months=1)
-                    
-                    # Find missing months
-                    missing_months = expected_months - existing_months
-                    missing_count = len(missing_months)
-                    total_expected = len(expected_months)
-                    
-                    self.logger.info(f"📊 DuckDB data coverage analysis:")
-                    self.logger.info(f"   - Total records: {len(existing_data)}")
-                    self.logger.info(f"   - Expected months: {total_expected} (2008-01 to {current_date.strftime('%Y-%m')})")
-                    self.logger.info(f"   - Existing months: {len(existing_months)}")
-                    self.logger.info(f"   - Missing months: {missing_count}")
-                    
-                    # Decision logic
-                    if missing_count == 0:
-                        self.logger.info("✅ Complete data coverage - will do incremental fetch")
-                        return False
-                    elif missing_count == 1 and current_date.strftime('%Y-%m') in missing_months:
-                        self.logger.info("📈 Only current month missing - will do incremental fetch")
-                        return False
-                    elif missing_count <= 3:
-                        self.logger.info(f"⚠️ Few months missing ({missing_count}) - will do incremental fetch")
-                        # For small gaps, incremental fetch will catch up
-                        return False
-                    else:
-                        # Significant gaps - need full historical fetch
-                        self.logger.info(f"🔄 Significant gaps detected ({missing_count} months missing) - will do full historical fetch")
-                        if missing_count <= 10:  # Show missing months if not too many
-                            sorted_missing = sorted(list(missing_months))
-                            self.logger.info(f"   Missing: {', '.join(sorted_missing)}")
-                        return True
-                        
-                except Exception as table_error:
-                    # Table doesn't exist or is empty
-                    self.logger.info(f"💡 DuckDB stg_occ table not accessible ({table_error}) - will do full historical fetch")
-                    try:
-                        con.close()
-                    except:
-                        pass
-                    return True
-                    
-            except Exception as db_error:
-                self.logger.warning(f"⚠️ Could not access DuckDB: {db_error} - defaulting to full fetch")
+            expected_months = set()
+            current_period = start_date
+            while current_period <= current_date:
+                expected_months.add(current_period.strftime('%Y-%m'))
+                current_period += relativedelta(months=1)
+            
+            # Find missing months
+            missing_months = expected_months - existing_months
+            missing_count = len(missing_months)
+            total_expected = len(expected_months)
+            
+            self.logger.info(f"📊 DuckDB data coverage analysis:")
+            self.logger.info(f"   - Expected months: {total_expected} (2008-01 to {current_date.strftime('%Y-%m')})")
+            self.logger.info(f"   - Existing months: {len(existing_months)}")
+            self.logger.info(f"   - Missing months: {missing_count}")
+            
+            # Decision logic
+            if missing_count == 0:
+                self.logger.info("✅ Complete data coverage - will do incremental fetch")
+                return False
+            elif missing_count == 1 and current_date.strftime('%Y-%m') in missing_months:
+                self.logger.info("📈 Only current month missing - will do incremental fetch")
+                return False
+            elif missing_count <= 3:
+                self.logger.info(f"⚠️ Few months missing ({missing_count}) - will do incremental fetch")
+                # For small gaps, incremental fetch will catch up
+                return False
+            else:
+                # Significant gaps - need full historical fetch
+                self.logger.info(f"🔄 Significant gaps detected ({missing_count} months missing) - will do full historical fetch")
+                if missing_count <= 10:  # Show missing months if not too many
+                    sorted_missing = sorted(list(missing_months))
+                    self.logger.info(f"   Missing: {', '.join(sorted_missing)}")
                 return True
                 
         except Exception as e:
             self.logger.warning(f"⚠️ Error checking existing data: {e} - defaulting to full fetch")
             return True
     
+    def _get_existing_months(self) -> Optional[set]:
+        """
+        Get the year-months (YYYY-MM) already stored in the DuckDB stg_occ table.
+        
+        The distinct months are computed in DuckDB (instead of loading every date row)
+        and cached on the fetcher, so the full-vs-incremental decision and the
+        missing-months check share one connection and one query per run.
+        
+        Returns:
+            Set of YYYY-MM strings, or None if the table could not be read
+        """
+        if self._existing_months_loaded:
+            return self._existing_months
+        
+        self._existing_months_loaded = True
+        try:
+            import duckdb
+            
+            con = duckdb.connect('bristol_gate.duckdb', read_only=True)
+            try:
+                rows = con.execute(
+                    "SELECT DISTINCT strftime(date, '%Y-%m') FROM stg_occ WHERE symbol = 'OCC'"
+                ).fetchall()
+            finally:
+                con.close()
+            self._existing_months = {row[0] for row in rows}
+        except Exception as db_error:
+            self.logger.warning(f"⚠️ Could not access DuckDB stg_occ table: {db_error}")
+            self._existing_months = None
+        
+        return self._existing_months
+    
     def fetch_full_historical_data(self) -> pd.DataFrame:
         """
         Fetch full historical data from January 2008 to current date.
@@ -612,23 +814,12 @@ class OCCDailyDataFetcher(BaseDataFetcher):
             
             self.logger.info(f"📈 Fetching INCREMENTAL OCC data for {len(missing_months)} missing months: {', '.join(missing_months)}")
             
-            # Fetch the missing months
-            all_data = []
-            for year_month in missing_months:
-                year, month = map(int, year_month.split('-'))
-                month_name = calendar.month_name[month]
-                
-                self.logger.info(f"Fetching missing month: {month_name} {year}")
-                month_data = self.extract_month_data_single(year, month)
-                if month_data:
-                    long_format_data = self.convert_to_long_format([month_data])
-                    all_data.append(long_format_data)
-                
-                # Small delay between months
-                time.sleep(1.0)
+            # Fetch the missing months concurrently on reused browser sessions
+            months_to_fetch = [tuple(map(int, year_month.split('-'))) for year_month in missing_months]
+            month_data = self.extract_months(months_to_fetch)
             
-            if all_data:
-                combined_df = pd.concat(all_data, ignore_index=True)
+            if month_data:
+                combined_df = self.convert_to_long_format(month_data)
                 self.logger.info(f"✅ INCREMENTAL fetch complete: {len(combined_df)} records from {len(missing_months)} months")
                 return combined_df
             else:
@@ -652,24 +843,8 @@ class OCCDailyDataFetcher(BaseDataFetcher):
             List of missing year-month strings in YYYY-MM format
         """
         try:
-            import duckdb
-            
-            # Get existing data from DuckDB
-            existing_months = set()
-            
-            try:
-                con = duckdb.connect('bristol_gate.duckdb', read_only=True)
-                existing_data = con.execute(
-                    "SELECT date FROM stg_occ WHERE symbol = 'OCC'"
-                ).fetchdf()
-                con.close()
-                
-                if len(existing_data) > 0:
-                    existing_data['date'] = pd.to_datetime(existing_data['date'])
-                    existing_months = set(existing_data['date'].dt.to_period('M').astype(str))
-                    
-            except Exception as db_error:
-                self.logger.warning(f"⚠️ Could not access DuckDB for recent months check: {db_error}")
+            # Existing months from DuckDB (an unreadable table counts as no data)
+            existing_months = self._get_existing_months() or set()
             
             # Generate recent months to check
             current_date = datetime.now()
@@ -8,6 +8,7 @@ Refactored to use BaseDataFetcher and utility classes to eliminate code duplicat
 """
 
 import pandas as pd
+import numpy as np
 import os
 from datetime import datetime
 from typing import Optional
@@ -18,6 +19,14 @@ from ..utils.web_scraping_utils import WebScrapingUtils
 from ..utils.file_download_utils import FileDownloadUtils
 from ..utils.excel_processing_utils import ExcelProcessingUtils
 from ..utils.transform_utils import DataTransformUtils
+from ..utils.cache_utils import ParquetCacheUtils
+
+# Metrics kept in the final output (published as SILVERBLATT_<metric>)
+KEEP_METRICS = frozenset([
+    'op_earnings_per_share', 'ar_earnings_per_share', 'cash_dividends_per_share',
+    'sales_per_share', 'book_value_per_share', 'capex_per_share',
+    'op_earnings_pe', 'ar_earnings_pe', 'op_earnings_ttm', 'ar_earnings_ttm'
+])
 
 
 class SP500Fetcher(BaseDataFetcher):
@@ -28,12 +37,15 @@ class SP500Fetcher(BaseDataFetcher):
     utilities to fetch and standardize S&P 500 Silverblatt data.
     """
     
-    def __init__(self, download_dir: str = "data/sp500"):
+    def __init__(self, download_dir: str = "data/sp500", driver=None, use_selenium: bool = False):
         """
         Initialize S&P 500 fetcher.
         
         Args:
             download_dir: Directory for downloaded files
+            driver: Optional Selenium WebDriver to reuse (defaults to the shared driver)
+            use_selenium: Always download through a browser instead of trying a
+                plain HTTP request first
         """
         super().__init__("sp500")
         
@@ -42,8 +54,11 @@ class SP500Fetcher(BaseDataFetcher):
         self.file_downloader = FileDownloadUtils(download_dir)
         self.excel_processor = ExcelProcessingUtils()
         self.data_transformer = DataTransformUtils()
+        self.cache = ParquetCacheUtils()
         
         self.download_dir = download_dir
+        self.driver = driver
+        self.use_selenium = use_selenium
         
         # S&P 500 specific configuration
         self.sp500_url = "https://www.spglobal.com/spdji/en/documents/additional-material/sp-500-eps-est.xlsx"
@@ -78,9 +93,21 @@ class SP500Fetcher(BaseDataFetcher):
         """
         Fetch S&P 500 earnings and estimates data.
         
+        The standardized result is cached as Parquet for the current day, so
+        repeated runs skip the download and Excel parse.
+        
         Args:
             symbols_df: Not used for S&P 500 (optional for compatibility)
             
+        Returns:
+            DataFrame with standardized S&P 500 data
+        """
+        return self.cache.get_or_build(self.sp500_url, self._download_and_process)
+    
+    def _download_and_process(self) -> pd.DataFrame:
+        """
+        Download, parse and standardize the S&P 500 file (uncached).
+        
         Returns:
             DataFrame with standardized S&P 500 data
         """
@@ -121,47 +148,92 @@ class SP500Fetcher(BaseDataFetcher):
         return pd.DataFrame()
     
     def _download_sp500_file(self) -> Optional[str]:
+        """
+        Download S&P 500 Excel file, over plain HTTP first.
+        
+        Returns:
+            Path to downloaded file or None if failed
+        """
+        if not self.use_selenium:
+            downloaded_file = self._download_sp500_file_http()
+            if downloaded_file:
+                return downloaded_file
+        
+        # Fall back to a browser when the site does not serve the file to plain requests
+        return self._download_sp500_file_selenium()
+    
+    def _download_sp500_file_http(self) -> Optional[str]:
+        """
+        Download S&P 500 Excel file with the shared HTTP session (no browser).
+        
+        The referer page is visited first so the session carries its cookies, then
+        the workbook is streamed to disk with the referer header set.
+        
+        Returns:
+            Path to downloaded file or None if failed (or not an Excel workbook)
+        """
+        try:
+            self.logger.info(f"Visiting referer page: {self.referer_url}")
+            self.file_downloader.get_session().get(self.referer_url, timeout=30)
+        except Exception as e:
+            self.logger.debug(f"Referer page request failed: {e}")
+        
+        downloaded_file = self.file_downloader.download_file_from_url(
+            url=self.sp500_url,
+            download_dir=self.download_dir,
+            filename=self.filename,
+            headers={"Referer": self.referer_url},
+            conditional=True
+        )
+        if not downloaded_file:
+            return None
+        
+        # Bot protection answers with an HTML page instead of the .xlsx (a ZIP container)
+        with open(downloaded_file, 'rb') as f:
+            if f.read(2) != b'PK':
+                self.logger.warning("HTTP download did not return an Excel workbook, falling back to Selenium")
+                os.remove(downloaded_file)
+                return None
+        
+        return downloaded_file
+    
+    def _download_sp500_file_selenium(self) -> Optional[str]:
         """
         Download S&P 500 Excel file using web scraping to establish session.
         
         Returns:
             Path to downloaded file or None if failed
         """
-        driver = None
         try:
-            # Setup web driver using utility class
-            driver = self.web_scraper.setup_chrome_driver(
+            # Reuse the caller's driver or lease the shared one (Chrome starts once per run)
+            with self.web_scraper.lease_driver(
                 download_dir=self.download_dir,
+                driver=self.driver,
                 headless=True
-            )
-            
-            # First, visit the referer page to establish session
-            self.logger.info(f"Visiting referer page: {self.referer_url}")
-            driver.get(self.referer_url)
-            
-            # Use utility method to wait for page load
-            if not self.web_scraper.wait_for_page_load(driver, timeout=10):
-                self.logger.warning("Referer page load incomplete, continuing...")
-            
-            # Now navigate to the download URL
-            self.logger.info(f"Downloading Excel file from: {self.sp500_url}")
-            driver.get(self.sp500_url)
-            
-            # Wait for download completion using utility method
-            downloaded_file = self.file_downloader.wait_for_download_completion(
-                timeout=15,
-                file_extension=".xlsx"
-            )
-            
-            return downloaded_file
+            ) as driver:
+                # First, visit the referer page to establish session
+                self.logger.info(f"Visiting referer page: {self.referer_url}")
+                driver.get(self.referer_url)
+                
+                # Use utility method to wait for page load
+                if not self.web_scraper.wait_for_page_load(driver, timeout=10):
+                    self.logger.warning("Referer page load incomplete, continuing...")
+                
+                # Now navigate to the download URL
+                self.logger.info(f"Downloading Excel file from: {self.sp500_url}")
+                driver.get(self.sp500_url)
+                
+                # Wait for download completion using utility method
+                downloaded_file = self.file_downloader.wait_for_download_completion(
+                    timeout=15,
+                    file_extension=".xlsx"
+                )
+                
+                return downloaded_file
             
         except Exception as e:
             self.logger.error(f"Error downloading S&P 500 file: {str(e)}")
             return None
-            
-        finally:
-            if driver:
-                driver.quit()
     
     def _process_sp500_excel(self, file_path: str) -> pd.DataFrame:
         """
@@ -176,11 +248,14 @@ class SP500Fetcher(BaseDataFetcher):
         try:
             self.logger.info(f"Processing Excel file: {file_path}")
             
-            # Process quarterly data
-            quarterly_data = self._process_quarterly_sheet(file_path)
-            
-            # Process estimates data
-            estimates_data = self._process_estimates_sheet(file_path)
+            # Open the workbook once; both sheets are parsed from the same handle instead of
+            # re-reading the ZIP container and shared strings per sheet
+            with self.excel_processor.open_workbook(file_path) as workbook:
+                # Process quarterly data
+                quarterly_data = self._process_quarterly_sheet(workbook)
+                
+                # Process estimates data
+                estimates_data = self._process_estimates_sheet(workbook)
             
             # Combine both datasets
             combined_data = self._combine_and_finalize_data(quarterly_data, estimates_data)
@@ -191,7 +266,7 @@ class SP500Fetcher(BaseDataFetcher):
             self.logger.error(f"Error processing S&P 500 Excel file: {str(e)}")
             return pd.DataFrame()
     
-    def _process_quarterly_sheet(self, file_path: str) -> pd.DataFrame:
+    def _process_quarterly_sheet(self, workbook: pd.ExcelFile) -> pd.DataFrame:
         """Process the quarterly data sheet."""
         try:
             # Column names for quarterly data
@@ -201,22 +276,28 @@ class SP500Fetcher(BaseDataFetcher):
                 "capex_per_share", "price", "divisor"
             ]
             
-            # Read quarterly data using utility class
+            # Read quarterly data from the shared workbook handle, parsing only the named columns
             df_quarterly = self.excel_processor.read_excel_file(
-                file_path=file_path,
+                file_path=workbook,
                 sheet_name="QUARTERLY DATA",
                 skip_rows=5,
-                column_names=column_names
+                column_names=column_names,
+                usecols=list(range(len(column_names)))
             )
             
             if df_quarterly.empty:
                 self.logger.warning("Quarterly data sheet is empty")
                 return pd.DataFrame()
             
-            # Transform using utility method
-            df_quarterly_melted = self.data_transformer.melt_to_long_format(
+            # Convert the date column once on the wide sheet (not once per stacked metric);
+            # blank/footer rows are dropped first, as stacking would have dropped them anyway
+            df_quarterly = df_quarterly.dropna(subset=column_names[1:], how='all')
+            df_quarterly['date'] = pd.to_datetime(df_quarterly['date']).dt.date
+            
+            # Transform using utility method (values are coerced to numeric while stacking)
+            df_quarterly_melted = self.data_transformer.wide_to_long_fast(
                 df=df_quarterly,
-                id_vars=['date'],
+                id_col='date',
                 value_vars=[
                     'op_earnings_per_share', 'ar_earnings_per_share',
                     'cash_dividends_per_share', 'sales_per_share',
@@ -226,15 +307,6 @@ class SP500Fetcher(BaseDataFetcher):
                 value_name='value'
             )
             
-            # Convert values to numeric using utility method
-            df_quarterly_melted = self.data_transformer.standardize_numeric_columns(
-                df_quarterly_melted, 
-                ['value']
-            )
-            
-            # Convert date column
-            df_quarterly_melted['date'] = pd.to_datetime(df_quarterly_melted['date']).dt.date
-            
             self.logger.info(f"Processed quarterly data: {len(df_quarterly_melted)} rows")
             return df_quarterly_melted
             
@@ -242,12 +314,12 @@ class SP500Fetcher(BaseDataFetcher):
             self.logger.error(f"Error processing quarterly sheet: {str(e)}")
             return pd.DataFrame()
     
-    def _process_estimates_sheet(self, file_path: str) -> pd.DataFrame:
+    def _process_estimates_sheet(self, workbook: pd.ExcelFile) -> pd.DataFrame:
         """Process the estimates & PEs sheet."""
         try:
             # Read raw estimates data
             df_estimates_raw = self.excel_processor.read_excel_file(
-                file_path=file_path,
+                file_path=workbook,
                 sheet_name="ESTIMATES&PEs",
                 skip_rows=0
             )
@@ -263,15 +335,15 @@ class SP500Fetcher(BaseDataFetcher):
             # Get data after ACTUALS row
             df_estimates = df_estimates_raw.iloc[actuals_row + 1:].copy().reset_index(drop=True)
             
-            # Filter valid date rows
-            valid_date_mask = df_estimates.iloc[:, 0].apply(self._is_valid_date)
-            df_estimates = df_estimates[valid_date_mask].copy().reset_index(drop=True)
+            # Parse the first column once; rows that are not dates become NaT and are dropped.
+            # Text cells are stripped and Excel datetime cells are passed through as-is;
+            # numeric footnote/number cells are never parsed (they would read as 1970 epochs)
+            parsed_dates = self.data_transformer.parse_date_cells(df_estimates.iloc[:, 0])
+            valid_date_mask = parsed_dates.notna()
+            df_estimates = df_estimates.loc[valid_date_mask].copy().reset_index(drop=True)
             
             # Convert first column to date
-            df_estimates.iloc[:, 0] = pd.to_datetime(
-                df_estimates.iloc[:, 0].astype(str).str.strip(), 
-                format='mixed'
-            ).dt.date
+            df_estimates.iloc[:, 0] = parsed_dates[valid_date_mask].dt.date.to_numpy()
             
             # Remove empty columns
             df_estimates = df_estimates.dropna(axis=1, how='all')
@@ -286,21 +358,15 @@ class SP500Fetcher(BaseDataFetcher):
             num_cols = len(df_estimates.columns)
             df_estimates.columns = estimates_column_names[:num_cols]
             
-            # Transform using utility method
-            df_estimates_melted = self.data_transformer.melt_to_long_format(
+            # Transform using utility method (values are coerced to numeric while stacking)
+            df_estimates_melted = self.data_transformer.wide_to_long_fast(
                 df=df_estimates,
-                id_vars=['date'],
+                id_col='date',
                 value_vars=[col for col in df_estimates.columns if col != 'date'],
                 var_name='metric',
                 value_name='value'
             )
             
-            # Convert values to numeric using utility method
-            df_estimates_melted = self.data_transformer.standardize_numeric_columns(
-                df_estimates_melted,
-                ['value']
-            )
-            
             self.logger.info(f"Processed estimates data: {len(df_estimates_melted)} rows")
             return df_estimates_melted
             
@@ -313,35 +379,39 @@ class SP500Fetcher(BaseDataFetcher):
         """Combine and finalize the S&P 500 data."""
         try:
             # Combine datasets
-            df_combined = pd.concat([quarterly_data, estimates_data], ignore_index=True)
+            df_combined = self.concat_with_shared_categories([quarterly_data, estimates_data])
             
             if df_combined.empty:
                 self.logger.error("Combined dataset is empty")
                 return pd.DataFrame()
             
-            # Final numeric conversion using utility method
-            df_combined = self.data_transformer.standardize_numeric_columns(df_combined, ['value'])
-            
-            # Clean data using utility method
+            # Validate columns (both sheets are stacked as float with NaN values masked out)
             df_combined = self.data_transformer.clean_and_validate_data(
                 df_combined,
-                required_columns=['date', 'value']
+                required_columns=['date', 'value'],
+                drop_na_columns=[]
             )
             
-            # Sort by date descending
-            df_combined = df_combined.sort_values('date', ascending=False)
-            
-            # Filter to keep only desired symbols
-            keep_symbols = [
-                'op_earnings_per_share', 'ar_earnings_per_share', 'cash_dividends_per_share',
-                'sales_per_share', 'book_value_per_share', 'capex_per_share',
-                'op_earnings_pe', 'ar_earnings_pe', 'op_earnings_ttm', 'ar_earnings_ttm'
-            ]
-            
-            df_combined = df_combined[df_combined['metric'].isin(keep_symbols)]
-            
-            # Add symbol column with SILVERBLATT_ prefix
-            df_combined['symbol'] = 'SILVERBLATT_' + df_combined['metric']
+            # Filter to keep only desired symbols before sorting. As a Categorical, the
+            # membership test runs once per category and rows are selected by code
+            metric = df_combined['metric'].astype('category')
+            keep_codes = np.flatnonzero(metric.cat.categories.isin(KEEP_METRICS))
+            keep_mask = np.isin(metric.cat.codes.to_numpy(), keep_codes)
+            df_combined = df_combined.loc[keep_mask].copy()
+            df_combined['metric'] = metric[keep_mask].cat.remove_unused_categories()
+            
+            # Sort by date descending: one stable int64 lexsort instead of comparing date objects.
+            # NaT is INT64_MIN (negating it overflows), so missing dates are keyed separately
+            # and placed last, as sort_values(ascending=False) does
+            dates = pd.to_datetime(df_combined['date']).to_numpy(dtype='datetime64[ns]')
+            order = np.lexsort((-dates.view('i8'), np.isnat(dates)))
+            df_combined = df_combined.iloc[order]
+            
+            # Add symbol column with SILVERBLATT_ prefix (one Categorical shared by metric and symbol,
+            # renaming the categories instead of concatenating strings per row)
+            df_combined['symbol'] = df_combined['metric'].cat.rename_categories(
+                lambda metric: f'SILVERBLATT_{metric}'
+            )
             
             # Standardize column order using utility method
             df_combined = self.data_transformer.standardize_column_order(
@@ -349,38 +419,33 @@ class SP500Fetcher(BaseDataFetcher):
                 expected_order=['date', 'symbol', 'metric', 'value']
             )
             
+            # Downcast values to float32
+            df_combined = self.downcast_numeric_columns(df_combined)
+            
             self.logger.info(f"Final S&P 500 data: {len(df_combined)} rows")
-            self.logger.info(f"Unique symbols: {len(df_combined['symbol'].unique())}")
+            self.logger.info(f"Unique symbols: {len(df_combined['symbol'].cat.categories)}")
             
             return df_combined
             
         except Exception as e:
             self.logger.error(f"Error combining and finalizing data: {str(e)}")
             return pd.DataFrame()
-    
-    def _is_valid_date(self, date_str) -> bool:
-        """Check if a string can be converted to datetime."""
-        try:
-            if pd.isna(date_str):
-                return False
-            pd.to_datetime(str(date_str).strip(), format='mixed')
-            return True
-        except:
-            return False
 
 
 # Legacy function wrappers for backward compatibility
 def get_sp500_data(
     sp500_url: str = "https://www.spglobal.com/spdji/en/documents/additional-material/sp-500-eps-est.xlsx",
     referer_url: str = "https://www.spglobal.com/spdji/en/indices/equity/sp-500/",
-    download_dir: str = "data/sp500"
+    download_dir: str = "data/sp500",
+    driver=None,
+    use_selenium: bool = False
 ) -> pd.DataFrame:
     """
     Legacy wrapper for backward compatibility.
     
     DEPRECATED: Use SP500Fetcher.fetch_batch() instead.
     """
-    fetcher = SP500Fetcher(download_dir)
+    fetcher = SP500Fetcher(download_dir, driver=driver, use_selenium=use_selenium)
     return fetcher.fetch_batch()
 
 
@@ -9,19 +9,24 @@ Refactored to use BaseDataFetcher and utility classes to eliminate code duplicat
 
 import pandas as pd
 import os
+import logging
 from datetime import datetime
 from typing import Optional
 import re
 import traceback
-import requests
-from urllib.parse import urlparse, unquote
-from selenium.webdriver.common.by import By
+import lxml.html
+from urllib.parse import urlparse, unquote, urljoin
 
 from ..core.base_fetcher import BaseDataFetcher
 from ..utils.web_scraping_utils import WebScrapingUtils
 from ..utils.file_download_utils import FileDownloadUtils
 from ..utils.excel_processing_utils import ExcelProcessingUtils
 from ..utils.transform_utils import DataTransformUtils
+from ..utils.cache_utils import ParquetCacheUtils
+
+# Year header cells (e.g. '2023', '2024F') and the year embedded in a header cell
+_YEAR_HEADER_RE = re.compile(r'(19\d{2}|20\d{2})[A-Z]?\b')
+_YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})[A-Z]?\b')
 
 
 class USDAFetcher(BaseDataFetcher):
@@ -32,12 +37,18 @@ class USDAFetcher(BaseDataFetcher):
     utilities to fetch and standardize USDA agricultural data.
     """
     
-    def __init__(self, download_dir: str = "data/usda"):
+    def __init__(self, download_dir: str = "data/usda", driver=None, use_selenium: bool = False,
+                 persist_downloads: bool = True):
         """
         Initialize USDA fetcher.
         
         Args:
             download_dir: Directory for downloaded files
+            driver: Optional Selenium WebDriver to reuse (defaults to the shared driver)
+            use_selenium: Always find the download link with a browser instead of
+                parsing the page HTML first
+            persist_downloads: Save the workbook to download_dir (enables conditional
+                re-downloads); if False it is parsed from memory
         """
         super().__init__("usda")
         
@@ -46,8 +57,12 @@ class USDAFetcher(BaseDataFetcher):
         self.file_downloader = FileDownloadUtils(download_dir)
         self.excel_processor = ExcelProcessingUtils()
         self.data_transformer = DataTransformUtils()
+        self.cache = ParquetCacheUtils()
         
         self.download_dir = download_dir
+        self.driver = driver
+        self.use_selenium = use_selenium
+        self.persist_downloads = persist_downloads
         
         # USDA specific configuration - defaults for net farm income
         self.default_url = "https://www.ers.usda.gov/data-products/farm-income-and-wealth-statistics/data-files-us-and-state-level-farm-income-and-wealth-statistics/"
@@ -84,13 +99,17 @@ class USDAFetcher(BaseDataFetcher):
         """
         Fetch USDA farm income data.
         
+        The standardized result is cached as Parquet for the current day, so
+        repeated runs skip the page scrape, download and Excel parse.
+        
         Args:
             symbols_df: Not used for USDA (optional for compatibility)
             
         Returns:
             DataFrame with standardized USDA data
         """
-        return self.get_usda_ers_data()
+        cache_key = f"{self.default_url}|{self.default_link_text}|{self.default_symbol_name}"
+        return self.cache.get_or_build(cache_key, self.get_usda_ers_data)
     
     def get_usda_ers_data(self,
                          usda_page_url: Optional[str] = None,
@@ -158,7 +177,7 @@ class USDAFetcher(BaseDataFetcher):
     
     def _download_usda_file(self, page_url: str, link_text: str) -> Optional[str]:
         """
-        Download USDA Excel file using web scraping.
+        Download USDA Excel file, finding the link over plain HTTP first.
         
         Args:
             page_url: URL of the USDA page
@@ -167,46 +186,93 @@ class USDAFetcher(BaseDataFetcher):
         Returns:
             Path to downloaded file or None if failed
         """
-        driver = None
-        try:
-            # Setup web driver using utility class
-            driver = self.web_scraper.setup_chrome_driver(
-                download_dir=self.download_dir,
-                headless=True
-            )
+        download_url = None
+        if not self.use_selenium:
+            download_url = self._find_usda_download_link_http(page_url, link_text)
+        
+        # Fall back to a browser when the page HTML does not expose the link
+        if not download_url:
+            download_url = self._find_usda_download_link_selenium(page_url, link_text)
+        
+        if not download_url:
+            self.logger.error("Could not find USDA download link")
+            return None
+        
+        # Download file directly over HTTP
+        return self._download_file_direct(download_url)
+    
+    def _find_usda_download_link_http(self, page_url: str, link_text: str) -> Optional[str]:
+        """
+        Find the USDA download link by parsing the page HTML without a browser.
+        
+        Args:
+            page_url: URL of the USDA page
+            link_text: Text to search for in links
             
-            # Navigate to USDA page
-            self.logger.info(f"Navigating to USDA page: {page_url}")
-            driver.get(page_url)
+        Returns:
+            Download URL or None if not found
+        """
+        try:
+            self.logger.info(f"Fetching USDA page: {page_url}")
+            response = self.file_downloader.get_session().get(page_url, timeout=30)
+            response.raise_for_status()
             
-            # Use utility method to wait and check access
-            if not self.web_scraper.wait_for_page_load(driver, timeout=10):
-                self.logger.error("Page failed to load properly")
-                return None
+            tree = lxml.html.fromstring(response.content)
+            search_text = self.web_scraper.xpath_literal(link_text.lower())
+            hrefs = tree.xpath(
+                "//a[contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+                f"'abcdefghijklmnopqrstuvwxyz'), {search_text})]/@href"
+            )
             
-            # Check for access denied
-            if "Access Denied" in driver.page_source or "Forbidden" in driver.page_source:
-                self.logger.error("Access denied to USDA website")
-                return None
+            for href in hrefs:
+                download_url = urljoin(page_url, href.strip())
+                if download_url.endswith(".xlsx") or download_url.endswith(".xls"):
+                    self.logger.info(f"Found matching download link: {download_url}")
+                    return download_url
             
-            # Find download link
-            download_url = self._find_usda_download_link(driver, link_text)
+            self.logger.warning(f"No Excel link containing '{link_text}' found in page HTML")
+            return None
             
-            if not download_url:
-                self.logger.error("Could not find USDA download link")
-                return None
+        except Exception as e:
+            self.logger.warning(f"Could not find USDA download link via HTTP: {str(e)}")
+            return None
+    
+    def _find_usda_download_link_selenium(self, page_url: str, link_text: str) -> Optional[str]:
+        """
+        Find the USDA download link by rendering the page in Chrome.
+        
+        Args:
+            page_url: URL of the USDA page
+            link_text: Text to identify download link
             
-            # Download file directly using requests
-            downloaded_file = self._download_file_direct(download_url)
-            return downloaded_file
+        Returns:
+            Download URL or None if not found
+        """
+        try:
+            # Reuse the caller's driver or lease the shared one (Chrome starts once per run)
+            with self.web_scraper.lease_driver(
+                download_dir=self.download_dir,
+                driver=self.driver,
+                headless=True
+            ) as driver:
+                # Navigate to USDA page
+                self.logger.info(f"Navigating to USDA page: {page_url}")
+                driver.get(page_url)
+                
+                # Wait for the target anchor itself rather than the full page load
+                if self.web_scraper.wait_for_link_by_text(driver, link_text, timeout=15, case_sensitive=False) is None:
+                    # Check for access denied
+                    if "Access Denied" in driver.page_source or "Forbidden" in driver.page_source:
+                        self.logger.error("Access denied to USDA website")
+                    else:
+                        self.logger.error(f"No link containing '{link_text}' appeared on the USDA page")
+                    return None
+                
+                return self._find_usda_download_link(driver, link_text)
             
         except Exception as e:
-            self.logger.error(f"Error downloading USDA file: {str(e)}")
+            self.logger.error(f"Error finding USDA download link via Selenium: {str(e)}")
             return None
-            
-        finally:
-            if driver:
-                driver.quit()
     
     def _find_usda_download_link(self, driver, link_text: str) -> Optional[str]:
         """
@@ -221,21 +287,16 @@ class USDAFetcher(BaseDataFetcher):
         """
         try:
             self.logger.info("Searching for USDA download links...")
-            all_links = driver.find_elements(By.TAG_NAME, "a")
+            all_links = self.web_scraper.collect_links(driver)
             
             self.logger.info(f"Found {len(all_links)} links. Searching for '{link_text}'")
             
-            for link_element in all_links:
-                try:
-                    link_text_content = link_element.text.strip()
-                    href_content = link_element.get_attribute("href")
-                    
-                    if link_text.lower() in link_text_content.lower():
-                        if href_content and (href_content.endswith(".xlsx") or href_content.endswith(".xls")):
-                            self.logger.info(f"Found matching download link: {href_content}")
-                            return href_content
-                except:
-                    continue
+            for link in all_links:
+                href_content = link['href']
+                if link_text.lower() in link['text'].lower():
+                    if href_content and (href_content.endswith(".xlsx") or href_content.endswith(".xls")):
+                        self.logger.info(f"Found matching download link: {href_content}")
+                        return href_content
             
             self.logger.error(f"Could not find download link containing '{link_text}'")
             return None
@@ -246,47 +307,34 @@ class USDAFetcher(BaseDataFetcher):
     
     def _download_file_direct(self, download_url: str) -> Optional[str]:
         """
-        Download file directly using requests.
+        Download file directly over HTTP (no browser).
         
         Args:
             download_url: URL to download from
             
         Returns:
-            Path to downloaded file or None if failed
+            Path to downloaded file (in-memory buffer if persist_downloads is False),
+            or None if failed
         """
-        try:
-            self.logger.info(f"Downloading file from: {download_url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36'
-            }
-            
-            response = requests.get(download_url, headers=headers, stream=True, timeout=60)
-            response.raise_for_status()
-            
-            # Get filename from URL
-            parsed_url = urlparse(download_url)
-            filename = os.path.basename(unquote(parsed_url.path))
-            
-            if not filename or not (filename.endswith(".xlsx") or filename.endswith(".xls")):
-                filename = "usda_downloaded_data.xlsx"
-            
-            # Save file
-            file_path = os.path.join(self.download_dir, filename)
-            
-            # Ensure download directory exists
-            os.makedirs(self.download_dir, exist_ok=True)
-            
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            self.logger.info(f"File downloaded successfully to: {file_path}")
-            return file_path
-            
-        except Exception as e:
-            self.logger.error(f"Error downloading file: {str(e)}")
-            return None
+        if not self.persist_downloads:
+            # Parse straight from memory; no file is written or re-read
+            return self.file_downloader.download_to_buffer(download_url, timeout=60)
+        
+        # Get filename from URL
+        parsed_url = urlparse(download_url)
+        filename = os.path.basename(unquote(parsed_url.path))
+        
+        if not filename or not (filename.endswith(".xlsx") or filename.endswith(".xls")):
+            filename = "usda_downloaded_data.xlsx"
+        
+        # Streamed download over the shared keep-alive session; unchanged files are reused
+        return self.file_downloader.download_file_from_url(
+            url=download_url,
+            download_dir=self.download_dir,
+            filename=filename,
+            timeout=60,
+            conditional=True
+        )
     
     def _process_usda_excel(self, file_path: str, sheet_name: str, 
                            metric_pattern: str, symbol_name: str) -> pd.DataFrame:
@@ -305,13 +353,16 @@ class USDAFetcher(BaseDataFetcher):
         try:
             self.logger.info(f"Processing Excel file: {file_path}")
             
-            # Read Excel file using utility class
-            df_full = self.excel_processor.read_excel_file(
-                file_path=file_path,
-                sheet_name=sheet_name,
-                skip_rows=0,
-                header=None
-            )
+            # Stream the sheet and keep only the year header and metric rows; the whole
+            # sheet is read into a DataFrame only if the scan cannot find them
+            df_full = self._scan_usda_sheet(file_path, sheet_name, metric_pattern)
+            if df_full is None:
+                df_full = self.excel_processor.read_excel_file(
+                    file_path=file_path,
+                    sheet_name=sheet_name,
+                    skip_rows=0,
+                    header=None
+                )
             
             if df_full.empty:
                 self.logger.error("Excel file is empty or could not be read")
@@ -351,78 +402,121 @@ class USDAFetcher(BaseDataFetcher):
             traceback.print_exc()
             return pd.DataFrame()
     
+    def _scan_usda_sheet(self, file_path: str, sheet_name: str,
+                         metric_pattern: str) -> Optional[pd.DataFrame]:
+        """
+        Stream the sheet row by row until the year header and target metric rows are found.
+        
+        Applies the same rules as _find_year_header_row and _find_metric_row, so the
+        returned frame can go through the regular parsing steps.
+        
+        Args:
+            file_path: Path to Excel file (or in-memory buffer)
+            sheet_name: Sheet name to scan
+            metric_pattern: Regex pattern for target metric
+            
+        Returns:
+            DataFrame holding just those two rows (in sheet order), or None if
+            the scan failed
+        """
+        metric_re = re.compile(metric_pattern, re.IGNORECASE)
+        exclude_cash = "net farm income" in metric_pattern.lower() and "cash" not in metric_pattern.lower()
+        found_rows = {}
+        header_index = metric_index = None
+        
+        try:
+            for i, row in enumerate(self.excel_processor.iter_sheet_rows(file_path, sheet_name)):
+                if not row:
+                    continue
+                
+                if header_index is None:
+                    year_cells = sum(
+                        1 for cell in row[1:]
+                        if cell is not None and _YEAR_HEADER_RE.fullmatch(str(cell).strip())
+                    )
+                    if year_cells > 3:
+                        header_index = i
+                        found_rows[i] = row
+                
+                if metric_index is None and row[0] is not None:
+                    label = str(row[0]).strip()
+                    if metric_re.search(label) and not (exclude_cash and 'cash' in label.lower()):
+                        metric_index = i
+                        found_rows[i] = row
+                
+                if header_index is not None and metric_index is not None:
+                    break
+        except Exception as e:
+            self.logger.warning(f"Could not stream sheet {sheet_name!r}: {e}")
+            return None
+        
+        if header_index is None or metric_index is None:
+            self.logger.warning("Year header or metric row not found while streaming, reading full sheet")
+            return None
+        
+        self.logger.info(f"Found year header (row {header_index}) and metric (row {metric_index}) "
+                         f"after streaming {max(found_rows) + 1} rows")
+        # Positional index (0, 1): the parsing helpers address rows and columns by position
+        return pd.DataFrame([list(found_rows[i]) for i in sorted(found_rows)], dtype=object)
+    
     def _find_year_header_row(self, df_full: pd.DataFrame) -> Optional[tuple]:
         """Find the year header row in the USDA data."""
-        def is_potential_year_header(val):
-            if pd.isna(val): 
-                return False
-            s_val = str(val).strip()
-            return bool(re.fullmatch(r'(19\d{2}|20\d{2})[A-Z]?\b', s_val))
-        
-        for i, row_series in df_full.iterrows():
-            potential_year_cells_count = 0
-            first_year_col_in_row = -1
-            
-            for col_idx, cell_val in enumerate(row_series.iloc[1:]):
-                if is_potential_year_header(cell_val):
-                    potential_year_cells_count += 1
-                    if first_year_col_in_row == -1:
-                        first_year_col_in_row = col_idx + 1
-            
-            if potential_year_cells_count > 3:
-                self.logger.info(f"Found year header row at index: {i}, data starts at column: {first_year_col_in_row}")
-                return (i, first_year_col_in_row)
+        # Stack the non-empty data cells (the sheet is mostly blank) and match them all in
+        # one regex pass, instead of matching every cell column by column
+        cells = df_full.iloc[:, 1:].stack().dropna()
+        is_year_cell = cells.astype('string').str.strip().str.fullmatch(_YEAR_HEADER_RE, na=False)
+        year_cells = is_year_cell[is_year_cell.to_numpy()]
+        year_cells_per_row = year_cells.groupby(level=0, sort=True).size()
+        header_rows = year_cells_per_row.index[year_cells_per_row.to_numpy() > 3]
+        
+        if header_rows.empty:
+            self.logger.error("Could not find year header row")
+            return None
         
-        self.logger.error("Could not find year header row")
-        return None
+        i = header_rows[0]
+        first_year_col_in_row = df_full.columns.get_loc(year_cells.loc[i].index[0])
+        self.logger.info(f"Found year header row at index: {i}, data starts at column: {first_year_col_in_row}")
+        return (i, first_year_col_in_row)
     
     def _extract_years(self, df_full: pd.DataFrame, year_header_row_index: int, 
                       year_data_start_col_index: int) -> pd.Series:
         """Extract and parse years from the header row."""
         year_header_values_raw = df_full.iloc[year_header_row_index, year_data_start_col_index:]
         
-        def extract_year_int(value):
-            if pd.isna(value): 
-                return pd.NA
-            s_value = str(value).strip()
-            if 'change' in s_value.lower():
-                return pd.NA
-            
-            match = re.search(r'\b(19\d{2}|20\d{2})[A-Z]?\b', s_value)
-            if match:
-                return int(match.group(1))
-            return pd.NA
+        header_cells = year_header_values_raw.astype('string').str.strip()
+        years = header_cells.str.extract(_YEAR_RE, expand=False)
         
-        parsed_years_series = year_header_values_raw.apply(extract_year_int).dropna().astype('Int64')
+        # Skip "change" columns (e.g. "2023-2024 change")
+        years = years.where(~header_cells.str.contains('change', case=False, regex=False, na=False))
+        parsed_years_series = pd.to_numeric(years, errors='coerce').dropna().astype('Int64')
         
         if parsed_years_series.empty:
             self.logger.error("No valid years found in header row")
             return pd.Series()
         
-        self.logger.info(f"Parsed {len(parsed_years_series)} years: {parsed_years_series.tolist()}")
+        self.logger.info(f"Parsed {len(parsed_years_series)} years")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Parsed years: {parsed_years_series.tolist()}")
         return parsed_years_series
     
     def _find_metric_row(self, df_full: pd.DataFrame, metric_pattern: str) -> Optional[tuple]:
         """Find the target metric row."""
-        for i, row_series in df_full.iterrows():
-            if row_series.empty or len(row_series) == 0:
-                continue
-                
-            first_cell_val_str = str(row_series.iloc[0]).strip()
-            
-            is_target_metric_base = re.search(metric_pattern, first_cell_val_str, re.IGNORECASE)
-            if is_target_metric_base:
-                # Special handling for "net farm income" to avoid "net cash farm income"
-                if "net farm income" in metric_pattern.lower() and \
-                   "cash" not in metric_pattern.lower() and \
-                   "cash" in first_cell_val_str.lower():
-                    continue
-                
-                self.logger.info(f"Found target metric '{first_cell_val_str}' at row {i}")
-                return (i, first_cell_val_str)
+        metric_re = re.compile(metric_pattern, re.IGNORECASE)
+        first_cells = df_full.iloc[:, 0].astype('string').str.strip()
+        is_target_metric = first_cells.str.contains(metric_re, na=False)
+        
+        # Special handling for "net farm income" to avoid "net cash farm income"
+        if "net farm income" in metric_pattern.lower() and "cash" not in metric_pattern.lower():
+            is_target_metric &= ~first_cells.str.contains("cash", case=False, regex=False, na=False)
         
-        self.logger.error(f"Could not find metric row for pattern: '{metric_pattern}'")
-        return None
+        if not is_target_metric.any():
+            self.logger.error(f"Could not find metric row for pattern: '{metric_pattern}'")
+            return None
+        
+        i = is_target_metric.idxmax()
+        first_cell_val_str = first_cells.loc[i]
+        self.logger.info(f"Found target metric '{first_cell_val_str}' at row {i}")
+        return (i, first_cell_val_str)
     
     def _extract_metric_values(self, df_full: pd.DataFrame, target_metric_row_index: int,
                               parsed_years: pd.Series, symbol_name: str, 
@@ -431,33 +525,31 @@ class USDAFetcher(BaseDataFetcher):
         metric_values_raw = df_full.iloc[target_metric_row_index, parsed_years.index]
         metric_values_numeric = pd.to_numeric(metric_values_raw, errors='coerce')
         
-        self.logger.info(f"Extracted raw values for '{actual_metric_name}': {metric_values_raw.tolist()}")
+        self.logger.info(f"Extracted {len(metric_values_raw)} raw values for '{actual_metric_name}'")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Raw values for '{actual_metric_name}': {metric_values_raw.tolist()}")
         
-        final_dates = pd.to_datetime(parsed_years.astype(str) + "-01-01", errors='coerce').dt.date
-        valid_data_mask = pd.notna(final_dates) & pd.notna(metric_values_numeric.values)
+        # January 1st of each year as datetime64 straight from the integers (no string parsing);
+        # parsed years are never missing, so only the values need masking
+        final_dates = (parsed_years.to_numpy(dtype='int64') - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+        valid_data_mask = metric_values_numeric.notna().to_numpy()
         
         if not valid_data_mask.any():
             self.logger.error("No valid date/value pairs found")
             return pd.DataFrame()
         
+        # Build the output once, already in standard column order (masked arrays, no reorder copy);
+        # the constant symbol/metric columns are single-category Categoricals
+        n_rows = int(valid_data_mask.sum())
         result_df = pd.DataFrame({
-            'date': final_dates[valid_data_mask],
-            'symbol': symbol_name,
-            'metric': 'value',
-            'value': metric_values_numeric.values[valid_data_mask]
-        })
+            'date': final_dates[valid_data_mask].astype(object),  # date objects, as in other fetchers
+            'symbol': self.constant_categorical(symbol_name, n_rows),
+            'metric': self.constant_categorical('value', n_rows),
+            'value': metric_values_numeric.to_numpy(dtype='float64')[valid_data_mask]
+        }, columns=['date', 'symbol', 'metric', 'value'], copy=False)
         
-        # Standardize column order using utility method
-        result_df = self.data_transformer.standardize_column_order(
-            result_df,
-            expected_order=['date', 'symbol', 'metric', 'value']
-        )
-        
-        # Clean data using utility method
-        result_df = self.data_transformer.clean_and_validate_data(
-            result_df,
-            required_columns=['date', 'symbol', 'value']
-        )
+        # Downcast values to float32
+        result_df = self.downcast_numeric_columns(result_df)
         
         self.logger.info(f"Final USDA data: {len(result_df)} rows")
         return result_df
@@ -471,14 +563,16 @@ def get_usda_ers_data(
     sheet_name_in_file: str = 'Sheet1',
     download_dir: str = "data/usda",
     symbol_name: str = "USDA_NET_FARM_INCOME",
-    headless: bool = True
+    headless: bool = True,
+    driver=None,
+    use_selenium: bool = False
 ) -> pd.DataFrame:
     """
     Legacy wrapper for backward compatibility.
     
     DEPRECATED: Use USDAFetcher.get_usda_ers_data() instead.
     """
-    fetcher = USDAFetcher(download_dir)
+    fetcher = USDAFetcher(download_dir, driver=driver, use_selenium=use_selenium)
     return fetcher.get_usda_ers_data(
         usda_page_url=usda_page_url,
         target_link_text=target_link_text_in_file,
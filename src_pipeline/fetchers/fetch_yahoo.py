@@ -41,14 +41,14 @@ class YahooFetcher(BaseDataFetcher):
         if df.empty:
             return df
         
-        # Check if we have a MultiIndex in columns and flatten if needed
+        # Check if we have a MultiIndex in columns (Price, Ticker) and flatten if needed
         if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
+            df.columns = df.columns.droplevel(1)
         
         # Reset the index to make the date a column
         df = df.reset_index()
         
-        # Rename the columns to match the desired structure
+        # Rename the columns to match the desired structure (missing keys are ignored)
         column_mapping = {
             'Date': 'date',
             'Open': 'open', 
@@ -57,17 +57,13 @@ class YahooFetcher(BaseDataFetcher):
             'Close': 'close', 
             'Volume': 'volume'
         }
-        
-        # Only rename columns that exist
-        for old_col, new_col in column_mapping.items():
-            if old_col in df.columns:
-                df.rename(columns={old_col: new_col}, inplace=True)
+        df = df.rename(columns=column_mapping)
         
         # Convert date to date format (using our date_utils pattern)
         df['date'] = pd.to_datetime(df['date']).dt.date
         
         # Add the symbol column
-        df['symbol'] = symbol
+        df['symbol'] = self.constant_categorical(symbol, len(df))
         
         # Reorder columns to put symbol after date
         expected_columns = ['date', 'symbol']
@@ -82,6 +78,13 @@ class YahooFetcher(BaseDataFetcher):
         if value_columns:
             df = df.dropna(subset=[col for col in value_columns if col in df.columns], how='all')
         
+        # Prices to float32, volume to the smallest integer type
+        df = self.downcast_numeric_columns(
+            df,
+            float_columns=[col for col in value_columns if col != 'volume'],
+            integer_columns=['volume']
+        )
+        
         return df
     
     def get_single_series(self, symbol: str, start_date: datetime, 
@@ -122,6 +125,59 @@ class YahooFetcher(BaseDataFetcher):
         # If we get here, all retries failed
         raise Exception(f"Failed to fetch Yahoo data for {symbol} after {self.max_retries} attempts")
     
+    def get_batch_series(self, symbols: List[str], start_date: datetime,
+                         end_date: datetime) -> List[pd.DataFrame]:
+        """
+        Fetch historical market data for several symbols in one yfinance download.
+        
+        Args:
+            symbols: Stock ticker symbols sharing the same date range
+            start_date: Start date for data
+            end_date: End date for data
+            
+        Returns:
+            List of standardized DataFrames, one per symbol with data
+        """
+        start_str, end_str = self.format_date_range(start_date, end_date)
+        batch_id = ', '.join(symbols)
+        
+        for attempt in range(self.max_retries):
+            try:
+                df = yf.download(symbols, start=start_str, end=end_str,
+                                 group_by='ticker', threads=True)
+                
+                if df.empty:
+                    self.logger.warning(f"No data returned for Yahoo symbols {batch_id}")
+                    return []
+                
+                results = []
+                for symbol in symbols:
+                    if isinstance(df.columns, pd.MultiIndex):
+                        if symbol not in df.columns.get_level_values(0):
+                            self.logger.warning(f"No data returned for Yahoo symbol {symbol}")
+                            continue
+                        symbol_df = df[symbol].copy()
+                    else:
+                        symbol_df = df.copy()
+                    
+                    standardized_df = self._standardize_yahoo_dataframe(symbol_df, symbol)
+                    if standardized_df.empty:
+                        self.logger.warning(f"No data returned for Yahoo symbol {symbol}")
+                        continue
+                    
+                    self.logger.info(f"Successfully fetched {len(standardized_df)} rows for Yahoo symbol {symbol}")
+                    results.append(standardized_df)
+                
+                return results
+                
+            except Exception as e:
+                if not self.handle_api_error(e, batch_id, attempt, self.max_retries):
+                    # Don't retry for certain errors
+                    return []
+        
+        # If we get here, all retries failed
+        raise Exception(f"Failed to fetch Yahoo data for {batch_id} after {self.max_retries} attempts")
+    
     def fetch_batch(self, symbols_df: pd.DataFrame) -> pd.DataFrame:
         """
         Fetch Yahoo Finance data for all symbols in the provided DataFrame.
@@ -146,33 +202,20 @@ class YahooFetcher(BaseDataFetcher):
         
         all_data = []
         end_date = datetime.now()
-        successful_fetches = 0
-        failed_fetches = 0
         
-        for idx, (_, row) in enumerate(yahoo_symbols.iterrows(), 1):
-            symbol = row['string.symbol']
-            start_date_str = row['date.series.start']
+        # One batched download per distinct start date; yfinance fetches the tickers of a
+        # batch on its own thread pool (threads=True)
+        for start_date_str, group in yahoo_symbols.groupby('date.series.start', sort=False):
+            symbols = group['string.symbol'].tolist()
             
             try:
                 start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-                
-                # Progress logging every 10 symbols (Yahoo is faster than APIs)
-                if idx % 10 == 0 or idx == total_symbols:
-                    self.logger.info(f"Progress: {idx}/{total_symbols} ({idx/total_symbols*100:.1f}%) - "
-                                   f"Successful: {successful_fetches}, Failed: {failed_fetches}")
-                
-                data = self.get_single_series(symbol, start_date, end_date)
-                
-                if not data.empty:
-                    all_data.append(data)
-                    successful_fetches += 1
-                else:
-                    failed_fetches += 1
-                    
+                all_data.extend(self.get_batch_series(symbols, start_date, end_date))
             except Exception as e:
-                self.logger.error(f"Error processing Yahoo symbol {symbol}: {str(e)}")
-                failed_fetches += 1
+                self.logger.error(f"Error processing Yahoo symbols {symbols}: {str(e)}")
                 continue
+            
+            self.logger.info(f"Progress: {len(all_data)}/{total_symbols} symbols fetched")
         
         # Use base class summary logging
         return self.log_collection_summary(all_data, total_symbols)
@@ -10,6 +10,7 @@ from datetime import datetime
 import logging
 from typing import Dict
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Import individual fetch functions
 from ..fetchers.fetch_yahoo import fetch_yahoo
@@ -287,61 +288,71 @@ class DataCollectionPipeline:
                 logger.error(f"❌ Error collecting FINRA data: {str(e)}")
                 raise Exception(f"FINRA collection failed: {str(e)}")
         
-        # S&P 500 data
-        logger.info("=" * 50)
-        logger.info("COLLECTING S&P 500 DATA")
-        logger.info("=" * 50)
-        
-        if not self._is_source_allowed('sp500'):
-            logger.info("🚫 S&P 500 data collection SKIPPED (not in allowed sources)")
-        else:
-            try:
-                sp500_data = fetch_sp500()
-                
-                if not self.validator.validate_dataframe(sp500_data, "sp500"):
-                    raise Exception("S&P 500 data validation failed")
-                
-                results['sp500'] = sp500_data
-                
-                if not self.pipeline_manager.store_to_staging_table(
-                    sp500_data, "stg_sp500", "sp500", incremental=self.incremental
-                ):
-                    raise Exception("Failed to store S&P 500 data")
-                
-                total_symbols = sp500_data['symbol'].nunique() if not sp500_data.empty else 0
-                self._log_collection_stats(sp500_data, "sp500", total_symbols)
-                
-            except Exception as e:
-                logger.error(f"❌ Error collecting S&P 500 data: {str(e)}")
-                raise Exception(f"S&P 500 collection failed: {str(e)}")
-        
-        # USDA data
-        logger.info("=" * 50)
-        logger.info("COLLECTING USDA DATA")
-        logger.info("=" * 50)
-        
-        if not self._is_source_allowed('usda'):
-            logger.info("🚫 USDA data collection SKIPPED (not in allowed sources)")
-        else:
-            try:
-                usda_data = fetch_usda()
-                
-                if not self.validator.validate_dataframe(usda_data, "usda"):
-                    raise Exception("USDA data validation failed")
-                
-                results['usda'] = usda_data
-                
-                if not self.pipeline_manager.store_to_staging_table(
-                    usda_data, "stg_usda", "usda", incremental=self.incremental
-                ):
-                    raise Exception("Failed to store USDA data")
-                
-                total_symbols = usda_data['symbol'].nunique() if not usda_data.empty else 0
-                self._log_collection_stats(usda_data, "usda", total_symbols)
-                
-            except Exception as e:
-                logger.error(f"❌ Error collecting USDA data: {str(e)}")
-                raise Exception(f"USDA collection failed: {str(e)}")
+        # S&P 500 and USDA are both bound by their workbook downloads: start them
+        # together so the network waits overlap, then validate and store each in turn.
+        # Leaving the with block (also on error) waits for both downloads to finish
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="direct-download") as download_executor:
+            download_futures = {
+                source: download_executor.submit(fetch_fn)
+                for source, fetch_fn in (('sp500', fetch_sp500), ('usda', fetch_usda))
+                if self._is_source_allowed(source)
+            }
+            
+            # S&P 500 data
+            logger.info("=" * 50)
+            logger.info("COLLECTING S&P 500 DATA")
+            logger.info("=" * 50)
+            
+            if not self._is_source_allowed('sp500'):
+                logger.info("🚫 S&P 500 data collection SKIPPED (not in allowed sources)")
+            else:
+                try:
+                    sp500_data = download_futures['sp500'].result()
+                    
+                    if not self.validator.validate_dataframe(sp500_data, "sp500"):
+                        raise Exception("S&P 500 data validation failed")
+                    
+                    results['sp500'] = sp500_data
+                    
+                    if not self.pipeline_manager.store_to_staging_table(
+                        sp500_data, "stg_sp500", "sp500", incremental=self.incremental
+                    ):
+                        raise Exception("Failed to store S&P 500 data")
+                    
+                    total_symbols = sp500_data['symbol'].nunique() if not sp500_data.empty else 0
+                    self._log_collection_stats(sp500_data, "sp500", total_symbols)
+                    
+                except Exception as e:
+                    logger.error(f"❌ Error collecting S&P 500 data: {str(e)}")
+                    raise Exception(f"S&P 500 collection failed: {str(e)}")
+            
+            # USDA data
+            logger.info("=" * 50)
+            logger.info("COLLECTING USDA DATA")
+            logger.info("=" * 50)
+            
+            if not self._is_source_allowed('usda'):
+                logger.info("🚫 USDA data collection SKIPPED (not in allowed sources)")
+            else:
+                try:
+                    usda_data = download_futures['usda'].result()
+                    
+                    if not self.validator.validate_dataframe(usda_data, "usda"):
+                        raise Exception("USDA data validation failed")
+                    
+                    results['usda'] = usda_data
+                    
+                    if not self.pipeline_manager.store_to_staging_table(
+                        usda_data, "stg_usda", "usda", incremental=self.incremental
+                    ):
+                        raise Exception("Failed to store USDA data")
+                    
+                    total_symbols = usda_data['symbol'].nunique() if not usda_data.empty else 0
+                    self._log_collection_stats(usda_data, "usda", total_symbols)
+                    
+                except Exception as e:
+                    logger.error(f"❌ Error collecting USDA data: {str(e)}")
+                    raise Exception(f"USDA collection failed: {str(e)}")
         
         # OCC data
         logger.info("=" * 50)
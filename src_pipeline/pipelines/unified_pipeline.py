@@ -22,7 +22,9 @@ from ..features.interpolate_data import DuckDBInterpolator
 from .aggregate_series import AggregateSeriesCreator, generate_timestamped_path
 from ..features.feature_utils import (
     apply_savgol_filter,
-    get_symbol_metadata_details
+    build_symbol_metadata_index,
+    get_symbol_metadata_details,
+    downcast_feature_columns
 )
 
 # Set up logging
@@ -437,7 +439,12 @@ class UnifiedDataPipeline:
                 logger.info(f"✅ Domain features complete: {df_featured_pl.shape} ({domain_time:.2f}s)")
             else:
                 logger.info("⏭️ Skipping domain-specific features creation")
-            
+
+            # Downcast derived features to Float32 (done last so domain features
+            # are still computed from full-precision inputs; source columns keep Float64)
+            feature_names = [metadata['symbol'] for metadata in basic_metadata + domain_metadata]
+            df_featured_pl = downcast_feature_columns(df_featured_pl, feature_names)
+
             # Step 5: Convert back to pandas and save
             logger.info(f"💾 Saving final results...")
             df_featured_pd = df_featured_pl.to_pandas().set_index('date')
@@ -819,6 +826,11 @@ class UnifiedDataPipeline:
         overall_min_date = df_data["date"].min()
         overall_max_date = df_data["date"].max()
         
+        # Resolve metadata once per symbol (single pass over metadata, reused by both loops)
+        metadata_lookup = self._build_metadata_lookup(
+            columns_to_process, df_symbols_meta, overall_min_date, overall_max_date
+        )
+        
         # Collect all expressions for bulk application
         all_feature_expressions = []
         
@@ -828,9 +840,7 @@ class UnifiedDataPipeline:
             if i % 100 == 0:
                 logger.info(f"Processing symbol {i+1}/{len(columns_to_process)}: {str_symbol_original}")
             
-            description_r, label_y_r, series_start_date_str, series_end_date_str, _ = get_symbol_metadata_details(
-                str_symbol_original, df_symbols_meta, overall_min_date, overall_max_date
-            )
+            description_r, label_y_r, series_start_date_str, series_end_date_str, _ = metadata_lookup[str_symbol_original]
             
             # YoY features (expressions)
             yoy_exprs, yoy_meta = self._calculate_yoy_features_expr(
@@ -865,9 +875,7 @@ class UnifiedDataPipeline:
             if i % 100 == 0:
                 logger.info(f"Processing Savitzky-Golay {i+1}/{len(columns_to_process)}: {str_symbol_original}")
             
-            description_r, label_y_r, series_start_date_str, series_end_date_str, _ = get_symbol_metadata_details(
-                str_symbol_original, df_symbols_meta, overall_min_date, overall_max_date
-            )
+            description_r, label_y_r, series_start_date_str, series_end_date_str, _ = metadata_lookup[str_symbol_original]
             
             original_series = df_data.get_column(str_symbol_original)
             savgol_series_list, savgol_meta = self._calculate_savgol_features_series(
@@ -903,6 +911,11 @@ class UnifiedDataPipeline:
         overall_min_date = df_data["date"].min()
         overall_max_date = df_data["date"].max()
         
+        # Resolve metadata once per symbol so workers receive plain tuples instead of the full DataFrame
+        metadata_lookup = self._build_metadata_lookup(
+            columns_to_process, df_symbols_meta, overall_min_date, overall_max_date
+        )
+        
         all_new_feature_metadata = []
         all_new_series_to_add = []
         
@@ -912,9 +925,7 @@ class UnifiedDataPipeline:
                     self._process_symbol_features,
                     symbol,
                     df_data.get_column(symbol).clone(),
-                    df_symbols_meta,
-                    overall_min_date,
-                    overall_max_date,
+                    metadata_lookup[symbol],
                     n_days_year
                 ): symbol for symbol in columns_to_process
             }
@@ -947,17 +958,13 @@ class UnifiedDataPipeline:
     def _process_symbol_features(self, 
                                symbol_original: str,
                                original_series_data: pl.Series,
-                               df_symbols_meta: pl.DataFrame, 
-                               overall_min_date: Any,
-                               overall_max_date: Any,
+                               metadata_details: Tuple[str, str, str, str, str],
                                n_days_year: int) -> Tuple[str, List[pl.Series], List[Dict[str, Any]]]:
         """
         Process all features for a single symbol (parallel worker function)
         Based on logic from features_parallel.py
         """
-        description_r, label_y_r, series_start_date_str, series_end_date_str, _ = get_symbol_metadata_details(
-            symbol_original, df_symbols_meta, overall_min_date, overall_max_date
-        )
+        description_r, label_y_r, series_start_date_str, series_end_date_str, _ = metadata_details
         
         current_symbol_new_series = []
         current_symbol_new_metadata = []
@@ -996,6 +1003,18 @@ class UnifiedDataPipeline:
         
         return symbol_original, current_symbol_new_series, current_symbol_new_metadata
     
+    def _build_metadata_lookup(self,
+                               symbols: List[str],
+                               df_symbols_meta: pl.DataFrame,
+                               overall_min_date: Any,
+                               overall_max_date: Any) -> Dict[str, Tuple[str, str, str, str, str]]:
+        """Resolve metadata details for every symbol from a single symbol -> row index"""
+        meta_index = build_symbol_metadata_index(df_symbols_meta)
+        return {
+            symbol: get_symbol_metadata_details(symbol, meta_index, overall_min_date, overall_max_date)
+            for symbol in symbols
+        }
+    
     # Feature calculation helper methods (expressions for sequential processing)
     def _calculate_yoy_features_expr(self, symbol_original: str, description_r: str, 
                                    series_start_date_str: str, series_end_date_str: str, 
@@ -1183,7 +1202,7 @@ class UnifiedDataPipeline:
                     "series_start": series_start_date_str, "series_end": series_end_date_str
                 })
             else:
-                feature_series_list.append(pl.Series(new_col_mva_name, [None] * len(original_series), dtype=pl.Float64))
+                feature_series_list.append(pl.repeat(None, len(original_series), dtype=pl.Float64, eager=True).alias(new_col_mva_name))
                 feature_metadata.append({
                     "symbol": new_col_mva_name, "source": "Calc (Skipped)",
                     "description": f"{description_r} {window} Day MA - SKIPPED", "label_y": f"{label_y_r} {window} Day MA",
@@ -1218,7 +1237,7 @@ class UnifiedDataPipeline:
             )
             
             if filtered_series.is_null().all() and not original_series.is_null().all():
-                feature_series_list.append(pl.Series(new_col_name, [None] * len(original_series), dtype=pl.Float64))
+                feature_series_list.append(pl.repeat(None, len(original_series), dtype=pl.Float64, eager=True).alias(new_col_name))
                 feature_metadata.append({
                     "symbol": new_col_name, "source": "Calc (Skipped/Failed)",
                     "description": f"{config['desc_prefix']} (p={poly}, n={window}" + (", m=1" if config['deriv'] == 1 else "") + f")\n{description_r} - SKIPPED/FAILED",
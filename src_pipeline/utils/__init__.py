@@ -8,10 +8,12 @@ from .web_scraping_utils import WebScrapingUtils
 from .file_download_utils import FileDownloadUtils
 from .excel_processing_utils import ExcelProcessingUtils
 from .transform_utils import DataTransformUtils
+from .cache_utils import ParquetCacheUtils
 
 __all__ = [
     'WebScrapingUtils',
     'FileDownloadUtils',
     'ExcelProcessingUtils',
-    'DataTransformUtils'
+    'DataTransformUtils',
+    'ParquetCacheUtils'
 ] 
\ No newline at end of file
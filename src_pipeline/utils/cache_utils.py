@@ -0,0 +1,128 @@
+"""
+Parquet Cache Utils
+
+This module provides a small day-scoped Parquet cache for fetchers whose source
+is a downloaded spreadsheet. Parsing Excel files is slow, so the standardized
+long-format output is persisted once per day and reused on subsequent runs.
+
+Part of the src_pipeline refactoring to eliminate code duplication.
+"""
+
+import hashlib
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Callable, Optional
+
+import pandas as pd
+
+
+class ParquetCacheUtils:
+    """
+    Utility class for caching fetcher output as Parquet.
+
+    Centralizes:
+    - Cache key generation (current day + source key)
+    - Cache lookups and writes
+    - Removal of files cached on earlier days
+    - Fallback to the builder when the cache is missing or unreadable
+    """
+
+    def __init__(self, cache_dir: str = "data/cache", logger_name: Optional[str] = None):
+        """
+        Initialize the Parquet cache.
+
+        Args:
+            cache_dir: Directory where cached Parquet files are stored
+            logger_name: Optional custom logger name
+        """
+        self.logger = logging.getLogger(logger_name or "cache_utils")
+        self.cache_dir = Path(cache_dir)
+
+    def get_cache_path(self, key: str, day: Optional[date] = None) -> Path:
+        """
+        Get the cache file path for a key, scoped to a day (today by default).
+
+        The day is the filename prefix (YYYYMMDD_<sha1 of key>.parquet) so stale
+        files can be found and removed by date.
+
+        Args:
+            key: Source key (usually the download URL)
+            day: Day the file belongs to
+
+        Returns:
+            Path to the cached Parquet file
+        """
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{(day or date.today()):%Y%m%d}_{digest}.parquet"
+
+    def prune_stale(self) -> int:
+        """
+        Delete cached files from earlier days (and undated files from older versions).
+
+        Returns:
+            Number of files removed
+        """
+        if not self.cache_dir.is_dir():
+            return 0
+
+        today = f"{date.today():%Y%m%d}"
+        removed = 0
+        for path in self.cache_dir.glob("*.parquet"):
+            day, _, digest = path.stem.partition("_")
+            if digest:
+                stale = len(day) == 8 and day.isdigit() and day < today
+            else:
+                # Pre-date-prefix files were named by a bare 40-character sha1
+                stale = len(day) == 40 and all(c in "0123456789abcdef" for c in day)
+            if not stale:
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                self.logger.warning(f"Could not remove stale cache file {path}: {e}")
+
+        if removed:
+            self.logger.info(f"Removed {removed} stale cache files from {self.cache_dir}")
+        return removed
+
+    def get_or_build(self, key: str, builder: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Return today's cached DataFrame for a key, building and caching it if missing.
+
+        Empty results are returned without being cached so failed runs are retried.
+        Files cached on earlier days are removed before today's file is written.
+
+        Args:
+            key: Source key (usually the download URL)
+            builder: Callable producing the DataFrame when there is no cache hit
+
+        Returns:
+            Cached or freshly built DataFrame
+        """
+        cache_path = self.get_cache_path(key)
+
+        if cache_path.exists():
+            try:
+                df = pd.read_parquet(cache_path)
+                self.logger.info(f"Loaded {len(df)} cached rows for {key} from {cache_path}")
+                return df
+            except Exception as e:
+                self.logger.warning(f"Could not read cache file {cache_path}: {e}. Rebuilding...")
+
+        df = builder()
+
+        if df is None or df.empty:
+            return df
+
+        self.prune_stale()
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_path, compression='zstd', index=False)
+            self.logger.info(f"Cached {len(df)} rows for {key} to {cache_path}")
+        except Exception as e:
+            self.logger.warning(f"Could not write cache file {cache_path}: {e}")
+
+        return df
@@ -8,13 +8,27 @@ column manipulation commonly used in data fetching modules.
 Part of the src_pipeline refactoring to eliminate code duplication.
 """
 
+import io
+import os
 import pandas as pd
 import numpy as np
 import logging
 from datetime import datetime, date
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Iterator
 from pathlib import Path
 
+# Streaming openpyxl mode: row-by-row parsing without styles, formulas or external links.
+# read_excel/ExcelFile only accept engine_kwargs from pandas 2.1 onwards
+OPENPYXL_ENGINE_KWARGS = {'read_only': True, 'data_only': True, 'keep_links': False}
+_SUPPORTS_ENGINE_KWARGS = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 1)
+
+
+def _engine_options(engine: str) -> Dict[str, Any]:
+    """Return extra read_excel/ExcelFile keyword arguments for an engine."""
+    if engine == 'openpyxl' and _SUPPORTS_ENGINE_KWARGS:
+        return {'engine_kwargs': OPENPYXL_ENGINE_KWARGS}
+    return {}
+
 
 class ExcelProcessingUtils:
     """
@@ -36,47 +50,151 @@ class ExcelProcessingUtils:
         """
         self.logger = logging.getLogger(logger_name or "excel_processing_utils")
     
+    def open_workbook(self, file_path: str) -> pd.ExcelFile:
+        """
+        Open an Excel workbook once so several sheets can be read from the same handle.
+        
+        Args:
+            file_path: Path to Excel file
+            
+        Returns:
+            pd.ExcelFile opened with the first engine that can read the file
+        """
+        file_ext = Path(file_path).suffix.lower()
+        
+        if file_ext == '.xlsb':
+            engines_to_try = ['calamine', 'pyxlsb']
+        elif file_ext == '.xls':
+            engines_to_try = ['calamine', 'xlrd']
+        else:
+            engines_to_try = ['calamine', 'openpyxl']
+        
+        for engine in engines_to_try:
+            try:
+                workbook = pd.ExcelFile(file_path, engine=engine, **_engine_options(engine))
+                self.logger.info(f"Opened workbook {file_path} with {engine}: {workbook.sheet_names}")
+                return workbook
+            except Exception as e:
+                self.logger.debug(f"Engine {engine} failed to open workbook: {e}")
+                continue
+        
+        raise Exception(f"Failed to open Excel workbook {file_path} with any available engine")
+    
+    def iter_sheet_rows(self,
+                        file_path: Union[str, io.BytesIO],
+                        sheet_name: Union[str, int] = 0) -> Iterator[tuple]:
+        """
+        Iterate over the rows of one sheet without building a DataFrame for it.
+        
+        Lets callers that only need a few rows stop reading as soon as they have them.
+        calamine is used when available, then openpyxl in read-only (streaming) mode.
+        Cells are normalized like read_excel: blanks become None and integral floats
+        become ints.
+        
+        Args:
+            file_path: Path to Excel file or in-memory buffer
+            sheet_name: Sheet name or index to read
+            
+        Yields:
+            One tuple of cell values per row
+        """
+        if isinstance(file_path, io.BytesIO):
+            file_path.seek(0)
+        
+        try:
+            from python_calamine import CalamineWorkbook
+            
+            workbook = CalamineWorkbook.from_object(file_path)
+            if isinstance(sheet_name, int):
+                sheet = workbook.get_sheet_by_index(sheet_name)
+            else:
+                sheet = workbook.get_sheet_by_name(sheet_name)
+            rows = sheet.iter_rows()
+            self.logger.debug(f"Streaming sheet {sheet_name!r} with calamine")
+        except Exception as e:
+            self.logger.debug(f"calamine could not open sheet {sheet_name!r}: {e}")
+            from openpyxl import load_workbook
+            
+            if isinstance(file_path, io.BytesIO):
+                file_path.seek(0)
+            workbook = load_workbook(file_path, **OPENPYXL_ENGINE_KWARGS)
+            sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+            rows = sheet.iter_rows(values_only=True)
+            self.logger.debug(f"Streaming sheet {sheet_name!r} with openpyxl")
+        
+        try:
+            for row in rows:
+                yield tuple(
+                    None if cell == '' else
+                    int(cell) if isinstance(cell, float) and cell.is_integer() else
+                    cell
+                    for cell in row
+                )
+        finally:
+            # Callers usually stop early; release the workbook (read-only openpyxl keeps the file open)
+            try:
+                workbook.close()
+            except Exception:
+                pass
+    
     def read_excel_with_fallback(self,
-                                file_path: str,
+                                file_path: Union[str, io.BytesIO, pd.ExcelFile],
                                 sheet_name: Union[str, int] = 0,
                                 skiprows: Optional[int] = None,
-                                header: Optional[int] = 0) -> pd.DataFrame:
+                                header: Optional[int] = 0,
+                                usecols: Optional[List[int]] = None) -> pd.DataFrame:
         """
         Read Excel file with multiple engine fallbacks.
         
         Args:
-            file_path: Path to Excel file
+            file_path: Path to Excel file, in-memory buffer, or a workbook already
+                opened with open_workbook
             sheet_name: Sheet name or index to read
             skiprows: Number of rows to skip
             header: Row to use as column names
+            usecols: Column positions to parse (all columns if None)
             
         Returns:
             DataFrame with Excel data
         """
-        file_ext = Path(file_path).suffix.lower()
+        # Already-open workbook: parse the sheet from the shared handle
+        if isinstance(file_path, pd.ExcelFile):
+            df = file_path.parse(sheet_name=sheet_name, skiprows=skiprows, header=header, usecols=usecols)
+            self.logger.info(f"Successfully read sheet {sheet_name!r} from open workbook: {df.shape}")
+            return df
+        
+        # In-memory buffers have no extension; the generic engine order applies
+        file_ext = Path(file_path).suffix.lower() if isinstance(file_path, (str, os.PathLike)) else ''
         engines_to_try = []
         
-        # Determine engines based on file extension
+        # Determine engines based on file extension. calamine (Rust parser) is tried
+        # first as it is much faster than the pure-Python engines; those remain as fallbacks
         if file_ext == '.xlsb':
-            engines_to_try = ['pyxlsb', 'openpyxl']
+            engines_to_try = ['calamine', 'pyxlsb', 'openpyxl']
         elif file_ext in ['.xlsx', '.xlsm']:
-            engines_to_try = ['openpyxl', 'xlrd']
+            engines_to_try = ['calamine', 'openpyxl', 'xlrd']
         elif file_ext == '.xls':
-            engines_to_try = ['xlrd', 'openpyxl']
+            engines_to_try = ['calamine', 'xlrd', 'openpyxl']
         else:
-            engines_to_try = ['openpyxl', 'xlrd', 'pyxlsb']
+            engines_to_try = ['calamine', 'openpyxl', 'xlrd', 'pyxlsb']
         
         # Try each engine until one works
         for engine in engines_to_try:
             try:
                 self.logger.debug(f"Trying to read {file_path} with engine: {engine}")
                 
+                # A failed engine may have consumed part of the buffer
+                if isinstance(file_path, io.BytesIO):
+                    file_path.seek(0)
+                
                 df = pd.read_excel(
                     file_path,
                     engine=engine,
                     sheet_name=sheet_name,
                     skiprows=skiprows,
-                    header=header
+                    header=header,
+                    usecols=usecols,
+                    **_engine_options(engine)
                 )
                 
                 self.logger.info(f"Successfully read Excel file with {engine}: {df.shape}")
@@ -90,22 +208,25 @@ class ExcelProcessingUtils:
         raise Exception(f"Failed to read Excel file {file_path} with any available engine")
     
     def read_excel_file(self,
-                       file_path: str,
+                       file_path: Union[str, io.BytesIO, pd.ExcelFile],
                        sheet_name: Union[str, int] = 0,
                        skip_rows: Optional[int] = None,
                        column_names: Optional[List[str]] = None,
-                       header: Optional[int] = 0) -> pd.DataFrame:
+                       header: Optional[int] = 0,
+                       usecols: Optional[List[int]] = None) -> pd.DataFrame:
         """
         Read Excel file - compatibility method for refactored fetchers.
         
         This is an alias for read_excel_with_fallback with parameter mapping.
         
         Args:
-            file_path: Path to Excel file
+            file_path: Path to Excel file, in-memory buffer, or a workbook already
+                opened with open_workbook
             sheet_name: Sheet name or index to read
             skip_rows: Number of rows to skip
             column_names: Column names to assign (will be applied after reading)
             header: Row to use as column names
+            usecols: Column positions to parse (all columns if None)
             
         Returns:
             DataFrame with Excel data
@@ -115,7 +236,8 @@ class ExcelProcessingUtils:
             file_path=file_path,
             sheet_name=sheet_name,
             skiprows=skip_rows,
-            header=header
+            header=header,
+            usecols=usecols
         )
         
         # Apply custom column names if provided
@@ -127,37 +249,33 @@ class ExcelProcessingUtils:
         
         return df
     
-    def detect_date_columns(self, df: pd.DataFrame) -> List[str]:
+    def detect_date_columns(self,
+                           df: pd.DataFrame,
+                           min_serial: float = 20000,
+                           max_serial: float = 50000) -> List[str]:
         """
         Detect columns that likely contain dates.
         
         Args:
             df: DataFrame to analyze
+            min_serial: Lower bound (exclusive) for Excel serial dates (20000 = 1954-10-03)
+            max_serial: Upper bound (exclusive) for Excel serial dates (50000 = 2036-11-21)
             
         Returns:
             List of column names that appear to contain dates
         """
-        date_columns = []
-        
-        for col in df.columns:
-            col_name = str(col).lower()
-            
-            # Check by column name
-            if any(keyword in col_name for keyword in ['date', 'time', 'year', 'month']):
-                date_columns.append(col)
-                continue
-            
-            # Check by data type and values
-            if pd.api.types.is_numeric_dtype(df[col]):
-                # Check if numeric values are in Excel date range
-                non_null_values = df[col].dropna()
-                if len(non_null_values) > 0:
-                    min_val = non_null_values.min()
-                    max_val = non_null_values.max()
-                    
-                    # Excel dates typically range from ~1 (1900-01-01) to ~50000 (2036+)
-                    if 1 <= min_val <= 50000 and 1 <= max_val <= 50000:
-                        date_columns.append(col)
+        # Check by column name
+        date_columns = [
+            col for col in df.columns
+            if any(keyword in str(col).lower() for keyword in ['date', 'time', 'year', 'month'])
+        ]
+        
+        # Check numeric columns by value range with a single aggregate over all of them
+        numeric_df = df.select_dtypes(include='number').drop(columns=date_columns, errors='ignore')
+        if not numeric_df.empty:
+            stats = numeric_df.agg(['min', 'max'])
+            mask = (stats.loc['min'] > min_serial) & (stats.loc['max'] < max_serial)
+            date_columns.extend(mask.index[mask.to_numpy()])
         
         self.logger.debug(f"Detected potential date columns: {date_columns}")
         return date_columns
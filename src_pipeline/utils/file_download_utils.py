@@ -7,15 +7,33 @@ download directories, waiting for downloads, and finding downloaded files.
 Part of the src_pipeline refactoring to eliminate code duplication.
 """
 
+import io
 import os
+import json
 import time
+import shutil
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from urllib.parse import urlparse, unquote
 
 
+DEFAULT_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                      "AppleWebKit/537.36 (KHTML, like Gecko) "
+                      "Chrome/112.0.0.0 Safari/537.36")
+
+# Copy buffer for streamed downloads (1 MiB keeps syscalls per file low)
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Keep-alive HTTP session shared by all fetchers so TCP/TLS connections are reused
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
 class FileDownloadUtils:
     """
     Utility class for file download operations.
@@ -39,6 +57,37 @@ class FileDownloadUtils:
         self.logger = logging.getLogger(logger_name or "file_download_utils")
         self.download_dir = download_dir
     
+    @staticmethod
+    def get_session() -> requests.Session:
+        """
+        Get the shared keep-alive HTTP session (created on first use).
+        
+        Returns:
+            requests.Session with the default browser User-Agent, a connection pool
+            and automatic retries for 429/5xx responses
+        """
+        global _http_session
+        # Locked so fetchers started on worker threads all get the same session
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+                
+                # Pooled connections plus retries with backoff on rate limits and transient 5xx
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.5,
+                        status_forcelist=[429, 500, 502, 503, 504]
+                    )
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+        return _http_session
+    
     def ensure_directory_exists(self, directory_path: str) -> str:
         """
         Ensure a directory exists, creating it if necessary.
@@ -114,11 +163,63 @@ class FileDownloadUtils:
             self.logger.error(f"Error finding most recent file: {e}")
             return None
     
+    def _watch_directory(self, directory: str):
+        """
+        Start a filesystem watcher that sets an Event whenever the directory changes.
+        
+        Uses watchdog (inotify/FSEvents) when it is installed, so download waits wake
+        as soon as Chrome renames its .crdownload file instead of on the next poll.
+        
+        Args:
+            directory: Directory to watch
+            
+        Returns:
+            (observer, event) tuple, or (None, None) if watchdog is unavailable
+        """
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            return None, None
+        
+        changed = threading.Event()
+        
+        class _ChangeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                changed.set()
+        
+        try:
+            observer = Observer()
+            observer.schedule(_ChangeHandler(), directory, recursive=False)
+            observer.start()
+        except Exception as e:
+            self.logger.debug(f"Could not watch {directory}, polling instead: {e}")
+            return None, None
+        
+        return observer, changed
+    
+    @staticmethod
+    def _wait_for_change(changed: Optional[threading.Event], check_interval: float) -> None:
+        """Sleep until the watched directory changes (or for check_interval when not watching)."""
+        if changed is None:
+            time.sleep(check_interval)
+            return
+        # The periodic timeout still re-checks the listing in case an event was missed
+        changed.wait(timeout=1.0)
+        changed.clear()
+    
+    @staticmethod
+    def _stop_watching(observer) -> None:
+        """Stop a watcher started by _watch_directory."""
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=1.0)
+    
     def wait_for_download(self, 
                          directory: str,
                          expected_filename: Optional[str] = None,
                          timeout_seconds: int = 60,
-                         check_interval: float = 2.0) -> Optional[str]:
+                         check_interval: float = 0.25) -> Optional[str]:
         """
         Wait for a file to be downloaded to a directory.
         
@@ -135,42 +236,46 @@ class FileDownloadUtils:
         
         start_time = time.time()
         initial_files = set(os.listdir(directory)) if os.path.exists(directory) else set()
+        observer, changed = self._watch_directory(directory) if os.path.exists(directory) else (None, None)
         
-        while time.time() - start_time < timeout_seconds:
-            time.sleep(check_interval)
-            
-            if not os.path.exists(directory):
-                continue
-            
-            current_files = set(os.listdir(directory))
-            new_files = current_files - initial_files
-            
-            # Filter out temporary download files
-            completed_files = [
-                f for f in new_files 
-                if not f.endswith('.crdownload') 
-                and not f.endswith('.tmp')
-                and not f.startswith('.')
-            ]
-            
-            if expected_filename:
-                # Look for specific filename
-                if expected_filename in completed_files:
-                    file_path = os.path.join(directory, expected_filename)
-                    self.logger.info(f"Expected file downloaded: {file_path}")
-                    return file_path
-            else:
-                # Look for any new completed file
-                if completed_files:
-                    # Get the most recent one
-                    file_paths = [os.path.join(directory, f) for f in completed_files]
-                    most_recent = self.get_most_recent_file(file_paths)
-                    if most_recent:
-                        self.logger.info(f"File downloaded: {most_recent}")
-                        return most_recent
-            
-            elapsed = time.time() - start_time
-            self.logger.debug(f"Still waiting for download... ({elapsed:.1f}s)")
+        try:
+            while time.time() - start_time < timeout_seconds:
+                if not os.path.exists(directory):
+                    time.sleep(check_interval)
+                    continue
+                
+                current_files = set(os.listdir(directory))
+                new_files = current_files - initial_files
+                
+                # Filter out temporary download files
+                completed_files = [
+                    f for f in new_files 
+                    if not f.endswith('.crdownload') 
+                    and not f.endswith('.tmp')
+                    and not f.startswith('.')
+                ]
+                
+                if expected_filename:
+                    # Look for specific filename
+                    if expected_filename in completed_files:
+                        file_path = os.path.join(directory, expected_filename)
+                        self.logger.info(f"Expected file downloaded: {file_path}")
+                        return file_path
+                else:
+                    # Look for any new completed file
+                    if completed_files:
+                        # Get the most recent one
+                        file_paths = [os.path.join(directory, f) for f in completed_files]
+                        most_recent = self.get_most_recent_file(file_paths)
+                        if most_recent:
+                            self.logger.info(f"File downloaded: {most_recent}")
+                            return most_recent
+                
+                elapsed = time.time() - start_time
+                self.logger.debug(f"Still waiting for download... ({elapsed:.1f}s)")
+                self._wait_for_change(changed, check_interval)
+        finally:
+            self._stop_watching(observer)
         
         self.logger.warning(f"Download timeout after {timeout_seconds} seconds")
         return None
@@ -246,58 +351,61 @@ class FileDownloadUtils:
             timeout_seconds=timeout
         )
     
-    def _wait_for_file_with_extension(self, directory: str, extension: str, timeout: int) -> Optional[str]:
+    def _wait_for_file_with_extension(self, directory: str, extension: str, timeout: int,
+                                      check_interval: float = 0.25) -> Optional[str]:
         """
         Wait for any file with the specified extension to be downloaded.
         
+        Re-checks the directory whenever it changes (watchdog) or at a short polling
+        interval, and returns as soon as a new file with the extension exists and no
+        partial (.crdownload/.tmp) download remains.
+        
         Args:
             directory: Directory to monitor
             extension: File extension to look for (e.g., '.xlsx')
             timeout: Timeout in seconds
+            check_interval: How often to check (seconds)
             
         Returns:
             Path to downloaded file, or None if timeout
         """
-        import time
-        
         self.logger.info(f"Waiting for file with extension {extension} in {directory}...")
         
-        start_time = time.time()
+        extension = extension.lower()
+        deadline = time.time() + timeout
         initial_files = set()
         
+        observer, changed = None, None
         if os.path.exists(directory):
-            initial_files = set([
-                f for f in os.listdir(directory) 
-                if f.lower().endswith(extension.lower())
-            ])
+            initial_files = {f for f in os.listdir(directory) if f.lower().endswith(extension)}
+            observer, changed = self._watch_directory(directory)
         
-        while time.time() - start_time < timeout:
-            time.sleep(2.0)
-            
-            if not os.path.exists(directory):
-                continue
-            
-            current_files = set([
-                f for f in os.listdir(directory) 
-                if f.lower().endswith(extension.lower())
-                and not f.endswith('.crdownload')
-                and not f.endswith('.tmp')
-                and not f.startswith('.')
-            ])
-            
-            new_files = current_files - initial_files
-            
-            if new_files:
-                # Get the most recent file
-                file_paths = [os.path.join(directory, f) for f in new_files]
-                most_recent = self.get_most_recent_file(file_paths)
-                if most_recent:
-                    self.logger.info(f"File with extension {extension} downloaded: {most_recent}")
-                    return most_recent
-            
-            elapsed = time.time() - start_time
-            if elapsed % 10 == 0:  # Log every 10 seconds
-                self.logger.debug(f"Still waiting for {extension} file... ({elapsed:.0f}s)")
+        try:
+            while time.time() < deadline:
+                if os.path.exists(directory):
+                    current_listing = os.listdir(directory)
+                    
+                    # Chrome writes to <name>.crdownload and renames it when the download completes
+                    download_in_progress = any(
+                        f.endswith('.crdownload') or f.endswith('.tmp') for f in current_listing
+                    )
+                    
+                    new_files = {
+                        f for f in current_listing
+                        if f.lower().endswith(extension) and not f.startswith('.')
+                    } - initial_files
+                    
+                    if new_files and not download_in_progress:
+                        # Get the most recent file
+                        file_paths = [os.path.join(directory, f) for f in new_files]
+                        most_recent = self.get_most_recent_file(file_paths)
+                        if most_recent:
+                            self.logger.info(f"File with extension {extension} downloaded: {most_recent}")
+                            return most_recent
+                
+                self._wait_for_change(changed, check_interval)
+        finally:
+            self._stop_watching(observer)
         
         self.logger.warning(f"File download timeout after {timeout} seconds")
         return None
@@ -307,7 +415,8 @@ class FileDownloadUtils:
                               download_dir: str,
                               filename: Optional[str] = None,
                               headers: Optional[Dict[str, str]] = None,
-                              timeout: int = 60) -> Optional[str]:
+                              timeout: int = 60,
+                              conditional: bool = False) -> Optional[str]:
         """
         Download a file from a URL.
         
@@ -315,8 +424,10 @@ class FileDownloadUtils:
             url: URL to download from
             download_dir: Directory to save file
             filename: Optional custom filename
-            headers: Optional HTTP headers
+            headers: Optional extra HTTP headers (the session sends a browser User-Agent)
             timeout: Request timeout in seconds
+            conditional: Send If-None-Match/If-Modified-Since from the previous download
+                and reuse the existing file when the server answers 304 Not Modified
             
         Returns:
             Path to downloaded file, or None if failed
@@ -336,26 +447,31 @@ class FileDownloadUtils:
             
             file_path = os.path.join(download_dir, filename)
             
-            # Set default headers
-            if headers is None:
-                headers = {
-                    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                                 "AppleWebKit/537.36 (KHTML, like Gecko) "
-                                 "Chrome/112.0.0.0 Safari/537.36")
-                }
-            
             self.logger.info(f"Downloading file from: {url}")
             self.logger.debug(f"Saving to: {file_path}")
             
-            # Download the file
-            response = requests.get(url, headers=headers, stream=True, timeout=timeout)
-            response.raise_for_status()
+            request_headers = dict(headers or {})
+            meta_path = f"{file_path}.meta.json"
+            if conditional:
+                request_headers.update(self._load_validators(meta_path, file_path, url))
             
-            # Save the file
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            # Stream the file to disk over the shared keep-alive session
+            with self.get_session().get(url, headers=request_headers, stream=True, timeout=timeout) as response:
+                if response.status_code == 304:
+                    self.logger.info(f"File not modified since last download, reusing: {file_path}")
+                    return file_path
+                
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                # Write to a temporary file so an interrupted download never replaces a good copy
+                partial_path = f"{file_path}.part"
+                with open(partial_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_BUFFER_SIZE)
+                os.replace(partial_path, file_path)
+                
+                if conditional:
+                    self._save_validators(meta_path, url, response.headers)
             
             self.logger.info(f"File downloaded successfully: {file_path}")
             return file_path
@@ -364,6 +480,91 @@ class FileDownloadUtils:
             self.logger.error(f"Error downloading file from {url}: {e}")
             return None
     
+    def download_to_buffer(self,
+                           url: str,
+                           headers: Optional[Dict[str, str]] = None,
+                           timeout: int = 60) -> Optional[io.BytesIO]:
+        """
+        Download a file from a URL into memory without touching the disk.
+        
+        Args:
+            url: URL to download from
+            headers: Optional extra HTTP headers (the session sends a browser User-Agent)
+            timeout: Request timeout in seconds
+            
+        Returns:
+            BytesIO positioned at the start of the content, or None if failed
+        """
+        try:
+            self.logger.info(f"Downloading into memory from: {url}")
+            
+            buffer = io.BytesIO()
+            with self.get_session().get(url, headers=headers, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, buffer, length=DOWNLOAD_BUFFER_SIZE)
+            
+            buffer.seek(0)
+            self.logger.info(f"Downloaded {buffer.getbuffer().nbytes} bytes into memory")
+            return buffer
+            
+        except Exception as e:
+            self.logger.error(f"Error downloading {url} into memory: {e}")
+            return None
+    
+    def _load_validators(self, meta_path: str, file_path: str, url: str) -> Dict[str, str]:
+        """
+        Build conditional request headers from the metadata of the previous download.
+        
+        Args:
+            meta_path: Path to the metadata JSON file
+            file_path: Path to the previously downloaded file
+            url: URL being downloaded (metadata for another URL is ignored)
+            
+        Returns:
+            Dictionary of If-None-Match/If-Modified-Since headers (empty if not available)
+        """
+        if not (os.path.exists(meta_path) and os.path.exists(file_path)):
+            return {}
+        
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+        except Exception as e:
+            self.logger.debug(f"Could not read download metadata {meta_path}: {e}")
+            return {}
+        
+        if meta.get('url') != url:
+            return {}
+        
+        validators = {}
+        if meta.get('etag'):
+            validators['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            validators['If-Modified-Since'] = meta['last_modified']
+        return validators
+    
+    def _save_validators(self, meta_path: str, url: str, response_headers) -> None:
+        """
+        Store the ETag/Last-Modified of a completed download next to the file.
+        
+        Args:
+            meta_path: Path to the metadata JSON file
+            url: URL that was downloaded
+            response_headers: Headers of the download response
+        """
+        meta = {
+            'url': url,
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified')
+        }
+        
+        try:
+            with open(meta_path, 'w') as f:
+                json.dump(meta, f)
+        except Exception as e:
+            self.logger.debug(f"Could not write download metadata {meta_path}: {e}")
+    
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """
         Get information about a file.
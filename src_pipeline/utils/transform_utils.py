@@ -86,7 +86,67 @@ class DataTransformUtils:
         
         logging.debug(f"Melted DataFrame: {df.shape} -> {result_df.shape}")
         return result_df
-    
+
+    @staticmethod
+    def wide_to_long_fast(df: pd.DataFrame,
+                          id_col: str = 'date',
+                          value_vars: Optional[List[str]] = None,
+                          var_name: str = 'metric',
+                          value_name: str = 'value',
+                          symbol_column: str = 'symbol',
+                          dropna: bool = True) -> pd.DataFrame:
+        """
+        Convert a wide numeric DataFrame to long format by stacking NumPy arrays.
+
+        Faster alternative to melt_to_long_format for the single id column case:
+        values are coerced to float64 and stacked column by column, and NaN values
+        are masked out before the long DataFrame is built (no separate dropna pass).
+
+        Args:
+            df: DataFrame to convert
+            id_col: Identifier column repeated for every value column (usually 'date')
+            value_vars: Columns to use as value variables (auto-detected if None)
+            var_name: Name for variable column
+            value_name: Name for value column
+            symbol_column: Name for symbol column (copy of the variable column)
+            dropna: Drop rows whose value is NaN
+
+        Returns:
+            DataFrame in long format with columns: id_col, var_name, value_name, symbol_column
+            (the variable and symbol columns are Categoricals over the value column names)
+        """
+        if df.empty:
+            return df
+
+        if value_vars is not None:
+            value_columns = [col for col in value_vars if col in df.columns]
+        else:
+            value_columns = [col for col in df.columns if col != id_col]
+
+        if not value_columns:
+            logging.warning("No value columns found for melting")
+            return df
+
+        values = df[value_columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        n_rows, n_cols = values.shape
+
+        # Column-major stacking matches pd.melt row order (all rows of col 1, then col 2, ...)
+        value_arr = values.T.reshape(-1)
+        id_arr = np.tile(df[id_col].to_numpy(), n_cols)
+        var_codes = np.repeat(np.arange(n_cols, dtype=np.int16), n_rows)
+
+        if dropna:
+            keep = ~np.isnan(value_arr)
+            value_arr, id_arr, var_codes = value_arr[keep], id_arr[keep], var_codes[keep]
+
+        var_cat = pd.Categorical.from_codes(var_codes, categories=value_columns)
+        result_df = pd.DataFrame({id_col: id_arr, var_name: var_cat, value_name: value_arr}, copy=False)
+        if symbol_column not in result_df.columns:
+            result_df[symbol_column] = result_df[var_name]
+
+        logging.debug(f"Stacked DataFrame to long format: {df.shape} -> {result_df.shape}")
+        return result_df
+
     @staticmethod
     def standardize_column_order(df: pd.DataFrame, 
                                 expected_order: List[str]) -> pd.DataFrame:
@@ -140,6 +200,26 @@ class DataTransformUtils:
         
         return df
     
+    @staticmethod
+    def parse_date_cells(column: pd.Series) -> pd.Series:
+        """
+        Parse a mixed spreadsheet column (text, datetimes, numbers, blanks) to datetimes.
+        
+        Only text and date/datetime cells can be dates: text is stripped and parsed,
+        datetime cells are passed through, and every other cell (numbers, footnote
+        markers, blanks) becomes NaT instead of being read as an epoch offset.
+        
+        Args:
+            column: Raw column as read from the workbook
+            
+        Returns:
+            Datetime Series aligned with column (NaT where the cell is not a date)
+        """
+        date_cells = column.map(
+            lambda v: v.strip() if isinstance(v, str) else (v if isinstance(v, (datetime, date)) else None)
+        )
+        return pd.to_datetime(date_cells, format='mixed', errors='coerce')
+    
     @staticmethod
     def clean_and_validate_data(df: pd.DataFrame, 
                                required_columns: List[str],
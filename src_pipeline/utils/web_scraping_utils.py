@@ -11,14 +11,38 @@ Part of the src_pipeline refactoring to eliminate code duplication.
 import os
 import time
 import random
+import atexit
 import logging
-from typing import Optional, Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from selenium_stealth import stealth
 
 
+# Chrome instance shared by the scraping fetchers so one run starts the browser only once
+_shared_driver: Optional[webdriver.Chrome] = None
+_shared_driver_lock = threading.Lock()
+# Held while a fetcher drives the shared browser, so fetchers running on worker threads take turns
+_shared_driver_lease = threading.RLock()
+
+
+def _quit_shared_driver() -> None:
+    """Quit the shared Chrome driver (registered with atexit)."""
+    global _shared_driver
+    if _shared_driver is not None:
+        try:
+            _shared_driver.quit()
+        except Exception:
+            pass
+        _shared_driver = None
+
+
 class WebScrapingUtils:
     """
     Utility class for web scraping operations using Selenium.
@@ -60,6 +84,44 @@ class WebScrapingUtils:
         """
         self.logger.info("Setting up Chrome driver...")
         
+        options = self.build_chrome_options(download_dir, headless, window_size, user_agent)
+        
+        # Initialize driver
+        self.logger.info("Initializing Chrome driver...")
+        try:
+            self.driver = webdriver.Chrome(options=options)
+            
+            # Execute script to remove webdriver property
+            self.driver.execute_script(
+                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+            )
+            
+            return self.driver
+            
+        except Exception as e:
+            self.logger.error(f"Failed to initialize Chrome driver: {e}")
+            raise
+    
+    def build_chrome_options(self,
+                             download_dir: str,
+                             headless: bool = True,
+                             window_size: str = "1920,1080",
+                             user_agent: Optional[str] = None,
+                             block_resources: bool = True) -> Options:
+        """
+        Build Chrome options with the standard stability, stealth and download settings.
+        
+        Args:
+            download_dir: Directory for downloads
+            headless: Whether to run in headless mode
+            window_size: Browser window size
+            user_agent: Custom user agent string
+            block_resources: Skip images, stylesheets and notifications and return from
+                driver.get on DOMContentLoaded (scrapers only need the DOM links)
+            
+        Returns:
+            Configured Chrome options
+        """
         # Ensure download directory exists
         self.ensure_download_directory(download_dir)
         
@@ -96,27 +158,117 @@ class WebScrapingUtils:
         
         # Setup download preferences
         prefs = self.get_download_preferences(download_dir)
+        
+        if block_resources:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            prefs.update({
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            options.page_load_strategy = "eager"
+        
         options.add_experimental_option("prefs", prefs)
         
         # Exclude automation switches
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
-        # Initialize driver
-        self.logger.info("Initializing Chrome driver...")
-        try:
-            self.driver = webdriver.Chrome(options=options)
-            
-            # Execute script to remove webdriver property
-            self.driver.execute_script(
-                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-            )
+        return options
+    
+    def get_driver(self,
+                   download_dir: str,
+                   driver: Optional[webdriver.Chrome] = None,
+                   headless: bool = True) -> webdriver.Chrome:
+        """
+        Get a Chrome driver downloading into download_dir.
+        
+        Uses the given driver if provided, otherwise the process-wide shared driver,
+        which is created on first use and quit at interpreter exit. Callers must not
+        quit the returned driver.
+        
+        Args:
+            download_dir: Directory for downloads
+            driver: Optional caller-managed driver to reuse
+            headless: Whether to run in headless mode (only used when creating the shared driver)
             
-            return self.driver
+        Returns:
+            Chrome driver instance
+        """
+        global _shared_driver
+        
+        if driver is None:
+            with _shared_driver_lock:
+                if _shared_driver is not None and not self._is_driver_alive(_shared_driver):
+                    self.logger.warning("Shared Chrome driver is no longer responsive, restarting...")
+                    _quit_shared_driver()
+                
+                if _shared_driver is None:
+                    _shared_driver = self.setup_chrome_driver(download_dir, headless=headless)
+                    atexit.unregister(_quit_shared_driver)
+                    atexit.register(_quit_shared_driver)
+                else:
+                    self.logger.info("Reusing shared Chrome driver")
+                
+                driver = _shared_driver
+        
+        self.driver = driver
+        self.set_download_directory(driver, download_dir)
+        return driver
+    
+    @contextmanager
+    def lease_driver(self,
+                     download_dir: str,
+                     driver: Optional[webdriver.Chrome] = None,
+                     headless: bool = True) -> Iterator[webdriver.Chrome]:
+        """
+        Borrow a Chrome driver downloading into download_dir for the duration of a with block.
+        
+        Same as get_driver, but the process-wide shared driver is leased exclusively,
+        so fetchers running concurrently (e.g. on a ThreadPoolExecutor) never
+        navigate the same browser at once. Caller-managed drivers are not locked.
+        
+        Args:
+            download_dir: Directory for downloads
+            driver: Optional caller-managed driver to reuse
+            headless: Whether to run in headless mode (only used when creating the shared driver)
             
+        Yields:
+            Chrome driver instance
+        """
+        if driver is not None:
+            yield self.get_driver(download_dir, driver=driver, headless=headless)
+            return
+        
+        with _shared_driver_lease:
+            yield self.get_driver(download_dir, headless=headless)
+    
+    def set_download_directory(self, driver: webdriver.Chrome, download_dir: str) -> None:
+        """
+        Point an existing Chrome driver's downloads at download_dir.
+        
+        Args:
+            driver: Chrome driver instance
+            download_dir: Directory for downloads
+        """
+        abs_path = self.ensure_download_directory(download_dir)
+        
+        try:
+            driver.execute_cdp_cmd(
+                "Page.setDownloadBehavior",
+                {"behavior": "allow", "downloadPath": abs_path}
+            )
         except Exception as e:
-            self.logger.error(f"Failed to initialize Chrome driver: {e}")
-            raise
+            self.logger.warning(f"Could not set download directory to {abs_path}: {e}")
+    
+    @staticmethod
+    def _is_driver_alive(driver: webdriver.Chrome) -> bool:
+        """Check whether a driver's browser session still responds."""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
     
     def apply_stealth_settings(self, 
                               languages: list = None,
@@ -296,30 +448,135 @@ class WebScrapingUtils:
         if not self.driver:
             raise ValueError("Driver must be initialized before finding links")
         
-        all_links = self.driver.find_elements(By.TAG_NAME, "a")
-        matching_links = []
-        
         search_text_processed = search_text if case_sensitive else search_text.upper()
         
-        for link in all_links:
-            try:
-                link_text = link.text.strip()
-                link_text_processed = link_text if case_sensitive else link_text.upper()
-                
-                if search_text_processed in link_text_processed:
-                    matching_links.append({
-                        'element': link,
-                        'text': link_text,
-                        'href': link.get_attribute('href'),
-                        'classes': link.get_attribute('class')
-                    })
-            except Exception as e:
-                self.logger.debug(f"Error processing link: {e}")
-                continue
+        matching_links = []
+        for link in self.collect_links(self.driver):
+            link_text_processed = link['text'] if case_sensitive else link['text'].upper()
+            if search_text_processed in link_text_processed:
+                matching_links.append(link)
         
         self.logger.info(f"Found {len(matching_links)} links containing '{search_text}'")
         return matching_links
     
+    def collect_links(self, driver) -> list:
+        """
+        Collect every link on the page with a single script execution.
+        
+        Reading text and attributes per element costs one WebDriver round-trip each;
+        the script gathers them for all anchors in the browser in one call.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            
+        Returns:
+            List of dicts with 'element', 'text', 'href' and 'classes' keys
+        """
+        rows = driver.execute_script(
+            "return Array.from(document.links).map("
+            "a => [a, (a.innerText || a.textContent || '').trim(), a.href, a.className]);"
+        )
+        return [
+            {'element': element, 'text': text, 'href': href, 'classes': classes}
+            for element, text, href, classes in rows
+        ]
+    
+    def click_first_button_by_text(self, driver, texts) -> Optional[str]:
+        """
+        Click the first visible button whose text contains one of the given texts.
+        
+        All candidates are checked inside the browser in a single script execution
+        instead of one locate/visibility round-trip per text (e.g. cookie banners).
+        
+        Args:
+            driver: Selenium WebDriver instance
+            texts: Lowercase texts to look for, in priority order
+            
+        Returns:
+            The text that matched, or None if no visible button matched
+        """
+        return driver.execute_script(
+            "const buttons = Array.from(document.querySelectorAll('button, [role=\"button\"]'))"
+            ".filter(b => b.offsetParent !== null);"
+            "for (const text of arguments[0]) {"
+            "  const button = buttons.find(b => (b.innerText || b.textContent || '').trim().toLowerCase().includes(text));"
+            "  if (button) { button.click(); return text; }"
+            "}"
+            "return null;",
+            list(texts)
+        )
+    
+    @staticmethod
+    def xpath_literal(text: str) -> str:
+        """
+        Quote a string for use as an XPath 1.0 string literal.
+        
+        Args:
+            text: Text to quote
+            
+        Returns:
+            XPath expression evaluating to text
+        """
+        if "'" not in text:
+            return f"'{text}'"
+        if '"' not in text:
+            return f'"{text}"'
+        parts = text.split("'")
+        return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+    
+    def find_link_element_by_text(self, driver, search_text: str,
+                                  case_sensitive: bool = True):
+        """
+        Find the first link whose text contains search_text with a single XPath query.
+        
+        The text filter runs inside the browser, so only the matching element crosses
+        the WebDriver bridge instead of every anchor on the page.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            search_text: Text to search for in links
+            case_sensitive: Whether search should be case sensitive
+            
+        Returns:
+            Matching link WebElement or None if not found
+        """
+        matches = driver.find_elements(By.XPATH, self._link_text_xpath(search_text, case_sensitive))
+        return matches[0] if matches else None
+    
+    def wait_for_link_by_text(self, driver, search_text: str,
+                              timeout: int = 15, case_sensitive: bool = True):
+        """
+        Wait until a link whose text contains search_text is present and return it.
+        
+        Returns as soon as the anchor is in the DOM instead of waiting for the whole
+        page to finish loading.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            search_text: Text to search for in links
+            timeout: Timeout in seconds
+            case_sensitive: Whether search should be case sensitive
+            
+        Returns:
+            Matching link WebElement or None if it did not appear before the timeout
+        """
+        try:
+            return WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH, self._link_text_xpath(search_text, case_sensitive)))
+            )
+        except TimeoutException:
+            self.logger.warning(f"No link containing '{search_text}' appeared within {timeout} seconds")
+            return None
+    
+    def _link_text_xpath(self, search_text: str, case_sensitive: bool = True) -> str:
+        """Build the XPath selecting anchors whose normalized text contains search_text."""
+        if case_sensitive:
+            return f"//a[contains(normalize-space(.), {self.xpath_literal(search_text)})]"
+        return (
+            "//a[contains(translate(normalize-space(.), 'abcdefghijklmnopqrstuvwxyz', "
+            f"'ABCDEFGHIJKLMNOPQRSTUVWXYZ'), {self.xpath_literal(search_text.upper())})]"
+        )
+    
     def safe_click(self, element, max_retries: int = 3) -> bool:
         """
         Safely click an element with retries.
@@ -355,6 +612,11 @@ class WebScrapingUtils:
         """
         Clean up the driver and close browser.
         """
+        if self.driver is not None and self.driver is _shared_driver:
+            # The shared driver outlives this instance; it is quit at interpreter exit
+            self.driver = None
+            return
+        
         if self.driver:
             try:
                 self.logger.info("Closing browser...")
@@ -0,0 +1,35 @@
+"""Tests for shared helpers in src_pipeline.core.base_fetcher"""
+
+import pandas as pd
+
+from src_pipeline.core.base_fetcher import BaseDataFetcher
+
+
+class _StubFetcher(BaseDataFetcher):
+    def get_single_series(self, identifier, start_date, end_date):
+        return pd.DataFrame()
+    
+    def fetch_batch(self, symbols_df):
+        return pd.DataFrame()
+
+
+def _series(fetcher: BaseDataFetcher, series_id: str, values) -> pd.DataFrame:
+    df = pd.DataFrame({'date': pd.date_range('2024-01-01', periods=len(values), freq='D'), 'value': values})
+    df = fetcher.standardize_dataframe(df, ['date', 'series_id', 'value'], 'series_id', series_id)
+    df['metric'] = fetcher.constant_categorical('value', len(df))
+    return df
+
+
+def test_log_collection_summary_keeps_categorical_columns():
+    fetcher = _StubFetcher("stub")
+    frames = [_series(fetcher, 'GDP', [1.0, 2.0]), _series(fetcher, 'UNRATE', [3.0]), _series(fetcher, 'CPI', [4.0, 5.0])]
+    
+    combined = fetcher.log_collection_summary(frames, total_symbols=3)
+    
+    assert combined['series_id'].dtype == 'category'
+    assert combined['metric'].dtype == 'category'
+    assert combined['series_id'].astype(str).tolist() == ['GDP', 'GDP', 'UNRATE', 'CPI', 'CPI']
+    assert list(combined['series_id'].cat.categories) == ['GDP', 'UNRATE', 'CPI']
+    assert combined['value'].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    # The per-series inputs are left untouched
+    assert list(frames[1]['series_id'].cat.categories) == ['UNRATE']
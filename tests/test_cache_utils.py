@@ -0,0 +1,62 @@
+"""Tests for the day-scoped Parquet cache in src_pipeline.utils.cache_utils"""
+
+from datetime import date, timedelta
+
+import pandas as pd
+
+from src_pipeline.utils.cache_utils import ParquetCacheUtils
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame({'date': pd.to_datetime(['2024-01-31', '2024-02-29']), 'value': [1.0, 2.0]})
+
+
+def test_cache_path_is_prefixed_with_the_day(tmp_path):
+    cache = ParquetCacheUtils(cache_dir=str(tmp_path))
+    
+    path = cache.get_cache_path("https://example.com/file.xlsx", day=date(2024, 3, 5))
+    
+    assert path.parent == tmp_path
+    assert path.name.startswith("20240305_")
+    assert path.suffix == ".parquet"
+
+
+def test_get_or_build_removes_files_from_earlier_days(tmp_path):
+    cache = ParquetCacheUtils(cache_dir=str(tmp_path))
+    yesterday = date.today() - timedelta(days=1)
+    stale_paths = [
+        cache.get_cache_path("a", day=yesterday),
+        cache.get_cache_path("b", day=yesterday),
+        tmp_path / f"{'0' * 40}.parquet",
+    ]
+    for path in stale_paths:
+        _frame().to_parquet(path)
+    other_today = cache.get_cache_path("b")
+    _frame().to_parquet(other_today)
+    
+    cache.get_or_build("a", _frame)
+    
+    assert not any(path.exists() for path in stale_paths)
+    assert other_today.exists()
+    assert cache.get_cache_path("a").exists()
+
+
+def test_usda_fetch_batch_reuses_the_same_day_cache(tmp_path):
+    from src_pipeline.fetchers.fetch_usda import USDAFetcher
+    
+    fetcher = USDAFetcher(download_dir=str(tmp_path / "usda"))
+    fetcher.cache = ParquetCacheUtils(cache_dir=str(tmp_path / "cache"))
+    calls = []
+    
+    def build():
+        calls.append(1)
+        return _frame()
+    
+    fetcher.get_usda_ers_data = build
+    
+    first = fetcher.fetch_batch()
+    second = fetcher.fetch_batch()
+    
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(second, first)
+    assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
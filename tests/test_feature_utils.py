@@ -0,0 +1,47 @@
+"""Tests for the cached Savitzky-Golay filter in src_pipeline.features.feature_utils"""
+
+import numpy as np
+import polars as pl
+import pytest
+from scipy.signal import savgol_filter
+
+from src_pipeline.features.feature_utils import (
+    SAVGOL_OACONVOLVE_MIN_WINDOW,
+    apply_savgol_filter,
+)
+
+
+def _random_walk(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100.0 + np.cumsum(rng.normal(size=n))
+
+
+# 1200 points runs every window through the direct convolution; 6000 points is long
+# enough (>= 8 * window) for the 501 window to take the overlap-add FFT path
+@pytest.mark.parametrize("n", [1200, 6000])
+@pytest.mark.parametrize("window_length", [21, 201, 501])
+@pytest.mark.parametrize("deriv", [0, 1, 2])
+def test_apply_savgol_filter_matches_scipy_interp(n, window_length, deriv):
+    x = _random_walk(n)
+    expected = savgol_filter(x, window_length, 3, deriv=deriv, mode='interp')
+    
+    result = apply_savgol_filter(pl.Series("x", x), window_length=window_length, polyorder=3, deriv=deriv)
+    
+    assert result.name == "x"
+    assert result.dtype == pl.Float64
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-8, atol=1e-8)
+
+
+def test_oaconvolve_threshold_is_covered():
+    assert 201 < SAVGOL_OACONVOLVE_MIN_WINDOW <= 501
+
+
+def test_apply_savgol_filter_fills_nulls_before_filtering():
+    x = _random_walk(500)
+    s = pl.Series("x", x).scatter([0, 100, 101, 499], None)
+    filled = s.interpolate().fill_null(strategy="backward").fill_null(strategy="forward")
+    expected = savgol_filter(filled.to_numpy(), 21, 3, mode='interp')
+    
+    result = apply_savgol_filter(s, window_length=21, polyorder=3)
+    
+    np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-8, atol=1e-8)
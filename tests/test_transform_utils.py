@@ -0,0 +1,66 @@
+"""Tests for DataTransformUtils in src_pipeline.utils.transform_utils"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src_pipeline.utils.transform_utils import DataTransformUtils
+
+
+def _reference_long(df: pd.DataFrame, value_vars=None) -> pd.DataFrame:
+    """melt + to_numeric + dropna, the path wide_to_long_fast replaces"""
+    long_df = df.melt(id_vars=['date'], value_vars=value_vars, var_name='metric', value_name='value')
+    long_df['value'] = pd.to_numeric(long_df['value'], errors='coerce')
+    long_df = long_df.dropna(subset=['value'])
+    long_df['symbol'] = long_df['metric']
+    return long_df.reset_index(drop=True)
+
+
+@pytest.fixture
+def wide_df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 50
+    df = pd.DataFrame({
+        'date': pd.date_range('2020-01-01', periods=n, freq='D'),
+        'FLOAT': rng.normal(size=n),
+        'INT': rng.integers(0, 100, size=n),
+        'TEXT': rng.normal(size=n).round(3).astype(str),
+    })
+    df.loc[[3, 10], 'FLOAT'] = np.nan
+    df['TEXT'] = df['TEXT'].astype(object)
+    df.loc[[0, 7], 'TEXT'] = 'n/a'
+    return df
+
+
+@pytest.mark.parametrize("value_vars", [None, ['TEXT', 'FLOAT']])
+def test_wide_to_long_fast_matches_melt(wide_df, value_vars):
+    expected = _reference_long(wide_df, value_vars=value_vars)
+    
+    result = DataTransformUtils.wide_to_long_fast(wide_df, value_vars=value_vars)
+    
+    assert list(result.columns) == ['date', 'metric', 'value', 'symbol']
+    assert isinstance(result['metric'].dtype, pd.CategoricalDtype)
+    assert isinstance(result['symbol'].dtype, pd.CategoricalDtype)
+    pd.testing.assert_series_equal(result['date'], expected['date'], check_names=False)
+    assert result['metric'].astype(str).tolist() == expected['metric'].tolist()
+    assert result['symbol'].astype(str).tolist() == expected['symbol'].tolist()
+    np.testing.assert_array_equal(result['value'].to_numpy(), expected['value'].to_numpy(dtype=np.float64))
+
+
+def test_wide_to_long_fast_keeps_nan_without_dropna(wide_df):
+    result = DataTransformUtils.wide_to_long_fast(wide_df, dropna=False)
+    
+    assert len(result) == len(wide_df) * 3
+    assert result['value'].isna().sum() == 4
+
+
+def test_parse_date_cells_rejects_non_date_cells():
+    column = pd.Series([' 12/31/2024 ', datetime(2024, 9, 30), 'ACTUALS', 2024.0, 45000, None], dtype=object)
+    
+    parsed = DataTransformUtils.parse_date_cells(column)
+    
+    assert parsed.notna().tolist() == [True, True, False, False, False, False]
+    assert parsed[0] == pd.Timestamp('2024-12-31')
+    assert parsed[1] == pd.Timestamp('2024-09-30')